@@ -12,8 +12,12 @@ I/O and graphics submodules are available from
 ``acoustics.io`` and  ``acoustics.graphics``, respectively.
 The base functions are intended to be used on top of the I/O submodule, and 
 include functionality to calibrate data, create spectral densities, sound 
-pressure levels, and time or band aggregate spectral data.
+pressure levels, and time or band aggregate spectral data. Long deployments
+spread over many files are processed with ``acoustics.process_files`` and
+summarized with ``acoustics.SpectralProbabilityDensity``, from the batch
+submodule.
 """
 
 from mhkit.acoustics import io, graphics
 from .analysis import *
+from .batch import SpectralProbabilityDensity, process_files
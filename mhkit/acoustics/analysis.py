@@ -52,15 +52,30 @@ The following functionality is provided:
 
    - `third_octave_sound_pressure_level` and `decidecade_sound_pressure_level`:
      Compute sound pressure levels across third-octave and decidecade bands, respectively.
+
+The band and time aggregation functions are built on the binning functions in
+`mhkit.acoustics.binning`. Streaming statistics and multi-file processing of
+long deployments are provided by `mhkit.acoustics.batch`.
 """
 
-from typing import Union, Dict, Tuple, Optional
+from typing import Union, Dict, Tuple
+from functools import lru_cache
 import warnings
 import numpy as np
 import xarray as xr
 
 from mhkit.dolfyn import VelBinner
 from mhkit.dolfyn.time import epoch2dt64, dt642epoch
+from .binning import (
+    _validate_method,
+    _OctaveBands,
+    _octave_bands,
+    _band_operator,
+    _apply_band_operator,
+    _band_operator_aggregate,
+    _window_aggregate,
+    _groupby_aggregate,
+)
 
 
 def _fmax_warning(
@@ -220,29 +235,121 @@ def sound_pressure_spectral_density(
     return out
 
 
+@lru_cache(maxsize=32)
+def _cached_calibration(
+    calibration: Tuple[bytes, bytes, bytes, Tuple[int, ...]],
+    freq_bytes: bytes,
+    level: bool,
+) -> np.ndarray:
+    """
+    Cached implementation of `_calibration_operator`, keyed on the raw bytes
+    of its inputs. `calibration` holds the bytes of the sensitivity curve,
+    of its frequencies and of the fill value, and the shape of the fill value.
+    """
+
+    curve_bytes, curve_freq_bytes, fill_bytes, fill_shape = calibration
+    curve = xr.DataArray(
+        np.frombuffer(curve_bytes, dtype=np.float64),
+        coords={"freq": np.frombuffer(curve_freq_bytes, dtype=np.float64)},
+        dims=["freq"],
+    )
+    freq = np.frombuffer(freq_bytes, dtype=np.float64)
+    fill_value = np.frombuffer(fill_bytes, dtype=np.float64).reshape(fill_shape)
+
+    # Interpolate calibration curve to desired value
+    calibration = curve.interp({"freq": freq}, method="linear")
+    # Fill missing with provided value
+    calibration = calibration.fillna(fill_value).values
+
+    if level:
+        # Subtract sensitivity and convert from V^2/uPa^2 to V^2/Pa^2 in dB
+        operator = -calibration - 120
+    else:
+        sensitivity_ratio = 10 ** (calibration / 10)  # V^2/uPa^2
+        operator = 1 / (sensitivity_ratio * 1e12)
+    operator.flags.writeable = False
+
+    return operator
+
+
+def _calibration_operator(
+    sensitivity_curve: xr.DataArray,
+    freq: np.ndarray,
+    fill_value: Union[float, int, np.ndarray],
+    level: bool = False,
+) -> np.ndarray:
+    """
+    Returns the calibration vector that converts spectral densities on the
+    frequency grid `freq` from V^2/Hz to Pa^2/Hz. Vectors are cached for
+    repeated calls with the same curve, frequency grid and fill value.
+
+    Parameters
+    ----------
+    sensitivity_curve: xarray.DataArray (freq)
+        Calibrated sensitivity curve in units of dB rel 1 V^2/uPa^2, with
+        'freq' as its dimension.
+    freq: numpy.ndarray
+        Frequency grid of the spectral densities in Hz.
+    fill_value: float, int or numpy.ndarray
+        Value with which to fill missing values from the calibration curve,
+        in units of dB rel 1 V^2/uPa^2.
+    level: bool
+        If True, returns an offset to add to spectral density levels in dB.
+        If False, returns a factor to multiply spectral densities by.
+        Default: False.
+
+    Returns
+    -------
+    operator: numpy.ndarray (freq)
+        Read-only calibration factor or offset.
+    """
+
+    def as_bytes(x):
+        return np.ascontiguousarray(x, dtype=np.float64).tobytes()
+
+    calibration = (
+        as_bytes(sensitivity_curve.values),
+        as_bytes(sensitivity_curve["freq"].values),
+        as_bytes(fill_value),
+        np.shape(fill_value),
+    )
+
+    return _cached_calibration(calibration, as_bytes(freq), level)
+
+
 def apply_calibration(
     spsd: xr.DataArray,
     sensitivity_curve: xr.DataArray,
     fill_value: Union[float, int, np.ndarray],
+    inplace: bool = False,
 ) -> xr.DataArray:
     """
     Applies custom calibration to spectral density values.
 
+    The calibration is interpolated onto the frequency grid once and cached,
+    so that calibrating many blocks of spectra on the same frequency grid only
+    costs a single broadcast multiplication (or addition, for levels) each.
+
     Parameters
     ----------
     spsd: xarray.DataArray (time, freq)
-        Mean square sound pressure spectral density in V^2/Hz.
+        Mean square sound pressure spectral density in V^2/Hz, or spectral
+        density level in dB (if its 'units' attribute starts with 'dB').
     sensitivity_curve: xarray.DataArray (freq)
         Calibrated sensitivity curve in units of dB rel 1 V^2/uPa^2.
         First column should be frequency, second column should be calibration values.
     fill_value: float or int
         Value with which to fill missing values from the calibration curve,
         in units of dB rel 1 V^2/uPa^2.
+    inplace: bool
+        If True, the values of `spsd` are calibrated in place rather than
+        copied. Default: False.
 
     Returns
     -------
     spsd_calibrated: xarray.DataArray (time, freq)
-        Spectral density in Pa^2/Hz, indexed by time and frequency.
+        Spectral density in Pa^2/Hz, or spectral density level in
+        dB re 1 uPa^2/Hz, indexed by time and frequency.
     """
 
     if not isinstance(spsd, xr.DataArray):
@@ -251,6 +358,8 @@ def apply_calibration(
         raise TypeError("'sensitivity_curve' must be an xarray.DataArray.")
     if not isinstance(fill_value, (int, float, np.ndarray)):
         raise TypeError("'fill_value' must be a numeric type (int or float).")
+    if not isinstance(inplace, bool):
+        raise TypeError("'inplace' must be a boolean value.")
 
     # Ensure 'freq' dimension exists in 'spsd'
     if "freq" not in spsd.dims:
@@ -277,25 +386,40 @@ def apply_calibration(
             {sensitivity_curve.dims[0]: "freq"}
         )
 
-    # Create a copy of spsd to avoid in-place modification
-    spsd_calibrated = spsd.copy(deep=True)
-    attrs = spsd.attrs  # recover attrs
-
-    # Read calibration curve
-    freq = sensitivity_curve.dims[0]
-    # Interpolate calibration curve to desired value
-    calibration = sensitivity_curve.interp(
-        {freq: spsd_calibrated["freq"]}, method="linear"
-    )
-    # Fill missing with provided value
-    calibration = calibration.fillna(fill_value)
-
-    # Subtract from sound pressure spectral density
-    sensitivity_ratio = 10 ** (calibration / 10)  # V^2/uPa^2
-    spsd_calibrated = spsd_calibrated / sensitivity_ratio / 1e12  # Pa^2/Hz
-    attrs.update(
-        {"long_name": "Calibrated Sound Pressure Spectral Density", "units": "Pa^2/Hz"}
+    level = str(spsd.attrs.get("units", "")).startswith("dB")
+    operator = _calibration_operator(
+        sensitivity_curve, spsd["freq"].values, fill_value, level
     )
+    # Broadcast along the 'freq' axis
+    shape = [1] * spsd.ndim
+    shape[spsd.get_axis_num("freq")] = -1
+    operator = operator.reshape(shape)
+    ufunc = np.add if level else np.multiply
+
+    if inplace:
+        spsd_calibrated = spsd
+        ufunc(spsd.values, operator, out=spsd.values, casting="same_kind")
+    else:
+        # Keep single precision levels in single precision
+        out = np.empty(spsd.shape, dtype=np.result_type(spsd.dtype, np.float32))
+        ufunc(spsd.values, operator, out=out, casting="same_kind")
+        spsd_calibrated = spsd.copy(data=out)
+
+    attrs = dict(spsd.attrs)  # recover attrs
+    if level:
+        attrs.update(
+            {
+                "long_name": "Calibrated Sound Pressure Spectral Density Level",
+                "units": "dB re 1 uPa^2/Hz",
+            }
+        )
+    else:
+        attrs.update(
+            {
+                "long_name": "Calibrated Sound Pressure Spectral Density",
+                "units": "Pa^2/Hz",
+            }
+        )
     spsd_calibrated.attrs = attrs
 
     return spsd_calibrated
@@ -336,143 +460,6 @@ def sound_pressure_spectral_density_level(spsd: xr.DataArray) -> xr.DataArray:
     return spsdl
 
 
-def _validate_method(
-    method: Union[str, Dict[str, Union[float, int]]]
-) -> Tuple[str, Optional[Union[float, int]]]:
-    """
-    Validates the 'method' parameter and returns the method name and its argument (if any)
-    for an xarray.core.groupby.DataArrayGroupBy method.
-
-    Parameters
-    ----------
-    method : str or dict
-        The aggregation method to validate. It can be either:
-          - A string representing one of the supported methods without additional arguments,
-            e.g., 'mean', 'sum'.
-          - A dictionary with a single key-value pair where the key is the method name and
-            the value is its argument, e.g., {'quantile': 0.25}.
-
-        Supported methods are:
-          - 'all'
-          - 'any'
-          - 'assign_coords' (requires coordinate argument)
-          - 'count'
-          - 'cumprod'
-          - 'fillna'
-          - 'first'
-          - 'last'
-          - 'map' (requires custom function argument)
-          - 'max'
-          - 'mean'
-          - 'median'
-          - 'min'
-          - 'prod'
-          - 'quantile' (requires a quantile between 0 and 1)
-          - 'reduce' (requires custom function argument)
-          - 'std'
-          - 'sum'
-          - 'var'
-          - 'where' (requires condition argument)
-
-    Returns
-    -------
-    method_name : str
-        The validated method name in lowercase.
-    method_arg : float, int, or None
-        The argument associated with the method, if applicable; otherwise, None.
-
-    Raises
-    ------
-    ValueError
-        - If the method name is not supported.
-        - If the 'quantile' method is provided without an argument or with an invalid argument.
-        - If the 'method' dictionary does not contain exactly one key-value pair.
-        - If 'method' is of an unsupported type.
-    TypeError
-        - If the key in the 'method' dictionary is not a string.
-
-    Examples
-    --------
-    >>> _validate_method('mean')
-    ('mean', None)
-
-    >>> _validate_method({'quantile': 0.75})
-    ('quantile', 0.75)
-
-    >>> _validate_method('quantile')
-    ValueError: The 'quantile' method must be provided as a dictionary with the quantile value,
-        e.g., {'quantile': 0.25}.
-
-    >>> _validate_method({'quantile': 1.5})
-    ValueError: The 'quantile' method must have a float between 0 and 1 as an argument.
-
-    >>> _validate_method({'unsupported_method': None})
-    ValueError: Method 'unsupported_method' is not supported.
-        Supported methods are:
-        ['median', 'mean', 'min', 'max', 'sum', 'quantile', 'std', 'var', 'count']
-    """
-
-    allowed_methods = [
-        "all",
-        "any",
-        "assign_coords",
-        "count",
-        "cumsum",
-        "fillna",
-        "first",
-        "last",
-        "map",
-        "max",
-        "mean",
-        "median",
-        "min",
-        "prod",
-        "quantile",
-        "reduce",
-        "sum",
-        "std",
-        "sum",
-        "var",
-        "where",
-    ]
-
-    if isinstance(method, str):
-        method_name = method.lower()
-        if method_name not in allowed_methods:
-            raise ValueError(
-                f"Method '{method}' is not supported. Supported methods are: {allowed_methods}"
-            )
-        if method_name == "quantile":
-            raise ValueError(
-                "The 'quantile' method must be provided as a dictionary with "
-                "the quantile value, e.g., {'quantile': 0.25}."
-            )
-        method_arg = None
-    elif isinstance(method, dict):
-        if len(method) != 1:
-            raise ValueError(
-                "'method' dictionary must contain exactly one key-value pair."
-            )
-        method_name, method_arg = list(method.items())[0]
-        if not isinstance(method_name, str):
-            raise TypeError("Key in 'method' dictionary must be a string.")
-        method_name = method_name.lower()
-        if method_name not in allowed_methods:
-            raise ValueError(
-                f"Method '{method_name}' is not supported. Supported methods are: {allowed_methods}"
-            )
-        if method_name == "quantile":
-            if not isinstance(method_arg, (float, int)) or not 0 <= method_arg <= 1:
-                raise ValueError(
-                    "The 'quantile' method must have a float between 0 and 1 as an argument."
-                )
-    else:
-        raise ValueError(
-            f"Unsupported method type: {type(method)}. Must be a string or dictionary."
-        )
-    return method_name, method_arg
-
-
 def band_aggregate(
     spsdl: xr.DataArray,
     octave: int = 3,
@@ -497,6 +484,10 @@ def band_aggregate(
     method: str or dict
         Method to run on the binned data. Can be a string (e.g., "median") or a dict
         where the key is the method and the value is its argument (e.g., {"quantile": 0.25}).
+        Only quantiles can be combined: a list of quantiles (e.g.,
+        {"quantile": [0.05, 0.5, 0.95]}, where 0.5 is the median) is computed in
+        one pass and adds a 'quantile' dimension. Other statistics are computed
+        one per call.
         Options: [median, mean, min, max, sum, quantile, std, var, count]
 
     Returns
@@ -531,33 +522,18 @@ def band_aggregate(
     fn = spsdl["freq"].max().values
     fmax = _fmax_warning(fn, fmax)
 
-    bandwidth = 2 ** (1 / octave)
-    half_bandwidth = 2 ** (1 / (octave * 2))
+    bands = _OctaveBands(2 ** (1 / octave), 2 ** (1 / (octave * 2)), fmin, fmax)
 
-    band = {}
-    band["center_freq"] = 10 ** np.arange(
-        np.log10(fmin),
-        np.log10(fmax * bandwidth),
-        step=np.log10(bandwidth),
-    )
-    band["lower_limit"] = band["center_freq"] / half_bandwidth
-    band["upper_limit"] = band["center_freq"] * half_bandwidth
-    octave_bins = np.append(band["lower_limit"], band["upper_limit"][-1])
-
-    # Use xarray binning methods
-    spsdl_group = spsdl.groupby_bins("freq", octave_bins, labels=band["center_freq"])
-
-    # Handle method being a string or a dict
-    if isinstance(method, str):
-        func = getattr(spsdl_group, method.lower())
-        out = func()
+    if (method_name in ["mean", "sum"]) and not spsdl.isnull().any():
+        # Sum or average the bands with the sparse band operator
+        out = _band_operator_aggregate(spsdl, bands, method_name)
     else:
-        method_name, method_arg = list(method.items())[0]
-        func = getattr(spsdl_group, method_name.lower())
-        if isinstance(method_arg, (list, tuple)):
-            out = func(*method_arg)
-        else:
-            out = func(method_arg)
+        center_freq, octave_bins = _octave_bands(bands)
+        bins = (octave_bins, center_freq)
+        out = _window_aggregate(spsdl, "freq", bins, (method_name, method_arg))
+        if out is None:
+            # Use xarray binning methods
+            out = _groupby_aggregate(spsdl, "freq", bins, method)
 
     # Update attributes
     out.attrs["units"] = spsdl.units
@@ -581,6 +557,10 @@ def time_aggregate(
     If the window length is equivalent to the size of spsdl["time"],
     this function is equivalent to spsdl.<method>("time")
 
+    When every window holds the same number of samples, the data are
+    reshaped into (window, sample, ...) and aggregated at once; otherwise
+    xarray's `groupby_bins` is used.
+
     Parameters
     ----------
     spsdl: xarray.DataArray (time, freq)
@@ -590,6 +570,10 @@ def time_aggregate(
     method: str or dict
         Method to run on the binned data. Can be a string (e.g., "median") or a dict
         where the key is the method and the value is its argument (e.g., {"quantile": 0.25}).
+        Only quantiles can be combined: a list of quantiles (e.g.,
+        {"quantile": [0.05, 0.5, 0.95]}, where 0.5 is the median) is computed in
+        one pass and adds a 'quantile' dimension. Other statistics are computed
+        one per call.
         Options: [median, mean, min, max, sum, quantile, std, var, count]
 
     Returns
@@ -630,20 +614,14 @@ def time_aggregate(
         0.5 * (dt642epoch(time_bins_lower) + dt642epoch(time_bins_upper))
     )
 
-    # Use xarray binning methods
-    spsdl_group = spsdl.groupby_bins("time", time_bins, labels=center_time)
-
-    # Handle method being a string or a dict
-    if isinstance(method, str):
-        func = getattr(spsdl_group, method.lower())
-        out = func()
-    else:
-        method_name, method_arg = list(method.items())[0]
-        func = getattr(spsdl_group, method_name.lower())
-        if isinstance(method_arg, (list, tuple)):
-            out = func(*method_arg)
-        else:
-            out = func(method_arg)
+    # Reshape into (time_bins, window, ...) if the windows are uniform
+    bins = (time_bins, center_time)
+    out = _window_aggregate(
+        spsdl, "time", bins, (method_name, method_arg), uniform_only=True
+    )
+    if out is None:
+        # Use xarray binning methods
+        out = _groupby_aggregate(spsdl, "time", bins, method)
 
     # Update attributes
     out.attrs["units"] = spsdl.units
@@ -795,28 +773,17 @@ def _band_sound_pressure_level(
     # Reference value of sound pressure
     reference = 1e-12  # Pa^2, = 1 uPa^2
 
-    band = {}
-    band["center_freq"] = 10 ** np.arange(
-        np.log10(fmin),
-        np.log10(fmax * bandwidth),
-        step=np.log10(bandwidth),
+    # Trapezoidal rule integration over each band, as one sparse matrix
+    # multiplication, to get Pa^2
+    center_freq, operator = _band_operator(
+        spsd["freq"].values, _OctaveBands(bandwidth, half_bandwidth, fmin, fmax)
     )
-    band["lower_limit"] = band["center_freq"] / half_bandwidth
-    band["upper_limit"] = band["center_freq"] * half_bandwidth
-    octave_bins = np.append(band["lower_limit"], band["upper_limit"][-1])
-
-    # Manual trapezoidal rule to get Pa^2
+    spsd_freq = spsd.transpose("time", "freq")
     pressure_squared = xr.DataArray(
-        coords={"time": spsd["time"], "freq_bins": band["center_freq"]},
+        _apply_band_operator(spsd_freq.values.astype(np.float64, copy=False), operator),
+        coords={"time": spsd["time"], "freq_bins": center_freq},
         dims=["time", "freq_bins"],
     )
-    for i, key in enumerate(band["center_freq"]):
-        band_min = octave_bins[i]
-        band_max = octave_bins[i + 1]
-        pressure_squared.loc[{"freq_bins": key}] = np.trapz(
-            spsd.sel(freq=slice(band_min, band_max)),
-            spsd["freq"].sel(freq=slice(band_min, band_max)),
-        )
 
     # Mean square sound pressure level in dB rel 1 uPa
     mspl = 10 * np.log10(pressure_squared / reference)
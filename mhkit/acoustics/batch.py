@@ -0,0 +1,654 @@
+"""
+This module provides tools to process long passive acoustics deployments,
+which are recorded in many files and may not fit in memory:
+
+1. **Spectral Probability Density**:
+
+   - `SpectralProbabilityDensity`: Streaming accumulator of per-frequency histograms
+     of spectral density levels, from which the spectral probability density,
+     percentiles and means of arbitrarily long deployments are computed.
+
+2. **Multi-File Processing**:
+
+   - `process_files`: Streams a list of hydrophone files through the spectral density,
+     calibration and band level calculations, optionally in parallel, appending the
+     results to an on-disk store so that long deployments never need to fit in memory.
+"""
+
+from typing import Union, Tuple, Optional, Callable, List, Iterable, Iterator
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from numbers import Real
+from pathlib import Path
+import warnings
+import numpy as np
+import xarray as xr
+
+from .analysis import (
+    sound_pressure_spectral_density,
+    apply_calibration,
+    _band_sound_pressure_level,
+)
+
+# Number of levels binned at a time by SpectralProbabilityDensity.update
+_BLOCK_SIZE = 2**20
+
+
+@dataclass(frozen=True)
+class _FileOptions:
+    """
+    Options of the spectral pipeline that `process_files` runs on each file.
+
+    Attributes
+    ----------
+    reader: callable
+        Function that reads a filename and returns sound pressure or voltage.
+    bin_length: int or float
+        Length of time in seconds to create FFTs.
+    block_length: int or float, optional
+        Length of time in seconds of the blocks each file is processed in.
+    calibration: tuple, optional
+        Sensitivity curve and fill value passed to `apply_calibration`.
+    bands: tuple
+        Octave, lower and upper frequency band limits of the band levels.
+    save_spsd: bool
+        If True, the spectral densities are returned with the band levels.
+    """
+
+    reader: Callable[[Union[str, Path]], xr.DataArray]
+    bin_length: Union[int, float]
+    block_length: Optional[Union[int, float]]
+    calibration: Optional[Tuple[xr.DataArray, Union[float, int, np.ndarray]]]
+    bands: Tuple[int, int, int]
+    save_spsd: bool
+
+
+def _process_block(
+    block: xr.DataArray, fs: int, options: _FileOptions, warn: bool
+) -> xr.Dataset:
+    """
+    Runs the spectral pipeline of `process_files` on a block of a file.
+
+    Returns
+    -------
+    ds: xarray.Dataset
+        Band sound pressure levels, and spectral densities if
+        `options.save_spsd`, indexed by time.
+    """
+
+    # Only this block is read into memory, if the reader returns dask arrays
+    spsd = sound_pressure_spectral_density(block.compute(), fs, options.bin_length)
+    if options.calibration is not None:
+        spsd = apply_calibration(spsd, *options.calibration, inplace=True)
+
+    octave, fmin, fmax = options.bands
+    with warnings.catch_warnings():
+        if not warn:
+            warnings.simplefilter("ignore")
+        mspl = _band_sound_pressure_level(
+            spsd, 2 ** (1 / octave), 2 ** (1 / (octave * 2)), fmin, fmax
+        )
+    mspl = mspl.astype(np.float32)
+    mspl.attrs = {
+        "units": "dB re 1 uPa",
+        "long_name": f"1/{octave} Octave Sound Pressure Level",
+    }
+
+    ds = xr.Dataset({"band_spl": mspl})
+    if options.save_spsd:
+        ds["spsd"] = spsd
+
+    return ds
+
+
+def _process_file(
+    filename: Union[str, Path], options: _FileOptions
+) -> Optional[xr.Dataset]:
+    """
+    Runs the spectral pipeline of `process_files` on a single file, one
+    block of `options.block_length` seconds at a time.
+
+    Returns
+    -------
+    out: xarray.Dataset or None
+        Band sound pressure levels, and spectral densities if
+        `options.save_spsd`, indexed by time. None if the file is shorter
+        than `options.bin_length`.
+    """
+
+    pressure = options.reader(filename)
+    fs = pressure.attrs["fs"]
+    nbin = int(options.bin_length * fs)
+    if options.block_length is None:
+        nblock = pressure.sizes["time"]
+    else:
+        nblock = int(options.block_length * fs)
+
+    blocks = []
+    for i in range(0, pressure.sizes["time"], nblock):
+        block = pressure.isel(time=slice(i, i + nblock))
+        if block.sizes["time"] >= nbin:
+            # Only warn about fmax once per file
+            blocks.append(_process_block(block, fs, options, warn=not blocks))
+
+    if not blocks:
+        return None
+    out = xr.concat(blocks, dim="time")
+    out.attrs = {"fs": fs, "filename": str(filename)}
+
+    return out
+
+
+def _map_files(
+    worker: Callable[[Union[str, Path]], Optional[xr.Dataset]],
+    filenames: Iterable[Union[str, Path]],
+    n_workers: int,
+) -> Iterator[Optional[xr.Dataset]]:
+    """
+    Yields the results of `worker` for each file, in order. If `n_workers`
+    is greater than 1, the files are processed in a process pool.
+    """
+
+    if n_workers == 1:
+        for fname in filenames:
+            yield worker(fname)
+        return
+
+    # Limit the number of files in flight so results don't pile up
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = deque()
+        for fname in filenames:
+            futures.append(pool.submit(worker, fname))
+            if len(futures) >= 2 * n_workers:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+
+
+def _collect(
+    results: Iterable[Optional[xr.Dataset]], output: Optional[Union[str, Path]]
+) -> xr.Dataset:
+    """
+    Concatenates the results of `_process_file` in memory, or appends them
+    to the Zarr store `output` as they arrive, skipping files that were too
+    short to process.
+    """
+
+    in_memory = []
+    n_written = 0
+    for ds in results:
+        if ds is None:
+            continue
+        if output is None:
+            in_memory.append(ds)
+            continue
+        # Only keep track of the files written to the store
+        del ds.attrs["filename"]
+        if n_written == 0:
+            ds.to_zarr(
+                output,
+                mode="w",
+                encoding={"time": {"units": "nanoseconds since 1970-01-01"}},
+            )
+        else:
+            ds.to_zarr(output, mode="a", append_dim="time")
+        n_written += 1
+
+    if not (in_memory or n_written):
+        raise ValueError("No files were long enough to process.")
+    if output is not None:
+        return xr.open_zarr(output)
+
+    return xr.concat(in_memory, dim="time", combine_attrs="drop_conflicts")
+
+
+def process_files(  # pylint: disable=too-many-arguments
+    filenames: List[Union[str, Path]],
+    reader: Callable[[Union[str, Path]], xr.DataArray],
+    output: Optional[Union[str, Path]] = None,
+    *,
+    bin_length: Union[int, float] = 1,
+    block_length: Optional[Union[int, float]] = 60,
+    sensitivity_curve: Optional[xr.DataArray] = None,
+    fill_value: Optional[Union[float, int, np.ndarray]] = None,
+    octave: int = 10,
+    fmin: int = 10,
+    fmax: int = 100000,
+    save_spsd: bool = False,
+    n_workers: int = 1,
+) -> xr.Dataset:
+    """
+    Streams a list of hydrophone recordings through the spectral analysis
+    pipeline: sound pressure spectral density, calibration and fractional
+    octave band sound pressure levels. Files are processed independently,
+    in blocks of `block_length` seconds, and optionally in a process pool.
+    If `output` is given, each file's results are appended to a Zarr store as
+    they complete, so that the full deployment never has to be in memory.
+
+    Parameters
+    ----------
+    filenames: list of str or pathlib.Path
+        Hydrophone files to process, in chronological order.
+    reader: callable
+        Function that reads a filename and returns sound pressure [Pa] or
+        voltage [V] indexed by time, with the sampling rate in the 'fs'
+        attribute, e.g. ``functools.partial(io.read_soundtrap, sensitivity=-177)``.
+        Readers returning dask arrays (``chunks=...``) are read block by block.
+        Must be picklable if `n_workers` > 1.
+    output: str or pathlib.Path, optional
+        Zarr store to append results to. The store is overwritten if it
+        already exists. If None, the results are returned in memory. Default: None.
+    bin_length: int or float
+        Length of time in seconds to create FFTs. Default: 1.
+    block_length: int or float, optional
+        Length of time in seconds of the blocks each file is processed in.
+        Should be a multiple of `bin_length`. If None, each file is processed
+        at once. Default: 60.
+    sensitivity_curve: xarray.DataArray (freq), optional
+        Calibrated sensitivity curve in units of dB rel 1 V^2/uPa^2, applied with
+        `apply_calibration` if provided. Default: None.
+    fill_value: float or int, optional
+        Value with which to fill missing values from the calibration curve,
+        in units of dB rel 1 V^2/uPa^2. Required if `sensitivity_curve` is given.
+    octave: int
+        Octave to subdivide band levels by. Default: 10 (decidecade)
+    fmin: int
+        Lower frequency band limit (lower limit of the hydrophone). Default: 10 Hz
+    fmax: int
+        Upper frequency band limit (Nyquist frequency). Default: 100000 Hz
+    save_spsd: bool
+        If True, the (calibrated) spectral densities are saved alongside the
+        band levels. Default: False.
+    n_workers: int
+        Number of processes to read and analyze files with. Default: 1.
+
+    Returns
+    -------
+    out: xarray.Dataset (time, freq_bins)
+        Band sound pressure levels 'band_spl' [dB re 1 uPa], and spectral
+        densities 'spsd' if `save_spsd`. Lazily loaded from `output` if it
+        is provided.
+    """
+
+    # Type checks
+    if isinstance(filenames, (str, Path)):
+        filenames = [filenames]
+    if not isinstance(filenames, (list, tuple)):
+        raise TypeError("'filenames' must be a list of filenames.")
+    if not callable(reader):
+        raise TypeError("'reader' must be callable.")
+    if output is not None and not isinstance(output, (str, Path)):
+        raise TypeError("'output' must be a string or a pathlib.Path object.")
+    if not isinstance(bin_length, (int, float)):
+        raise TypeError("'bin_length' must be a numeric type (int or float).")
+    if block_length is not None and not isinstance(block_length, (int, float)):
+        raise TypeError("'block_length' must be a numeric type (int or float).")
+    if not isinstance(octave, int) or (octave <= 0):
+        raise TypeError("'octave' must be a positive integer.")
+    if not isinstance(n_workers, int) or (n_workers <= 0):
+        raise TypeError("'n_workers' must be a positive integer.")
+
+    # Value checks
+    if block_length is not None and block_length < bin_length:
+        raise ValueError("'block_length' must not be less than 'bin_length'.")
+    if sensitivity_curve is not None and fill_value is None:
+        raise ValueError("'fill_value' must be provided with 'sensitivity_curve'.")
+
+    options = _FileOptions(
+        reader=reader,
+        bin_length=bin_length,
+        block_length=block_length,
+        calibration=(
+            None if sensitivity_curve is None else (sensitivity_curve, fill_value)
+        ),
+        bands=(octave, fmin, fmax),
+        save_spsd=save_spsd,
+    )
+    worker = partial(_process_file, options=options)
+
+    return _collect(_map_files(worker, filenames, n_workers), output)
+
+
+class SpectralProbabilityDensity:
+    """
+    Streaming accumulator of sound pressure spectral density levels, which
+    keeps a histogram of levels in fixed dB bins for each frequency. Blocks of
+    spectra are added with `update`, and accumulators from separate processes
+    or files are combined with `merge` (or ``+``). Memory use is
+    O(freq x dB bins), regardless of the number of spectra.
+
+    Levels below `db_min` or above `db_max` are counted, but not binned.
+
+    Parameters
+    ----------
+    freq: array-like
+        Frequency grid of the spectra in Hz.
+    db_min: int or float
+        Lower limit of the level bins in dB. Default: 0.
+    db_max: int or float
+        Upper limit of the level bins in dB. Default: 200.
+    db_step: int or float
+        Width of the level bins in dB. Default: 1.
+
+    Examples
+    --------
+    >>> spd = SpectralProbabilityDensity(spsdl["freq"])
+    >>> for spsdl in blocks:
+    ...     spd.update(spsdl)
+    >>> percentiles = spd.quantile([0.05, 0.5, 0.95])
+    """
+
+    def __init__(
+        self,
+        freq: Union[np.ndarray, xr.DataArray, list],
+        db_min: Union[int, float] = 0,
+        db_max: Union[int, float] = 200,
+        db_step: Union[int, float] = 1,
+    ):
+        if not all(isinstance(x, Real) for x in [db_min, db_max, db_step]):
+            raise TypeError("'db_min', 'db_max' and 'db_step' must be numeric.")
+        if db_max <= db_min:
+            raise ValueError("'db_max' must be greater than 'db_min'.")
+        if db_step <= 0:
+            raise ValueError("'db_step' must be positive.")
+
+        self.freq = np.asarray(freq, dtype=np.float64)
+        if self.freq.ndim != 1:
+            raise ValueError("'freq' must be one-dimensional.")
+        self.db_min = db_min
+        self.db_step = db_step
+        self.n_bins = int(round((db_max - db_min) / db_step))
+
+        # The first and last columns count levels below and above the bins
+        self.counts = np.zeros((self.freq.size, self.n_bins + 2), dtype=np.int64)
+        # Sums of the levels, and of the mean square values, for means
+        self.level_sum = np.zeros(self.freq.size)
+        self.power_sum = np.zeros(self.freq.size)
+
+    @property
+    def db_max(self) -> Union[int, float]:
+        """Upper limit of the level bins in dB."""
+        return self.db_min + self.n_bins * self.db_step
+
+    @property
+    def level_edges(self) -> np.ndarray:
+        """Edges of the level bins in dB."""
+        return self.db_min + self.db_step * np.arange(self.n_bins + 1.0)
+
+    @property
+    def level(self) -> np.ndarray:
+        """Centers of the level bins in dB."""
+        return self.level_edges[:-1] + self.db_step / 2
+
+    @property
+    def n_spectra(self) -> np.ndarray:
+        """Number of levels accumulated at each frequency."""
+        return self.counts.sum(axis=1)
+
+    def update(self, spsdl: Union[xr.DataArray, np.ndarray]) -> None:
+        """
+        Adds a block of spectra to the accumulator. NaN levels are ignored.
+
+        Parameters
+        ----------
+        spsdl: xarray.DataArray (time, freq) or numpy.ndarray (..., freq)
+            Sound pressure spectral density level in dB re 1 uPa^2/Hz, on the
+            accumulator's frequency grid.
+        """
+
+        if isinstance(spsdl, xr.DataArray):
+            if "freq" not in spsdl.dims:
+                raise ValueError("'spsdl' must have 'freq' as a dimension.")
+            if not np.array_equal(spsdl["freq"].values, self.freq):
+                raise ValueError("'spsdl' frequencies do not match the accumulator.")
+            spsdl = spsdl.transpose(..., "freq").values
+        elif isinstance(spsdl, np.ndarray):
+            if spsdl.shape[-1] != self.freq.size:
+                raise ValueError("Last axis of 'spsdl' must match the frequency grid.")
+        else:
+            raise TypeError("'spsdl' must be an xarray.DataArray or numpy.ndarray.")
+
+        values = spsdl.reshape(-1, self.freq.size)
+        n_cols = self.n_bins + 3
+
+        # Bin blocks of about _BLOCK_SIZE levels, and histograms of about the
+        # same size, to bound temporary memory
+        n_freq = max(1, min(self.freq.size, _BLOCK_SIZE // n_cols))
+        n_rows = max(1, _BLOCK_SIZE // n_freq)
+        for j in range(0, self.freq.size, n_freq):
+            cols = slice(j, j + n_freq)
+            offset = n_cols * np.arange(values[:, cols].shape[1])
+            counts = np.zeros(offset.size * n_cols, dtype=np.int64)
+            for i in range(0, values.shape[0], n_rows):
+                block = values[i : i + n_rows, cols].astype(np.float64)
+
+                # Bin index of each level, with 0 and n_bins + 1 for out of range
+                # levels, and n_bins + 2 for NaN
+                index = (block - self.db_min) / self.db_step
+                np.floor(index, out=index)
+                np.clip(index, -1, self.n_bins, out=index)
+                index[np.isnan(index)] = self.n_bins + 1
+                index = index.astype(np.int64) + 1
+                index += offset
+                counts += np.bincount(index.ravel(), minlength=counts.size)
+
+                self.level_sum[cols] += np.nansum(block, axis=0)
+                np.multiply(block, np.log(10) / 10, out=block)
+                self.power_sum[cols] += np.nansum(np.exp(block, out=block), axis=0)
+
+            self.counts[cols] += counts.reshape(-1, n_cols)[:, :-1]
+
+    def _check_compatible(self, other: "SpectralProbabilityDensity") -> None:
+        if not isinstance(other, SpectralProbabilityDensity):
+            raise TypeError("Can only merge with a SpectralProbabilityDensity.")
+        if (
+            not np.array_equal(self.freq, other.freq)
+            or self.db_min != other.db_min
+            or self.db_step != other.db_step
+            or self.n_bins != other.n_bins
+        ):
+            raise ValueError("Frequency grids and level bins must match to merge.")
+
+    def merge(self, other: "SpectralProbabilityDensity") -> None:
+        """
+        Adds the counts of another accumulator, e.g. from another process,
+        to this one.
+
+        Parameters
+        ----------
+        other: SpectralProbabilityDensity
+            Accumulator with the same frequency grid and level bins.
+        """
+
+        self._check_compatible(other)
+        self.counts += other.counts
+        self.level_sum += other.level_sum
+        self.power_sum += other.power_sum
+
+    def __add__(self, other: "SpectralProbabilityDensity"):
+        self._check_compatible(other)
+        out = SpectralProbabilityDensity(
+            self.freq, self.db_min, self.db_max, self.db_step
+        )
+        out.merge(self)
+        out.merge(other)
+        return out
+
+    def probability_density(self) -> xr.DataArray:
+        """
+        Returns the spectral probability density, the empirical probability
+        density of levels at each frequency.
+
+        Returns
+        -------
+        spd: xarray.DataArray (freq, level)
+            Probability density [1/dB] indexed by frequency and level bin center.
+        """
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            density = self.counts[:, 1:-1] / (self.n_spectra[:, None] * self.db_step)
+
+        return xr.DataArray(
+            density,
+            coords={"freq": self.freq, "level": self.level},
+            dims=["freq", "level"],
+            attrs={
+                "units": "1/dB",
+                "long_name": "Spectral Probability Density",
+            },
+        )
+
+    def quantile(self, q: Union[float, List[float]]) -> xr.DataArray:
+        """
+        Returns empirical quantiles of the levels at each frequency, linearly
+        interpolated within level bins. Quantiles that fall below `db_min`
+        or above `db_max` are returned as `db_min` or `db_max`.
+
+        Parameters
+        ----------
+        q: float or list of floats
+            Quantile(s) between 0 and 1.
+
+        Returns
+        -------
+        out: xarray.DataArray (freq[, quantile])
+            Sound pressure spectral density level quantiles [dB re 1 uPa^2/Hz]
+        """
+
+        quantiles = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if np.any((quantiles < 0) | (quantiles > 1)):
+            raise ValueError("Quantiles must be between 0 and 1.")
+
+        n = self.n_spectra
+        cumulative = np.cumsum(self.counts, axis=1)
+        out = np.stack(
+            [self._quantile_level(cumulative, n * quantile) for quantile in quantiles],
+            axis=-1,
+        )
+        out[n == 0] = np.nan
+
+        attrs = {"units": "dB re 1 uPa^2/Hz", "long_name": "Spectral Density Level"}
+        if np.ndim(q) == 0:
+            return xr.DataArray(
+                out[:, 0],
+                coords={"freq": self.freq, "quantile": float(q)},
+                dims=["freq"],
+                attrs=attrs,
+            )
+        return xr.DataArray(
+            out,
+            coords={"freq": self.freq, "quantile": quantiles},
+            dims=["freq", "quantile"],
+            attrs=attrs,
+        )
+
+    def _quantile_level(self, cumulative: np.ndarray, target: np.ndarray) -> np.ndarray:
+        """
+        Returns the level at which the cumulative counts reach `target` at
+        each frequency, linearly interpolated within the level bin.
+        """
+
+        # First non-empty bin whose cumulative count reaches the target
+        index = np.argmax((cumulative >= target[:, None]) & (self.counts > 0), axis=1)
+        rows = np.arange(self.freq.size)
+        count = self.counts[rows, index]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fraction = (target - cumulative[rows, index] + count) / count
+        level = self.level_edges[np.clip(index - 1, 0, self.n_bins)]
+        level += np.clip(fraction, 0, 1) * self.db_step
+        level[index == 0] = self.db_min
+        level[index == self.n_bins + 1] = self.db_max
+
+        return level
+
+    def mean(self, linear: bool = False) -> xr.DataArray:
+        """
+        Returns the mean level at each frequency.
+
+        Parameters
+        ----------
+        linear: bool
+            If True, the levels are averaged as mean square values and
+            converted back to dB (RMS level). If False, the levels are
+            averaged in dB. Default: False.
+
+        Returns
+        -------
+        out: xarray.DataArray (freq)
+            Mean sound pressure spectral density level [dB re 1 uPa^2/Hz]
+        """
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if linear:
+                out = 10 * np.log10(self.power_sum / self.n_spectra)
+            else:
+                out = self.level_sum / self.n_spectra
+
+        return xr.DataArray(
+            out,
+            coords={"freq": self.freq},
+            dims=["freq"],
+            attrs={"units": "dB re 1 uPa^2/Hz", "long_name": "Spectral Density Level"},
+        )
+
+    def to_dataset(self) -> xr.Dataset:
+        """
+        Returns the state of the accumulator as a Dataset, which can be
+        saved with e.g. `to_netcdf` and restored with `from_dataset`.
+
+        Returns
+        -------
+        ds: xarray.Dataset
+            Histogram counts and sums, indexed by frequency and level.
+        """
+
+        return xr.Dataset(
+            {
+                "counts": (["freq", "level"], self.counts[:, 1:-1]),
+                "counts_below": (["freq"], self.counts[:, 0]),
+                "counts_above": (["freq"], self.counts[:, -1]),
+                "level_sum": (["freq"], self.level_sum),
+                "power_sum": (["freq"], self.power_sum),
+            },
+            coords={"freq": self.freq, "level": self.level},
+            attrs={
+                "db_min": self.db_min,
+                "db_max": self.db_max,
+                "db_step": self.db_step,
+            },
+        )
+
+    @classmethod
+    def from_dataset(cls, ds: xr.Dataset) -> "SpectralProbabilityDensity":
+        """
+        Restores an accumulator saved with `to_dataset`.
+
+        Parameters
+        ----------
+        ds: xarray.Dataset
+            Dataset returned by `to_dataset`.
+
+        Returns
+        -------
+        spd: SpectralProbabilityDensity
+            Restored accumulator.
+        """
+
+        if not isinstance(ds, xr.Dataset):
+            raise TypeError("'ds' must be an xarray.Dataset.")
+
+        out = cls(
+            ds["freq"].values,
+            ds.attrs["db_min"],
+            ds.attrs["db_max"],
+            ds.attrs["db_step"],
+        )
+        out.counts[:, 0] = ds["counts_below"].values
+        out.counts[:, 1:-1] = ds["counts"].transpose("freq", "level").values
+        out.counts[:, -1] = ds["counts_above"].values
+        out.level_sum[:] = ds["level_sum"].values
+        out.power_sum[:] = ds["power_sum"].values
+
+        return out
@@ -0,0 +1,584 @@
+"""
+This module contains the binning functions used by the passive acoustics
+analysis functions to aggregate spectral data into fractional octave bands
+and time windows:
+
+- `_validate_method`: Validates the aggregation method passed to
+  `band_aggregate` and `time_aggregate`.
+
+- `_octave_bands` and `_band_operator`: Edges of the fractional octave bands
+  defined by an `_OctaveBands` tuple, and cached sparse operators that
+  integrate, sum or average spectra into the bands.
+
+- `_window_aggregate`: Aggregates data sorted along a dimension into
+  contiguous bins with numpy, without xarray's `groupby_bins`.
+
+- `_groupby_aggregate`: Aggregates data into bins with `groupby_bins`, for
+  the data and methods `_window_aggregate` doesn't handle.
+"""
+
+from typing import Union, Dict, Tuple, Optional, List, NamedTuple
+from functools import lru_cache
+import numpy as np
+import xarray as xr
+from scipy import sparse
+
+
+def _validate_method(
+    method: Union[str, Dict[str, Union[float, int]]]
+) -> Tuple[str, Optional[Union[float, int]]]:
+    """
+    Validates the 'method' parameter and returns the method name and its argument (if any)
+    for an xarray.core.groupby.DataArrayGroupBy method.
+
+    Parameters
+    ----------
+    method : str or dict
+        The aggregation method to validate. It can be either:
+          - A string representing one of the supported methods without additional arguments,
+            e.g., 'mean', 'sum'.
+          - A dictionary with a single key-value pair where the key is the method name and
+            the value is its argument, e.g., {'quantile': 0.25}. Several quantiles can
+            be requested at once as a list, e.g., {'quantile': [0.05, 0.5, 0.95]}.
+
+        Supported methods are:
+          - 'all'
+          - 'any'
+          - 'assign_coords' (requires coordinate argument)
+          - 'count'
+          - 'cumprod'
+          - 'fillna'
+          - 'first'
+          - 'last'
+          - 'map' (requires custom function argument)
+          - 'max'
+          - 'mean'
+          - 'median'
+          - 'min'
+          - 'prod'
+          - 'quantile' (requires a quantile, or list of quantiles, between 0 and 1)
+          - 'reduce' (requires custom function argument)
+          - 'std'
+          - 'sum'
+          - 'var'
+          - 'where' (requires condition argument)
+
+    Returns
+    -------
+    method_name : str
+        The validated method name in lowercase.
+    method_arg : float, int, list, or None
+        The argument associated with the method, if applicable; otherwise, None.
+
+    Raises
+    ------
+    ValueError
+        - If the method name is not supported.
+        - If the 'quantile' method is provided without an argument or with an invalid argument.
+        - If the 'method' dictionary does not contain exactly one key-value pair.
+        - If 'method' is of an unsupported type.
+    TypeError
+        - If the key in the 'method' dictionary is not a string.
+
+    Examples
+    --------
+    >>> _validate_method('mean')
+    ('mean', None)
+
+    >>> _validate_method({'quantile': 0.75})
+    ('quantile', 0.75)
+
+    >>> _validate_method('quantile')
+    ValueError: The 'quantile' method must be provided as a dictionary with the quantile value,
+        e.g., {'quantile': 0.25}.
+
+    >>> _validate_method({'quantile': 1.5})
+    ValueError: The 'quantile' method must have a float between 0 and 1 as an argument.
+
+    >>> _validate_method({'unsupported_method': None})
+    ValueError: Method 'unsupported_method' is not supported.
+        Supported methods are:
+        ['median', 'mean', 'min', 'max', 'sum', 'quantile', 'std', 'var', 'count']
+    """
+
+    allowed_methods = [
+        "all",
+        "any",
+        "assign_coords",
+        "count",
+        "cumsum",
+        "fillna",
+        "first",
+        "last",
+        "map",
+        "max",
+        "mean",
+        "median",
+        "min",
+        "prod",
+        "quantile",
+        "reduce",
+        "sum",
+        "std",
+        "sum",
+        "var",
+        "where",
+    ]
+
+    if isinstance(method, str):
+        method_name = method.lower()
+        if method_name not in allowed_methods:
+            raise ValueError(
+                f"Method '{method}' is not supported. Supported methods are: {allowed_methods}"
+            )
+        if method_name == "quantile":
+            raise ValueError(
+                "The 'quantile' method must be provided as a dictionary with "
+                "the quantile value, e.g., {'quantile': 0.25}."
+            )
+        method_arg = None
+    elif isinstance(method, dict):
+        if len(method) != 1:
+            raise ValueError(
+                "'method' dictionary must contain exactly one key-value pair."
+            )
+        method_name, method_arg = list(method.items())[0]
+        if not isinstance(method_name, str):
+            raise TypeError("Key in 'method' dictionary must be a string.")
+        method_name = method_name.lower()
+        if method_name not in allowed_methods:
+            raise ValueError(
+                f"Method '{method_name}' is not supported. Supported methods are: {allowed_methods}"
+            )
+        if method_name == "quantile":
+            quantiles = (
+                method_arg if isinstance(method_arg, (list, tuple)) else [method_arg]
+            )
+            if not quantiles or not all(
+                isinstance(q, (float, int)) and 0 <= q <= 1 for q in quantiles
+            ):
+                raise ValueError(
+                    "The 'quantile' method must have a float between 0 and 1 as an argument."
+                )
+    else:
+        raise ValueError(
+            f"Unsupported method type: {type(method)}. Must be a string or dictionary."
+        )
+    return method_name, method_arg
+
+
+class _OctaveBands(NamedTuple):
+    """
+    Definition of a set of fractional octave bands.
+
+    Attributes
+    ----------
+    bandwidth : float
+        Ratio between the center frequencies of adjacent bands.
+    half_bandwidth : float
+        Ratio between a band's upper limit and its center frequency.
+    fmin : float
+        Center frequency of the lowest band.
+    fmax : float
+        Upper frequency band limit.
+    """
+
+    bandwidth: float
+    half_bandwidth: float
+    fmin: float
+    fmax: float
+
+
+def _octave_bands(bands: _OctaveBands) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the center frequencies and edges of fractional octave bands.
+
+    Parameters
+    ----------
+    bands : _OctaveBands
+        Band definition.
+
+    Returns
+    -------
+    center_freq : numpy.ndarray
+        Band center frequencies.
+    octave_bins : numpy.ndarray
+        Band edges, one longer than `center_freq`.
+    """
+
+    center_freq = 10 ** np.arange(
+        np.log10(bands.fmin),
+        np.log10(bands.fmax * bands.bandwidth),
+        step=np.log10(bands.bandwidth),
+    )
+    lower_limit = center_freq / bands.half_bandwidth
+    upper_limit = center_freq * bands.half_bandwidth
+    octave_bins = np.append(lower_limit, upper_limit[-1])
+
+    return center_freq, octave_bins
+
+
+def _band_weights(
+    freq: np.ndarray, lower: float, upper: float, method: str
+) -> Tuple[int, np.ndarray]:
+    """
+    Returns the index of the first frequency of a band on the frequency
+    grid `freq`, and the weights of the band's frequencies for `method`
+    (see `_band_operator`). The weights are empty if the band can't be
+    computed from the grid.
+    """
+
+    if method == "trapz":
+        # Closed interval [lower, upper], as selected by `.sel(freq=slice())`
+        start = np.searchsorted(freq, lower, side="left")
+        stop = np.searchsorted(freq, upper, side="right")
+        if stop - start < 2:
+            return start, np.array([])
+        # Trapezoidal rule weights
+        df = np.diff(freq[start:stop]) / 2
+        weights = np.zeros(stop - start)
+        weights[:-1] += df
+        weights[1:] += df
+    else:
+        # Half-open interval (lower, upper], as used by `groupby_bins`
+        start = np.searchsorted(freq, lower, side="right")
+        stop = np.searchsorted(freq, upper, side="right")
+        weights = np.ones(stop - start)
+        if method == "mean" and stop > start:
+            weights /= stop - start
+
+    return start, weights
+
+
+@lru_cache(maxsize=32)
+def _cached_band_operator(
+    freq_bytes: bytes, bands: _OctaveBands, method: str
+) -> Tuple[np.ndarray, sparse.csr_matrix]:
+    """
+    Cached implementation of `_band_operator`, keyed on the raw bytes
+    of the frequency grid.
+    """
+
+    freq = np.frombuffer(freq_bytes, dtype=np.float64)
+    center_freq, octave_bins = _octave_bands(bands)
+
+    rows, cols, weights = [np.array([], int)], [np.array([], int)], [np.array([])]
+    for i in range(len(center_freq)):
+        start, w = _band_weights(freq, octave_bins[i], octave_bins[i + 1], method)
+        rows.append(np.full(w.size, i))
+        cols.append(np.arange(start, start + w.size))
+        weights.append(w)
+
+    operator = sparse.csr_matrix(
+        (np.concatenate(weights), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(len(center_freq), len(freq)),
+    )
+    operator.data.flags.writeable = False
+
+    return center_freq, operator
+
+
+def _band_operator(
+    freq: np.ndarray, bands: _OctaveBands, method: str = "trapz"
+) -> Tuple[np.ndarray, sparse.csr_matrix]:
+    """
+    Returns a sparse matrix that integrates, sums or averages spectral values
+    on the frequency grid `freq` into fractional octave bands, so that the
+    band values for all times are computed in one pass. Operators
+    are cached for repeated calls with the same frequency grid and bands.
+
+    Parameters
+    ----------
+    freq : numpy.ndarray
+        Monotonically increasing frequency grid in Hz.
+    bands : _OctaveBands or tuple
+        Band definition (bandwidth, half_bandwidth, fmin, fmax).
+    method : str
+        'trapz' for trapezoidal integration over each closed band interval,
+        or 'sum' or 'mean' over the frequencies in each half-open band
+        interval (lower, upper]. Default: 'trapz'.
+
+    Returns
+    -------
+    center_freq : numpy.ndarray
+        Band center frequencies.
+    operator : scipy.sparse.csr_matrix (band, freq)
+        Band weights. Rows of bands containing no frequencies are empty.
+    """
+
+    if method not in ["trapz", "sum", "mean"]:
+        raise ValueError("'method' must be one of 'trapz', 'sum' or 'mean'.")
+
+    freq = np.ascontiguousarray(freq, dtype=np.float64)
+    bands = _OctaveBands(*(float(x) for x in bands))
+
+    return _cached_band_operator(freq.tobytes(), bands, method)
+
+
+def _apply_band_operator(values: np.ndarray, operator: sparse.csr_matrix) -> np.ndarray:
+    """
+    Applies a band operator along the last axis of `values`.
+
+    Each row of the operator spans a contiguous range of frequencies, so it
+    is applied as a dot product with a strided view of `values`. This is
+    equivalent to ``(operator @ values.T).T``, without the transposed copy
+    of `values` that scipy's sparse-dense product requires.
+
+    Parameters
+    ----------
+    values : numpy.ndarray (..., freq)
+        Spectral values.
+    operator : scipy.sparse.csr_matrix (band, freq)
+        Operator returned by `_band_operator`.
+
+    Returns
+    -------
+    out : numpy.ndarray (..., band)
+        Band values.
+    """
+
+    shape = values.shape
+    values = values.reshape(-1, shape[-1])
+    out = np.zeros((values.shape[0], operator.shape[0]))
+    for i in range(operator.shape[0]):
+        start, stop = operator.indptr[i], operator.indptr[i + 1]
+        if start == stop:
+            continue
+        first, last = operator.indices[start], operator.indices[stop - 1]
+        out[:, i] = values[:, first : last + 1] @ operator.data[start:stop]
+
+    return out.reshape(shape[:-1] + (operator.shape[0],))
+
+
+def _band_operator_aggregate(
+    data: xr.DataArray, bands: _OctaveBands, method: str
+) -> xr.DataArray:
+    """
+    Sums or averages `data` into fractional octave bands along 'freq' with
+    the sparse band operator, for data without NaNs.
+
+    Parameters
+    ----------
+    data: xarray.DataArray (..., freq)
+        Spectral values.
+    bands: _OctaveBands
+        Band definition.
+    method: str
+        'sum' or 'mean'.
+
+    Returns
+    -------
+    out: xarray.DataArray (..., freq_bins)
+        Band values, equivalent to those of `groupby_bins`.
+    """
+
+    center_freq, operator = _band_operator(data["freq"].values, bands, method)
+    data_freq = data.transpose(..., "freq")
+    values = _apply_band_operator(data_freq.values, operator)
+    # groupby_bins returns NaN for empty bands
+    values[..., np.diff(operator.indptr) == 0] = np.nan
+
+    return xr.DataArray(
+        values.astype(data.dtype),
+        coords={
+            **{k: v for k, v in data_freq.coords.items() if "freq" not in v.dims},
+            "freq_bins": center_freq,
+        },
+        dims=data_freq.dims[:-1] + ("freq_bins",),
+        attrs=data.attrs,
+    ).transpose(*[("freq_bins" if d == "freq" else d) for d in data.dims])
+
+
+def _quantile(
+    values: np.ndarray, axis: int, q: Union[float, List[float]]
+) -> np.ndarray:
+    """
+    Computes one or more quantiles along `axis` from a single partition,
+    with the quantile axis (if any) last, as returned by xarray.
+    """
+
+    # Float64 quantiles promote the result to float64, as in xarray
+    out = np.quantile(values, np.asarray(q, dtype=np.float64), axis=axis)
+    if np.ndim(q):
+        out = np.moveaxis(out, 0, -1)
+    return out
+
+
+# Aggregation methods with a numpy implementation, called as func(values, axis, arg)
+_AGGREGATIONS = {
+    "max": lambda values, axis, arg: np.max(values, axis=axis),
+    "mean": lambda values, axis, arg: np.mean(values, axis=axis),
+    "median": lambda values, axis, arg: np.median(values, axis=axis),
+    "min": lambda values, axis, arg: np.min(values, axis=axis),
+    "quantile": _quantile,
+    "std": lambda values, axis, arg: np.std(values, axis=axis),
+    "sum": lambda values, axis, arg: np.sum(values, axis=axis),
+    "var": lambda values, axis, arg: np.var(values, axis=axis),
+}
+
+
+def _uniform_aggregate(
+    values: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+    method: Tuple[str, Optional[Union[float, int, List[float]]]],
+) -> Optional[np.ndarray]:
+    """
+    Aggregates the slices ``values[starts[i]:stops[i]]`` along the first axis,
+    if they are all the same length apart from the last slice, which may be
+    shorter. The whole slices are reshaped to (n_bins, bin_length, ...) and
+    aggregated in a single call. Returns None if the slices aren't uniform.
+    """
+
+    func = _AGGREGATIONS[method[0]]
+    lengths = stops - starts
+    length = lengths[0]
+    if not (
+        length > 0 and np.all(lengths[:-1] == length) and 0 < lengths[-1] <= length
+    ):
+        return None
+
+    n_bins = len(lengths) if lengths[-1] == length else len(lengths) - 1
+    stop = starts[0] + n_bins * length
+    out = func(
+        values[starts[0] : stop].reshape((n_bins, length) + values.shape[1:]),
+        1,
+        method[1],
+    )
+    if n_bins < len(lengths):
+        # Shorter last bin
+        last = func(values[starts[-1] : stops[-1]], 0, method[1])
+        out = np.concatenate([out, last[None]])
+
+    return out
+
+
+def _loop_aggregate(
+    values: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+    method: Tuple[str, Optional[Union[float, int, List[float]]]],
+) -> np.ndarray:
+    """
+    Aggregates the slices ``values[starts[i]:stops[i]]`` along the first axis
+    one at a time. Empty slices are NaN, as in `groupby_bins`.
+    """
+
+    func = _AGGREGATIONS[method[0]]
+    n_quantiles = np.size(method[1]) if np.ndim(method[1]) else None
+
+    out = []
+    for start, stop in zip(starts, stops):
+        if start == stop:
+            shape = values.shape[1:] + ((n_quantiles,) if n_quantiles else ())
+            out.append(np.full(shape, np.nan))
+        else:
+            out.append(func(values[start:stop], 0, method[1]))
+
+    return np.stack(out).astype(func(values[:1], 0, method[1]).dtype)
+
+
+def _window_aggregate(
+    data: xr.DataArray,
+    dim: str,
+    bins: Tuple[np.ndarray, np.ndarray],
+    method: Tuple[str, Optional[Union[float, int, List[float]]]],
+    uniform_only: bool = False,
+) -> Optional[xr.DataArray]:
+    """
+    Fast equivalent of ``data.groupby_bins(dim, edges, labels=labels)`` followed
+    by an aggregation method, for data sorted along `dim`. Each bin is then a
+    contiguous slice of `data`. If all bins are the same length, the data are
+    reshaped to (n_bins, bin_length, ...) and aggregated in a single call,
+    otherwise each bin is aggregated in turn.
+
+    Parameters
+    ----------
+    data: xarray.DataArray
+        Data to aggregate.
+    dim: str
+        Dimension to bin along.
+    bins: tuple of numpy.ndarray
+        Bin edges and bin labels. Bins are closed on the right, as in
+        `groupby_bins`, and there is one label less than there are edges.
+    method: tuple
+        Aggregation method name and argument, as returned by `_validate_method`.
+    uniform_only: bool
+        If True, return None unless the bins are all the same length, apart
+        from the last bin, which may be shorter. Default: False.
+
+    Returns
+    -------
+    out: xarray.DataArray or None
+        Aggregated data indexed by '<dim>_bins', or None if there is no fast
+        path for this method or data, in which case `groupby_bins` should be used.
+    """
+
+    if method[0] not in _AGGREGATIONS:
+        return None
+    coord = data[dim].values
+    if np.any(coord[1:] < coord[:-1]) or data.isnull().any():
+        return None
+
+    starts = np.searchsorted(coord, bins[0][:-1], side="right")
+    stops = np.searchsorted(coord, bins[0][1:], side="right")
+
+    values = data.transpose(dim, ...).values
+    out = _uniform_aggregate(values, starts, stops, method)
+    if out is None:
+        if uniform_only:
+            return None
+        out = _loop_aggregate(values, starts, stops, method)
+
+    bin_dim = f"{dim}_bins"
+    dims = (bin_dim,) + tuple(d for d in data.dims if d != dim)
+    coords = {k: v for k, v in data.coords.items() if dim not in v.dims}
+    coords[bin_dim] = bins[1]
+    if method[0] == "quantile":
+        if np.ndim(method[1]):
+            dims += ("quantile",)
+        coords["quantile"] = method[1]
+
+    out = xr.DataArray(out, coords=coords, dims=dims, name=data.name, attrs=data.attrs)
+    order = [(bin_dim if d == dim else d) for d in data.dims]
+
+    return out.transpose(*order, ...)
+
+
+def _groupby_aggregate(
+    data: xr.DataArray,
+    dim: str,
+    bins: Tuple[np.ndarray, np.ndarray],
+    method: Union[str, Dict[str, Union[float, int]]],
+) -> xr.DataArray:
+    """
+    Aggregates `data` into `bins` along `dim` with xarray's `groupby_bins`,
+    calling the aggregation method by name.
+
+    Parameters
+    ----------
+    data: xarray.DataArray
+        Data to aggregate.
+    dim: str
+        Dimension to bin along.
+    bins: tuple of numpy.ndarray
+        Bin edges and bin labels.
+    method: str or dict
+        Aggregation method, or a dict of the method and its argument(s).
+
+    Returns
+    -------
+    out: xarray.DataArray
+        Aggregated data indexed by '<dim>_bins'.
+    """
+
+    group = data.groupby_bins(dim, bins[0], labels=bins[1])
+
+    # Handle method being a string or a dict
+    if isinstance(method, str):
+        return getattr(group, method.lower())()
+    method_name, method_arg = list(method.items())[0]
+    func = getattr(group, method_name.lower())
+    if isinstance(method_arg, (list, tuple)) and (method_name.lower() != "quantile"):
+        return func(*method_arg)
+    return func(method_arg)
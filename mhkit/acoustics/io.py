@@ -37,6 +37,11 @@ Functions Overview
 
    - `_calculate_voltage_and_time`: Converts raw WAV data into voltage values and 
      generates a time index based on the sampling frequency.
+
+Large recordings are memory-mapped rather than read into memory, and scaled
+to voltage in blocks. Passing ``chunks`` to the readers returns a dask-backed
+DataArray whose values and time coordinate are only computed on demand, and
+``dtype="float32"`` halves the memory footprint of the scaled output.
 """
 
 from typing import BinaryIO, Tuple, Dict, Union, Optional, Any
@@ -49,6 +54,14 @@ import pandas as pd
 import xarray as xr
 from scipy.io import wavfile
 
+try:
+    import dask.array as da
+except ImportError:  # dask is optional, and only needed to read lazily
+    da = None
+
+# Number of samples scaled at a time when reading a WAV file into memory
+_BLOCK_SIZE = 2**20
+
 
 def _read_wav_metadata(f: BinaryIO) -> dict:
     """
@@ -87,21 +100,299 @@ def _read_wav_metadata(f: BinaryIO) -> dict:
     header["bytes_per_sec"] = struct.unpack("<I", f.read(4))[0]
     header["block_align"] = struct.unpack("<H", f.read(2))[0]
     header["bits_per_sample"] = struct.unpack("<H", f.read(2))[0]
-    f.seek(f.tell() + fmt_size - 16)
+    if header["compression_code"] == 0xFFFE and fmt_size >= 40:
+        # WAVE_FORMAT_EXTENSIBLE: the format code is the start of the
+        # subformat GUID, after the extension size, valid bits and mask
+        f.seek(f.tell() + 8)
+        header["compression_code"] = struct.unpack("<H", f.read(2))[0]
+        f.seek(f.tell() + fmt_size - 26)
+    else:
+        f.seek(f.tell() + fmt_size - 16)
+
+    # Find the start of the data block, skipping any remaining chunks
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            raise EOFError("Unexpected end of file when searching for data chunk.")
+        chunk_key, chunk_size = struct.unpack("<4sI", chunk)
+        if chunk_key == b"data":
+            header["data_offset"] = f.tell()
+            header["data_size"] = chunk_size
+            break
+        f.seek(f.tell() + chunk_size + chunk_size % 2)
 
     return header
 
 
-def _calculate_voltage_and_time(
+def _memmap_wav(filename: Union[str, Path], header: dict) -> np.ndarray:
+    """
+    Memory-maps the sample block of a WAV file without reading it into memory.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        Input filename.
+    header : dict
+        WAV header returned by `_read_wav_metadata`.
+
+    Returns
+    -------
+    raw : numpy.memmap
+        Raw samples. 24-bit files are returned as an array of byte triplets
+        with a trailing dimension of 3, which `_decode_counts` unpacks.
+        Formats other than 16, 24 and 32-bit integer and 32-bit float
+        samples are read with `scipy.io.wavfile.read`.
+    """
+
+    sample_width = header["block_align"] // header["n_channels"]
+    if header["compression_code"] == 1 and sample_width == 3:
+        dtype = np.dtype("u1")
+        shape = (header["n_channels"], 3)
+    elif header["compression_code"] == 1 and sample_width in [2, 4]:
+        dtype = np.dtype(f"<i{sample_width}")
+        shape = (header["n_channels"],)
+    elif header["compression_code"] == 3 and sample_width == 4:
+        dtype = np.dtype("<f4")
+        shape = (header["n_channels"],)
+    else:
+        # Leave other formats to scipy, which memory-maps them if it can
+        return wavfile.read(filename, mmap=True)[1]
+
+    # Clip to the file size in case the data chunk size is not filled in
+    data_size = min(
+        header["data_size"], Path(filename).stat().st_size - header["data_offset"]
+    )
+    n_samples = data_size // header["block_align"]
+    raw = np.memmap(
+        filename,
+        dtype=dtype,
+        mode="r",
+        offset=header["data_offset"],
+        shape=(n_samples,) + shape,
+    )
+    if header["n_channels"] == 1:
+        raw = raw[:, 0]
+
+    return raw
+
+
+def _decode_counts(raw: np.ndarray) -> np.ndarray:
+    """
+    Returns the ADC counts of a block of raw WAV samples. 24-bit byte triplets
+    are left-justified into 32 bit integers, matching `scipy.io.wavfile`.
+
+    Parameters
+    ----------
+    raw : numpy.ndarray
+        Block of raw samples returned by `_memmap_wav`.
+
+    Returns
+    -------
+    counts : numpy.ndarray
+        ADC counts.
+    """
+
+    if raw.dtype != np.uint8:
+        return raw
+    counts = np.zeros(raw.shape[:-1] + (4,), dtype=np.uint8)
+    counts[..., 1:] = raw
+    return counts.view("<i4")[..., 0]
+
+
+def _counts_to_voltage(
+    raw: np.ndarray,
+    max_count: int,
+    peak_voltage: Union[int, float],
+    dtype: np.dtype,
+) -> np.ndarray:
+    """
+    Scales a block of raw WAV samples to voltage.
+
+    Parameters
+    ----------
+    raw : numpy.ndarray
+        Block of raw samples returned by `_memmap_wav`.
+    max_count : int
+        Maximum possible count value for the ADC bit depth.
+    peak_voltage : int or float
+        Peak voltage supplied to the analog-to-digital converter (ADC) in volts.
+    dtype : numpy.dtype
+        Floating point type of the returned voltage.
+
+    Returns
+    -------
+    voltage : numpy.ndarray
+        Voltage values of the block.
+    """
+
+    voltage = _decode_counts(raw).astype(dtype)
+    if max_count != 1:
+        voltage /= max_count
+    voltage *= peak_voltage
+    return voltage
+
+
+def _max_count(bits_per_sample: int, float_samples: bool = False) -> int:
+    """
+    Returns the maximum possible count value for the ADC bit depth.
+
+    Parameters
+    ----------
+    bits_per_sample : int
+        Number of bits per sample in the WAV file.
+    float_samples : bool
+        Whether the samples are floating point, which are already
+        normalized to full scale. Default: False.
+
+    Returns
+    -------
+    max_count : int
+        Maximum possible count value for the given bit depth, or 1 for
+        floating point samples.
+    """
+
+    if float_samples:
+        return 1
+    if bits_per_sample in [16, 32]:
+        return 2 ** (bits_per_sample - 1)
+    if bits_per_sample == 12:
+        return 2 ** (16 - 1) - 2**4  # 12 bit read in as 16 bit
+    if bits_per_sample == 24:
+        return 2 ** (32 - 1) - 2**8  # 24 bit read in as 32 bit
+    raise IOError(
+        f"Unknown how to read {bits_per_sample} bit ADC. Please notify MHKiT team."
+    )
+
+
+def _eager_voltage(
+    raw: np.ndarray,
+    max_count: int,
+    peak_voltage: Union[int, float],
+    dtype: np.dtype,
+) -> np.ndarray:
+    """
+    Scales raw WAV samples to voltage in blocks, so that memory-mapped data
+    is never fully copied into memory.
+
+    Parameters
+    ----------
+    raw : numpy.ndarray
+        Raw samples returned by `_memmap_wav`.
+    max_count : int
+        Maximum possible count value for the ADC bit depth.
+    peak_voltage : int or float
+        Peak voltage supplied to the analog-to-digital converter (ADC) in volts.
+    dtype : numpy.dtype
+        Floating point type of the returned voltage.
+
+    Returns
+    -------
+    voltage : numpy.ndarray
+        Voltage values.
+    """
+
+    shape = raw.shape[:-1] if raw.dtype == np.uint8 else raw.shape
+    voltage = np.empty(shape, dtype=dtype)
+    for i in range(0, raw.shape[0], _BLOCK_SIZE):
+        voltage[i : i + _BLOCK_SIZE] = _counts_to_voltage(
+            raw[i : i + _BLOCK_SIZE], max_count, peak_voltage, dtype
+        )
+    return voltage
+
+
+def _lazy_voltage(
+    raw: np.ndarray,
+    max_count: int,
+    peak_voltage: Union[int, float],
+    *,
+    dtype: np.dtype,
+    chunks: int,
+) -> Any:
+    """
+    Returns a dask array of the voltage of raw WAV samples, which are only
+    scaled chunk by chunk when computed.
+
+    Parameters
+    ----------
+    raw : numpy.ndarray
+        Raw samples returned by `_memmap_wav`.
+    max_count : int
+        Maximum possible count value for the ADC bit depth.
+    peak_voltage : int or float
+        Peak voltage supplied to the analog-to-digital converter (ADC) in volts.
+    dtype : numpy.dtype
+        Floating point type of the returned voltage.
+    chunks : int
+        Number of samples per chunk.
+
+    Returns
+    -------
+    voltage : dask.array.Array
+        Voltage values.
+    """
+
+    if da is None:
+        raise ImportError("Reading with 'chunks' requires dask.")
+
+    kwargs = {"drop_axis": raw.ndim - 1} if raw.dtype == np.uint8 else {}
+    return da.from_array(
+        raw, chunks=(chunks,) + raw.shape[1:], asarray=True
+    ).map_blocks(
+        _counts_to_voltage,
+        max_count,
+        peak_voltage,
+        dtype,
+        dtype=dtype,
+        **kwargs,
+    )
+
+
+def _lazy_time(start_time: Any, end_time: Any, n_samples: int, chunks: int) -> Any:
+    """
+    Returns a dask array of `n_samples` + 1 times evenly spaced from
+    `start_time` to `end_time`, equivalent to `pandas.date_range`.
+
+    Parameters
+    ----------
+    start_time : str or np.datetime64
+        Start time of the recording.
+    end_time : np.datetime64
+        End time of the recording.
+    n_samples : int
+        Number of samples in the recording.
+    chunks : int
+        Number of samples per chunk.
+
+    Returns
+    -------
+    time : dask.array.Array
+        Time of each sample, and of the end of the recording.
+    """
+
+    if da is None:
+        raise ImportError("Reading with 'chunks' requires dask.")
+
+    start_ns = pd.Timestamp(start_time).value
+    step_ns = (pd.Timestamp(end_time).value - start_ns) / n_samples
+    return (
+        (da.arange(n_samples + 1, chunks=chunks) * step_ns).astype("int64") + start_ns
+    ).astype("datetime64[ns]")
+
+
+def _calculate_voltage_and_time(  # pylint: disable=too-many-arguments
     fs: int,
     raw: np.ndarray,
     bits_per_sample: int,
     peak_voltage: Union[int, float],
     start_time: str,
+    *,
+    dtype: Union[str, np.dtype] = "float64",
+    chunks: Optional[int] = None,
 ) -> Tuple[np.ndarray, pd.DatetimeIndex, int]:
     """
     Normalizes the raw data from the WAV file to the appropriate voltage and
-    calculates the time array based on the sampling frequency.
+    calculates the time array based on the sampling frequency. The raw data
+    is scaled in blocks, so it may be a memory-mapped array.
 
     Parameters
     ----------
@@ -115,12 +406,18 @@ def _calculate_voltage_and_time(
         Peak voltage supplied to the analog-to-digital converter (ADC) in volts.
     start_time : str, np.datetime64
         Start time of the recording in ISO 8601 format (e.g., '2024-06-06T00:00:00').
+    dtype : str or numpy.dtype
+        Floating point type of the returned voltage. Default: 'float64'.
+    chunks : int, optional
+        If provided, the voltage and time are returned as dask arrays with
+        this many samples per chunk, and are only computed on demand.
+        Default: None.
 
     Returns
     -------
-    raw_voltage : numpy.ndarray
+    raw_voltage : numpy.ndarray or dask.array.Array
         Normalized voltage values corresponding to the raw audio data.
-    time : pandas.DatetimeIndex
+    time : pandas.DatetimeIndex or dask.array.Array
         Time index for the audio data based on the sample rate and start time.
     max_count : int
         Maximum possible count value for the given bit depth, used for normalization.
@@ -136,38 +433,40 @@ def _calculate_voltage_and_time(
         raise TypeError("'peak_voltage' must be numeric (int or float).")
     if not isinstance(start_time, (str, np.datetime64)):
         raise TypeError("'start_time' must be a string or np.datetime64.")
+    if np.dtype(dtype).kind != "f":
+        raise TypeError("'dtype' must be a floating point type.")
+    if chunks is not None and (not isinstance(chunks, int) or chunks < 1):
+        raise TypeError("'chunks' must be a positive integer or None.")
+
+    # Floating point samples are normalized to full scale
+    max_count = _max_count(bits_per_sample, raw.dtype.kind == "f")
 
     length = raw.shape[0] // fs  # length of recording in seconds
+    end_time = np.datetime64(start_time) + np.timedelta64(length * 1000, "ms")
 
-    if bits_per_sample in [16, 32]:
-        max_count = 2 ** (bits_per_sample - 1)
-    elif bits_per_sample == 12:
-        max_count = 2 ** (16 - 1) - 2**4  # 12 bit read in as 16 bit
-    elif bits_per_sample == 24:
-        max_count = 2 ** (32 - 1) - 2**8  # 24 bit read in as 32 bit
-    else:
-        raise IOError(
-            f"Unknown how to read {bits_per_sample} bit ADC."
-            "Please notify MHKiT team."
+    if chunks is not None:
+        # Normalize and scale each chunk when it is computed
+        raw_voltage = _lazy_voltage(
+            raw, max_count, peak_voltage, dtype=np.dtype(dtype), chunks=chunks
         )
+        time = _lazy_time(start_time, end_time, raw.shape[0], chunks)
+        return raw_voltage, time, max_count
 
-    # Normalize and then scale to peak voltage
-    # Use 64 bit float for decimal accuracy
-    raw_voltage = raw.astype(float) / max_count * peak_voltage
-
-    # Get time
-    end_time = np.datetime64(start_time) + np.timedelta64(length * 1000, "ms")
-    time = pd.date_range(start_time, end_time, raw.size + 1)
+    raw_voltage = _eager_voltage(raw, max_count, peak_voltage, np.dtype(dtype))
+    time = pd.date_range(start_time, end_time, raw.shape[0] + 1)
 
     return raw_voltage, time, max_count
 
 
-def read_hydrophone(
+def read_hydrophone(  # pylint: disable=too-many-arguments
     filename: Union[str, Path],
     peak_voltage: Union[int, float],
     sensitivity: Optional[Union[int, float]] = None,
     gain: Union[int, float] = 0,
     start_time: str = "2024-01-01T00:00:00",
+    *,
+    dtype: Union[str, np.dtype] = "float64",
+    chunks: Optional[int] = None,
 ) -> xr.DataArray:
     """
     Read .wav file from a hydrophone. Returns voltage timeseries if sensitivity not
@@ -187,10 +486,18 @@ def read_hydrophone(
         Amplifier gain in dB re 1 V/uPa. Default 0.
     start_time: str
         Start time in the format yyyy-mm-ddTHH:MM:SS
+    dtype: str or numpy.dtype
+        Floating point type of the output. 'float32' halves the memory
+        footprint. Default: 'float64'.
+    chunks: int, optional
+        Number of samples per chunk. If provided, returns a dask-backed
+        DataArray that is scaled chunk by chunk when computed. The time
+        coordinate is then also computed on demand, and is not indexed.
+        Requires dask. Default: None.
 
     Returns
     -------
-    out: numpy.array
+    out: xarray.DataArray
         Sound pressure [Pa] or Voltage [V] indexed by time[s]
     """
 
@@ -214,13 +521,23 @@ def read_hydrophone(
     with open(filename, "rb") as f:
         header = _read_wav_metadata(f)
 
-    # Read data using scipy (will auto drop as int16 or int32)
-    fs, raw = wavfile.read(filename)
-
-    # Calculate raw voltage and time array
+    # Calculate raw voltage and time array, memory-mapping the data
+    # rather than reading it into memory
+    fs = header["sample_rate"]
     raw_voltage, time, max_count = _calculate_voltage_and_time(
-        fs, raw, header["bits_per_sample"], peak_voltage, start_time
+        fs,
+        _memmap_wav(filename, header),
+        header["bits_per_sample"],
+        peak_voltage,
+        start_time,
+        dtype=dtype,
+        chunks=chunks,
     )
+    if chunks is None:
+        coords = {"time": time[:-1]}
+    else:
+        # Don't build an index, which would compute the time array
+        coords = xr.Coordinates({"time": ("time", time[:-1])}, indexes={})
 
     # If sensitivity is provided, convert to sound pressure
     if sensitivity is not None:
@@ -231,13 +548,14 @@ def read_hydrophone(
         # Convert calibration from dB rel 1 V/uPa into ratio
         sensitivity = 10 ** (sensitivity / 20)  # V/uPa
 
-        # Sound pressure
-        pressure = raw_voltage / sensitivity  # uPa
-        pressure = pressure / 1e6  # Pa
+        # Sound pressure, scaled in place to avoid copying large arrays
+        raw_voltage /= sensitivity  # uPa
+        raw_voltage /= 1e6  # Pa
 
         out = xr.DataArray(
-            pressure,
-            coords={"time": time[:-1]},
+            raw_voltage,
+            coords=coords,
+            dims="time",
             attrs={
                 "units": "Pa",
                 "sensitivity": np.round(sensitivity, 12),
@@ -254,7 +572,8 @@ def read_hydrophone(
     else:
         out = xr.DataArray(
             raw_voltage,
-            coords={"time": time[:-1]},
+            coords=coords,
+            dims="time",
             attrs={
                 "units": "V",
                 # Voltage min resolution
@@ -268,6 +587,9 @@ def read_hydrophone(
             },
         )
 
+    # dask arrays otherwise lend the DataArray their name
+    out.name = None
+
     return out
 
 
@@ -275,6 +597,9 @@ def read_soundtrap(
     filename: str,
     sensitivity: Optional[Union[int, float]] = None,
     gain: Union[int, float] = 0,
+    *,
+    dtype: Union[str, np.dtype] = "float64",
+    chunks: Optional[int] = None,
 ) -> xr.DataArray:
     """
     Read .wav file from an Ocean Instruments SoundTrap hydrophone.
@@ -290,6 +615,11 @@ def read_soundtrap(
         Should be negative. Default is None.
     gain : int or float
         Amplifier gain in dB re 1 V/μPa. Default is 0.
+    dtype : str or numpy.dtype
+        Floating point type of the output. Default is 'float64'.
+    chunks : int, optional
+        Number of samples per chunk. If provided, returns a lazily scaled,
+        dask-backed DataArray. See `read_hydrophone`. Default is None.
 
     Returns
     -------
@@ -321,6 +651,8 @@ def read_soundtrap(
         sensitivity=sensitivity,
         gain=gain,
         start_time=start_time,
+        dtype=dtype,
+        chunks=chunks,
     )
     out.attrs["make"] = "SoundTrap"
 
@@ -417,6 +749,9 @@ def read_iclisten(
     filename: str,
     sensitivity: Optional[Union[int, float]] = None,
     use_metadata: bool = True,
+    *,
+    dtype: Union[str, np.dtype] = "float64",
+    chunks: Optional[int] = None,
 ) -> xr.DataArray:
     """
     Read .wav file from an Ocean Sonics icListen "Smart" hydrophone.
@@ -434,6 +769,11 @@ def read_iclisten(
         If True and `sensitivity` is None, applies sensitivity value stored
         in the .wav file's LIST block. If False and `sensitivity` is None,
         a sensitivity value isn't applied.
+    dtype : str or numpy.dtype
+        Floating point type of the output. Default is 'float64'.
+    chunks : int, optional
+        Number of samples per chunk. If provided, returns a lazily scaled,
+        dask-backed DataArray. See `read_hydrophone`. Default is None.
 
     Returns
     -------
@@ -466,6 +806,8 @@ def read_iclisten(
         sensitivity=sensitivity,
         gain=0,
         start_time=start_time,
+        dtype=dtype,
+        chunks=chunks,
     )
 
     # Update attributes with metadata
@@ -1,4 +1,12 @@
-from mhkit.dolfyn.io.api import read, read_example, save, load, save_mat, load_mat
+from mhkit.dolfyn.io.api import (
+    read,
+    read_example,
+    save,
+    load,
+    open_dataset,
+    save_mat,
+    load_mat,
+)
 from mhkit.dolfyn.rotate.api import (
     rotate2,
     calc_principal_heading,
@@ -490,10 +490,8 @@ def medfilt_orient(ds, nfilt=7) -> xr.Dataset:
     ds = ds.copy(deep=True)
 
     if getattr(ds, "has_imu"):
-        q_filt = np.zeros(ds.quaternions.shape)
-        for i in range(ds.quaternions.q.size):
-            q_filt[i] = medfilt(ds.quaternions[i].values, nfilt)
-        ds.quaternions.values = q_filt
+        # Filter each quaternion component along time in a single call
+        ds.quaternions.values = medfilt(ds.quaternions.values, [1, nfilt])
 
         ds["orientmat"] = quaternion2orient(ds.quaternions)
         return ds
@@ -211,32 +211,69 @@ class TimeBinner:
         npd0 = int(n_pad // 2)
         npd1 = int((n_pad + 1) // 2)
         shp = self._outshape(arr.shape, n_pad=0, n_bin=n_bin)
-        out = np.zeros(
-            self._outshape(arr.shape, n_pad=n_pad, n_bin=n_bin), dtype=arr.dtype
-        )
         if np.mod(n_bin, 1) == 0:
             # n_bin needs to be int
             n_bin = int(n_bin)
-            # If n_bin is an integer, we can do this simply.
-            out[..., npd0 : n_bin + npd0] = (arr[..., : (shp[-2] * shp[-1])]).reshape(
-                shp, order="C"
+            # If n_bin is an integer, return a (read-only) strided view
+            # of `arr`. Only the padded case requires a copy, and that
+            # copy is the size of `arr` plus the zero-padded ends rather
+            # than the full (n, n_bin + n_pad) output.
+            return self._strided_reshape(
+                arr[..., : (shp[-2] * shp[-1])], n_bin, npd0, npd1
             )
-        else:
-            inds = (np.arange(np.prod(shp[-2:])) * n_bin // int(n_bin)).astype(int)
-            # If there are too many indices, drop one bin
-            if inds[-1] >= arr.shape[-1]:
-                inds = inds[: -int(n_bin)]
-                shp[-2] -= 1
-                out = out[..., 1:, :]
-            n_bin = int(n_bin)
-            out[..., npd0 : n_bin + npd0] = (arr[..., inds]).reshape(shp, order="C")
-            n_bin = int(n_bin)
+
+        out = np.zeros(
+            self._outshape(arr.shape, n_pad=n_pad, n_bin=n_bin), dtype=arr.dtype
+        )
+        inds = (np.arange(np.prod(shp[-2:])) * n_bin // int(n_bin)).astype(int)
+        # If there are too many indices, drop one bin
+        if inds[-1] >= arr.shape[-1]:
+            inds = inds[: -int(n_bin)]
+            shp[-2] -= 1
+            out = out[..., 1:, :]
+        n_bin = int(n_bin)
+        out[..., npd0 : n_bin + npd0] = (arr[..., inds]).reshape(shp, order="C")
         if n_pad != 0:
             out[..., 1:, :npd0] = out[..., :-1, n_bin : n_bin + npd0]
             out[..., :-1, -npd1:] = out[..., 1:, npd0 : npd0 + npd1]
 
         return out
 
+    @staticmethod
+    def _strided_reshape(arr, n_bin, npd0=0, npd1=0):
+        """
+        Returns a read-only view of `arr` with shape
+        (..., `arr.shape[-1]` // `n_bin`, `npd0` + `n_bin` + `npd1`),
+        where neighboring bins overlap by the padding points.
+
+        Parameters
+        ----------
+        arr : numpy.ndarray
+          Array whose last dimension is a whole multiple of `n_bin`
+        n_bin : int
+          Number of data points per bin
+        npd0 : int
+          Number of points from the end of the previous bin to prepend
+          to each bin. Default = 0
+        npd1 : int
+          Number of points from the start of the next bin to append
+          to each bin. Default = 0
+
+        Returns
+        -------
+        out : numpy.ndarray
+        """
+
+        if npd0 or npd1:
+            # Zeros only ever appear at the beginning and end of the
+            # timeseries, so pad the ends once instead of each bin.
+            pad = [(0, 0)] * (arr.ndim - 1) + [(npd0, npd1)]
+            arr = np.pad(arr, pad, mode="constant")
+        out = np.lib.stride_tricks.sliding_window_view(
+            arr, n_bin + npd0 + npd1, axis=-1
+        )
+        return out[..., ::n_bin, :]
+
     def detrend(self, arr, axis=-1, n_pad=0, n_bin=None):
         """
         Reshape the array `arr` to shape (...,n,n_bin+n_pad)
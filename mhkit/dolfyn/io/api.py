@@ -145,21 +145,76 @@ def read_example(name, **kwargs):
     return read(filename, **kwargs)
 
 
-def save(ds, filename, format="NETCDF4", engine="netcdf4", compression=False, **kwargs):
+# Compressor presets for Zarr stores
+_zarr_presets = {
+    "blosc": dict(cname="lz4", clevel=5),
+    "zstd": dict(cname="zstd", clevel=3),
+}
+
+
+def _zarr_compressor(compression):
+    """
+    Returns the Zarr variable encoding of a compressor preset.
+
+    Parameters
+    ----------
+    compression : bool or str
+      True, "blosc" or "zstd"
+    """
+
+    if compression is True:
+        compression = "blosc"
+    if compression not in _zarr_presets:
+        raise ValueError(
+            "Zarr compression must be one of {}".format(list(_zarr_presets))
+        )
+    preset = _zarr_presets[compression]
+
+    import zarr
+
+    if int(zarr.__version__.split(".")[0]) >= 3:
+        from zarr.codecs import BloscCodec
+
+        return {"compressors": (BloscCodec(shuffle="shuffle", **preset),)}
+    from numcodecs import Blosc
+
+    return {"compressor": Blosc(shuffle=Blosc.SHUFFLE, **preset)}
+
+
+def save(
+    ds,
+    filename,
+    format="NETCDF4",
+    engine="netcdf4",
+    compression=False,
+    chunks=None,
+    append_dim=None,
+    **kwargs,
+):
     """
-    Save xarray dataset as netCDF (.nc).
+    Save xarray dataset as netCDF (.nc) or as a Zarr store (.zarr).
 
     Parameters
     ----------
     ds : xarray.Dataset
       Dataset to save
     filename : str
-      Filename and/or path with the '.nc' extension
-    compression : bool
-      When true, compress all variables with zlib complevel=1.
-      Default is False
+      Filename and/or path with the '.nc' or '.zarr' extension
+    compression : bool or str
+      When true, compress all variables with zlib complevel=1 (netCDF)
+      or with the "blosc" preset (Zarr). Zarr stores also take the name
+      of a compressor preset: "blosc" (LZ4) or "zstd". Default is False
+    chunks : dict
+      Chunk sizes of the Zarr store, e.g. {'time': 4096}. Dimensions
+      that are not listed are saved in one chunk. Default is None,
+      chunks are chosen by xarray
+    append_dim : str
+      Name of the dimension (e.g. 'time') along which to append `ds`
+      to an existing Zarr store, instead of overwriting it.
+      Default is None
     **kwargs : dict
       These are passed directly to :func:`xarray.Dataset.to_netcdf`
+      or :func:`xarray.Dataset.to_zarr`
 
     Notes
     -----
@@ -171,9 +226,15 @@ def save(ds, filename, format="NETCDF4", engine="netcdf4", compression=False, **
     'encoding' in kwargs. The values in encoding will take precedence
     over whatever is set according to the compression option above.
     See the xarray.to_netcdf documentation for more details.
+
+    Saving to Zarr and appending require the `zarr` package.
     """
 
-    filename = _check_file_ext(filename, "nc")
+    is_zarr = filename.rstrip("/\\").endswith(".zarr")
+    if not is_zarr:
+        filename = _check_file_ext(filename, "nc")
+        if append_dim is not None:
+            raise ValueError("`append_dim` is only supported for Zarr stores.")
 
     # Handling complex values for netCDF4
     ds.attrs["complex_vars"] = []
@@ -189,6 +250,9 @@ def save(ds, filename, format="NETCDF4", engine="netcdf4", compression=False, **
         elif ds[var].dtype == np.float64:
             ds[var] = ds[var].astype("float32")
 
+    if is_zarr:
+        return _save_zarr(ds, filename, compression, chunks, append_dim, **kwargs)
+
     # Write variable encoding
     enc = dict()
     if "encoding" in kwargs:
@@ -223,24 +287,49 @@ def save(ds, filename, format="NETCDF4", engine="netcdf4", compression=False, **
     ds.to_netcdf(filename, format=format, engine=engine, **kwargs)
 
 
-def load(filename):
+def _save_zarr(ds, filename, compression, chunks, append_dim, **kwargs):
+    """
+    Write (or append to) a Zarr store. See :func:`save`.
     """
-    Load xarray dataset from netCDF (.nc)
 
-    Parameters
-    ----------
-    filename : str
-      Filename and/or path with the '.nc' extension
+    if chunks is not None and ds.chunks:
+        # Dask chunks must line up with the chunks of the store
+        ds = ds.chunk(chunks)
 
-    Returns
-    -------
-    ds : xarray.Dataset
-      An xarray dataset from the binary instrument data.
-    """
+    # Fix encoding on datetime64 variables.
+    ds = _decode_cf(ds)
 
-    filename = _check_file_ext(filename, "nc")
+    if append_dim is not None:
+        # The encoding of the existing store is used
+        ds.to_zarr(filename, mode="a", append_dim=append_dim, **kwargs)
+        return
 
-    ds = xr.load_dataset(filename, engine="netcdf4")
+    # Only keep the CF encoding parameters, other netCDF4 parameters
+    # are not valid for Zarr
+    params = ["dtype", "units", "calendar", "scale_factor", "add_offset"]
+    enc = dict()
+    for ky in ds.variables:
+        enc[ky] = {p: ds[ky].encoding[p] for p in params if p in ds[ky].encoding}
+        if np.issubdtype(ds[ky].dtype, np.datetime64):
+            # Keep sub-second precision for data that is appended later
+            enc[ky]["dtype"] = "float64"
+        if chunks is not None:
+            enc[ky]["chunks"] = tuple(
+                min(chunks.get(dim, n), n) for dim, n in zip(ds[ky].dims, ds[ky].shape)
+            )
+        if compression and ds[ky].size > 1 and ds[ky].dtype.kind not in "OSU":
+            enc[ky].update(_zarr_compressor(compression))
+    enc.update(kwargs.pop("encoding", {}))
+
+    ds.to_zarr(filename, mode="w", encoding=enc, **kwargs)
+
+
+def _finalize_load(ds):
+    """
+    Restore the attributes and complex variables of a dataset saved by
+    :func:`save`. Complex variables of a Dask-backed dataset are
+    rebuilt lazily.
+    """
 
     # Convert numpy arrays and strings back to lists
     for nm in ds.attrs:
@@ -263,6 +352,61 @@ def load(filename):
     return ds
 
 
+def load(filename):
+    """
+    Load xarray dataset from netCDF (.nc)
+
+    Parameters
+    ----------
+    filename : str
+      Filename and/or path with the '.nc' extension
+
+    Returns
+    -------
+    ds : xarray.Dataset
+      An xarray dataset from the binary instrument data.
+    """
+
+    filename = _check_file_ext(filename, "nc")
+
+    ds = xr.load_dataset(filename, engine="netcdf4")
+
+    return _finalize_load(ds)
+
+
+def open_dataset(filename, chunks="auto"):
+    """
+    Lazily open an xarray dataset from netCDF (.nc) or a Zarr store
+    (.zarr), backed by Dask arrays.
+
+    Parameters
+    ----------
+    filename : str
+      Filename and/or path with the '.nc' or '.zarr' extension
+    chunks : int, dict, 'auto' or None
+      Chunk sizes along each dimension, e.g. {'time': 4096}. Default
+      is 'auto'. See :func:`xarray.open_dataset`
+
+    Returns
+    -------
+    ds : xarray.Dataset
+      An xarray dataset from the binary instrument data. Data is only
+      read from disk when it is computed or loaded.
+
+    Notes
+    -----
+    Requires the `dask` package, and `zarr` for Zarr stores.
+    """
+
+    if filename.rstrip("/\\").endswith(".zarr"):
+        ds = xr.open_zarr(filename, chunks=chunks)
+    else:
+        filename = _check_file_ext(filename, "nc")
+        ds = xr.open_dataset(filename, engine="netcdf4", chunks=chunks)
+
+    return _finalize_load(ds)
+
+
 def save_mat(ds, filename, datenum=True):
     """
     Save xarray dataset as a MATLAB (.mat) file
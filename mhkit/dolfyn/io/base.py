@@ -2,13 +2,85 @@ import numpy as np
 import xarray as xr
 import json
 import os
+import struct
 import warnings
 
 
+# Header of the .index files: "Index Ver:", version, data filesize
+_index_head = struct.Struct("<10sHQ")
+
+
 def _abspath(fname):
     return os.path.abspath(os.path.expanduser(fname))
 
 
+def _get_index(infile, create_fn, index_dtype, version=1, rebuild=False):
+    """
+    Read (and if necessary create) the .index file of a binary datafile.
+
+    The index file starts with a header holding the index `version` and
+    the size of the datafile, so that it is rebuilt when either changes.
+
+    Parameters
+    ----------
+    infile: str
+      Path and filename of the datafile, not including ".index"
+    create_fn: callable
+      Function that scans `infile` and returns its index as an array
+      of `index_dtype`
+    index_dtype: numpy.dtype
+      Data-type of the index
+    version: int
+      Version of the index format. Default = 1
+    rebuild: bool
+      If true, ignore existing .index file and create a new one
+
+    Returns
+    -------
+    out: numpy.ndarray
+      The index. If the .index file cannot be written (e.g. in a
+      read-only data directory), it is only kept in memory.
+    """
+
+    index_file = _abspath(infile + ".index")
+    fsize = os.path.getsize(infile)
+    if os.path.isfile(index_file) and not rebuild:
+        with open(index_file, "rb") as f:
+            head = f.read(_index_head.size)
+            if len(head) == _index_head.size and _index_head.unpack(head) == (
+                b"Index Ver:",
+                version,
+                fsize,
+            ):
+                return np.fromfile(f, dtype=index_dtype)
+    # Missing or out-of-date index (or the datafile has changed)
+    index = np.asarray(create_fn(infile), dtype=index_dtype)
+    try:
+        with open(index_file, "wb") as fout:
+            fout.write(_index_head.pack(b"Index Ver:", version, fsize))
+            fout.write(index.tobytes())
+    except OSError:
+        pass
+    return index
+
+
+def _gather(buf, pos, dtype, count=None):
+    """
+    Read the values of `dtype` starting at each of the byte positions
+    `pos` in the byte array `buf`.
+
+    Returns an array of shape (len(pos),), or (len(pos), count) if
+    `count` values are read at each position.
+    """
+    dtype = np.dtype(dtype)
+    nbyte = dtype.itemsize * (1 if count is None else count)
+    inds = np.asarray(pos, dtype=np.int64)[:, None] + np.arange(nbyte)
+    out = np.ascontiguousarray(buf[inds]).view(dtype)
+    if count is None:
+        return out[:, 0]
+    return out
+
+
 def _get_filetype(fname):
     """
     Detects whether the file is a Nortek, Signature (Nortek), or RDI
@@ -16,7 +16,13 @@ from ..rotate import api as rot
 
 
 def read_nortek(
-    filename, userdata=True, debug=False, do_checksum=False, nens=None, **kwargs
+    filename,
+    userdata=True,
+    debug=False,
+    do_checksum=False,
+    nens=None,
+    rebuild_index=False,
+    **kwargs,
 ):
     """
     Read a classic Nortek (AWAC and Vector) datafile
@@ -35,6 +41,9 @@ def read_nortek(
     nens : None, int or 2-element tuple (start, stop)
       Number of pings or ensembles to read from the file.
       Default is None, read entire file
+    rebuild_index : bool
+      Force rebuild of dolfyn-written datafile index. Useful for code updates.
+      Default = False
 
     Returns
     -------
@@ -57,7 +66,13 @@ def read_nortek(
 
     userdata = base._find_userdata(filename, userdata)
 
-    rdr = _NortekReader(filename, debug=debug, do_checksum=do_checksum, nens=nens)
+    rdr = _NortekReader(
+        filename,
+        debug=debug,
+        do_checksum=do_checksum,
+        nens=nens,
+        rebuild_index=rebuild_index,
+    )
     rdr.readfile()
     rdr.cleanup()
     dat = rdr.data
@@ -140,6 +155,8 @@ class _NortekReader:
     nens : None, int or 2-element tuple (start, stop)
       Number of pings or ensembles to read from the file.
       Default is None, read entire file
+    rebuild_index : bool
+      Force rebuild of the datafile index. Default = False
     """
 
     _lastread = [None, None, None, None, None]
@@ -166,8 +183,10 @@ class _NortekReader:
         do_checksum=True,
         bufsize=100000,
         nens=None,
+        rebuild_index=False,
     ):
         self.fname = fname
+        self._rebuild_index = rebuild_index
         self._bufsize = bufsize
         self.f = open(base._abspath(fname), "rb", 1000)
         self.do_checksum = do_checksum
@@ -230,7 +249,7 @@ class _NortekReader:
         self._inst = self.config.pop("config_type")
         # This is the position after reading the 'hardware',
         # 'head', and 'user' configuration.
-        pnow = self.pos
+        pnow = self._data_start = self.pos
 
         # Run the appropriate initialization routine (e.g. init_ADV).
         getattr(self, "init_" + self._inst)()
@@ -426,6 +445,8 @@ class _NortekReader:
 
     def readfile(self, nlines=None):
         print("Reading file %s ..." % self.fname)
+        if nlines is None and self.check_index():
+            return self.read_bulk()
         retval = None
         try:
             while not retval:
@@ -451,6 +472,200 @@ class _NortekReader:
         self.c -= 1
         lib._crop_data(self.data, slice(0, self.c), self.n_samp_guess)
 
+    def check_index(self):
+        """
+        Load (or create) the record index of the file and check if its
+        data records can be read in bulk.
+
+        This is currently supported for Vector files with a single type
+        of IMU data. AWAC files, files with corrupted or unrecognized
+        blocks and debug reads are read block-by-block.
+        """
+        if self._inst != "ADV" or self.debug:
+            return False
+        idx = lib.get_index(self.fname, self.endian, rebuild=self._rebuild_index)
+        buf = np.memmap(base._abspath(self.fname), dtype=np.uint8, mode="r")
+        # The index stops at the first corrupted block
+        end = int(idx["pos"][-1]) + int(idx["nbyte"][-1]) if len(idx) else 0
+        if end + 4 <= len(buf) and (
+            buf[end] != 165 or end + lib._record_size(buf, end, self.endian) <= len(buf)
+        ):
+            return False
+        idx = idx[idx["pos"] >= self._data_start]
+        ids = idx["ID"]
+        if not np.isin(ids, [0, 4, 5, 7, 16, 17, 18, 113]).all():
+            return False
+        if np.any(idx["nbyte"][ids == 17] != 28):
+            return False
+        imu = np.nonzero(ids == 113)[0]
+        if len(imu):
+            ahrsid = np.unique(buf[idx["pos"][imu].astype(np.int64) + 5])
+            if len(ahrsid) != 1 or ahrsid[0] not in self._imu_fields:
+                return False
+            self._ahrsid = int(ahrsid[0])
+            nbyte = np.dtype(self._imu_block(self._ahrsid)).itemsize
+            if np.any(idx["nbyte"][imu] != nbyte):
+                return False
+            # IMU data is saved with the preceding velocity sample
+            if not np.any(ids[: imu[0]] == 16):
+                return False
+        self._index = idx
+        self._buf = buf
+        return True
+
+    _imu_fields = {
+        195: ["angrt", "accel", "orientmat"],
+        204: ["accel", "angrt", "mag", "orientmat"],
+        211: ["angrt", "accel", "mag"],
+    }
+
+    def _imu_block(self, ahrsid):
+        """The fields of an IMU data block (0x71)."""
+        e = self.endian
+        fields = [("head", "u1", 6)]
+        for nm in self._imu_fields[ahrsid]:
+            fields.append((nm, e + "f4", (3, 3) if nm == "orientmat" else 3))
+        # 4 spare bytes, or the "DWORD" and the AHRS checksum
+        fields.append(("spare", "u1", 4 if ahrsid == 195 else 6))
+        return fields + [("cs", e + "u2")]
+
+    def read_bulk(self):
+        """
+        Read the Vector data records using the record index.
+
+        The velocity (0x10), system (0x11) and IMU (0x71) data blocks are
+        decoded all at once with structured data-types. The remaining
+        (header) blocks are read by their block-by-block functions. The
+        samples are saved exactly as in `readfile`.
+        """
+        buf = self._buf
+        e = self.endian
+        ids = self._index["ID"]
+        pos = self._index["pos"].astype(np.int64)
+        is_vel = ids == 16
+        # The sample number of each block (`self.c` in `readfile`)
+        c_after = np.cumsum(is_vel)
+        c_before = c_after - is_vel
+        n_rec = len(ids)
+        if self._npings is not None:
+            stop = np.nonzero(c_after >= self._npings)[0]
+            if len(stop):
+                n_rec = stop[0] + 1
+                # `readfile` reads one more block to finish the IMU sample
+                if (
+                    np.any(ids[:n_rec] == 113)
+                    and n_rec < len(ids)
+                    and ids[n_rec] not in [16, 17]
+                ):
+                    n_rec += 1
+        ids, pos, isamp = ids[:n_rec], pos[:n_rec], c_before[:n_rec]
+        isamp[ids == 113] -= 1
+        keep = (isamp >= 0) & (isamp < self.n_samp_guess)
+
+        dat = self.data
+        dv = dat["data_vars"]
+        ds = dat["sys"]
+        # Initialize the data in the order it is found in the file
+        blk_ids = [id for id in [16, 17, 113] if np.any(ids == id)]
+        for id in sorted(blk_ids, key=lambda id: np.argmax(ids == id)):
+            if id == 16:
+                self._init_data(defs.vec_data)
+                self._dtypes += ["vec_data"]
+            elif id == 17:
+                self._init_data(defs.vec_sysdata)
+                self._dtypes += ["vec_sysdata"]
+            else:
+                self._init_imu(self._ahrsid)
+
+        # Header and configuration blocks
+        for p in pos[~np.isin(ids, [16, 17, 113])]:
+            self.f.seek(p, 0)
+            self.readnext()
+
+        # Vector measurement data blocks (0x10)
+        sel = (ids == 16) & keep
+        rec = self._read_blocks(
+            pos[sel],
+            [
+                ("head", "u1", 2),
+                ("AnaIn2LSB", "u1"),
+                ("Count", "u1"),
+                ("PressureMSB", "u1"),
+                ("AnaIn2MSB", "u1"),
+                ("PressureLSW", e + "u2"),
+                ("AnaIn1", e + "u2"),
+                ("vel", e + "i2", 3),
+                ("amp", "u1", 3),
+                ("corr", "u1", 3),
+                ("cs", e + "u2"),
+            ],
+        )
+        i = isamp[sel]
+        for nm in ["AnaIn2LSB", "Count", "AnaIn2MSB", "AnaIn1"]:
+            ds[nm][i] = rec[nm]
+        for nm in ["PressureMSB", "PressureLSW"]:
+            dv[nm][i] = rec[nm]
+        for nm in ["vel", "amp", "corr"]:
+            dv[nm][:, i] = rec[nm].T
+
+        # Vector system data blocks (0x11)
+        sel = (ids == 17) & keep
+        rec = self._read_blocks(
+            pos[sel],
+            [
+                ("head", "u1", 4),
+                ("time", "u1", 6),
+                ("batt", e + "u2"),
+                ("c_sound", e + "u2"),
+                ("heading", e + "u2"),
+                ("pitch", e + "i2"),
+                ("roll", e + "i2"),
+                ("temp", e + "i2"),
+                ("error", "u1"),
+                ("status", "u1"),
+                ("AnaIn", e + "u2"),
+                ("cs", e + "u2"),
+            ],
+        )
+        i = isamp[sel]
+        dat["coords"]["time"][i] = lib._rd_time_bulk(rec["time"].T)
+        for nm in ["batt", "c_sound", "heading", "pitch", "roll", "temp", "error"]:
+            dv[nm][i] = rec[nm]
+        dv["status"][i] = rec["status"]
+        ds["AnaIn"][i] = rec["AnaIn"]
+        # A burst starts with a header and check data block
+        prev = np.nonzero(sel)[0]
+        prev = prev[prev >= 2]
+        burst = prev[(ids[prev - 1] == 7) & (ids[prev - 2] == 18)]
+        self.burst_start[isamp[burst]] = True
+
+        # IMU data blocks (0x71)
+        sel = (ids == 113) & keep
+        if np.any(sel):
+            rec = self._read_blocks(pos[sel], self._imu_block(self._ahrsid))
+            i = isamp[sel]
+            for nm in self._imu_fields[self._ahrsid]:
+                dv[nm][..., i] = np.moveaxis(rec[nm], 0, -1)
+
+        del self._buf
+        self.c = int(c_after[n_rec - 1]) - 1 if n_rec else -1
+        lib._crop_data(self.data, slice(0, self.c), self.n_samp_guess)
+
+    def _read_blocks(self, pos, fields):
+        """
+        Read the data blocks starting at byte positions `pos` with the
+        structured data-type `fields`, and verify their checksums if
+        `do_checksum` is True.
+        """
+        dtype = np.dtype(fields)
+        if self.do_checksum:
+            bad = lib._checksum_failed(self._buf, pos, dtype.itemsize, self.endian)
+            if np.any(bad):
+                raise Exception(
+                    "CheckSum Failed at {}".format(pos[bad][0] + dtype.itemsize)
+                )
+        return lib._gather(self._buf, pos, dtype)
+
     def findnextid(self, id):
         if id.__class__ is str:
             id = int(id, 0)
@@ -920,8 +1135,8 @@ class _NortekReader:
                 self.config["data_header"] = [self.config["data_header"]]
             self.config["data_header"] += [hdrnow]
 
-    def read_imu(self):
-        """Read ADV inertial measurement unit (IMU) data block (0x71)"""
+    def _init_imu(self, ahrsid):
+        """Initialize the IMU data arrays for AHRS ID `ahrsid`."""
 
         def update_defs(dat, mag=False, orientmat=False):
             imu_data = {
@@ -940,29 +1155,6 @@ class _NortekReader:
                 dat["units"].pop("orientmat")
                 dat["long_name"].pop("orientmat")
 
-        # 0x71 = 113
-        if self.c == 0:
-            logging.warning(
-                'First "IMU data" block ' 'is before first "vector system data" block.'
-            )
-        else:
-            self.c -= 1
-        if self.debug:
-            logging.info(
-                "Reading Vector IMU data (0x71) ping #{} @ {}...".format(
-                    self.c, self.pos
-                )
-            )
-        byts0 = self.read(4)
-        # The first 2 are the size, 3rd is count, 4th is the id.
-        ahrsid = unpack(self.endian + "3xB", byts0)[0]
-        if hasattr(self, "_ahrsid") and self._ahrsid != ahrsid:
-            logging.warning("AHRS_ID changes mid-file!")
-
-        if ahrsid in [195, 204, 210, 211]:
-            self._ahrsid = ahrsid
-
-        c = self.c
         dat = self.data
         dv = dat["data_vars"]
         da = dat["attrs"]
@@ -1003,6 +1195,36 @@ class _NortekReader:
                     da["rotate_vars"].extend(rv)
                 update_defs(dat, mag=True, orientmat=False)
 
+    def read_imu(self):
+        """Read ADV inertial measurement unit (IMU) data block (0x71)"""
+
+        # 0x71 = 113
+        if self.c == 0:
+            logging.warning(
+                'First "IMU data" block ' 'is before first "vector system data" block.'
+            )
+        else:
+            self.c -= 1
+        if self.debug:
+            logging.info(
+                "Reading Vector IMU data (0x71) ping #{} @ {}...".format(
+                    self.c, self.pos
+                )
+            )
+        byts0 = self.read(4)
+        # The first 2 are the size, 3rd is count, 4th is the id.
+        ahrsid = unpack(self.endian + "3xB", byts0)[0]
+        if hasattr(self, "_ahrsid") and self._ahrsid != ahrsid:
+            logging.warning("AHRS_ID changes mid-file!")
+
+        if ahrsid in [195, 204, 210, 211]:
+            self._ahrsid = ahrsid
+
+        c = self.c
+        dat = self.data
+        dv = dat["data_vars"]
+        self._init_imu(ahrsid)
+
         byts = ""
         if ahrsid == 195:  # 0xc3
             byts = self.read(64)
@@ -4,7 +4,7 @@ import numpy as np
 from logging import getLogger
 import warnings
 from .. import time
-from .base import _abspath
+from .base import _abspath, _gather
 
 
 def _reduce_by_average(data, ky0, ky1):
@@ -107,113 +107,182 @@ def _calc_time(year, month, day, hour, minute, second, usec, zero_is_bad=True):
     return dt
 
 
-def _create_index(infile, outfile, init_pos, eof, debug):
-    logging = getLogger()
-    print("Indexing {}...".format(infile), end="")
-    fin = open(_abspath(infile), "rb")
-    fout = open(_abspath(outfile), "wb")
-    fout.write(b"Index Ver:")
-    fout.write(struct.pack("<H", _index_version))
-    ids = [21, 22, 23, 24, 26, 28, 27, 29, 30, 31, 35, 36]
-    # Saved: burst, avg, bt, vel_b5, alt_raw, echo
-    # Not saved: bt record, DVL, alt record, avg alt_raw record, raw echo, raw echo transmit
-    ens = dict.fromkeys(ids, 0)
-    N = dict.fromkeys(ids, 0)
-    config = 0
-    last_ens = dict.fromkeys(ids, -1)
-    seek_2ens = {
-        21: 40,
-        22: 40,
-        23: 42,
-        24: 40,
-        26: 40,
-        28: 40,  # 23 starts from "42"
-        27: 40,
-        29: 40,
-        30: 40,
-        31: 40,
-        35: 40,
-        36: 40,
-    }
-    pos = 0
-    while pos <= eof:
-        pos = fin.tell()
-        if init_pos and not pos:
-            fin.seek(init_pos, 1)
-        try:
-            dat = _hdr.unpack(fin.read(_hdr.size))
-        except:
+# Data record IDs that are indexed
+# Saved: burst, avg, bt, vel_b5, alt_raw, echo
+# Not saved: bt record, DVL, alt record, avg alt_raw record, raw echo, raw echo transmit
+_index_ids = [21, 22, 23, 24, 26, 28, 27, 29, 30, 31, 35, 36]
+# Number of bytes between 'beams_cy' and the ensemble counter
+_seek_2ens = dict.fromkeys(_index_ids, 40)
+_seek_2ens[23] = 42  # 23 starts from "42"
+
+
+def _scan_headers(buf, pos, eof, debug=False):
+    """
+    Walk the record headers of a memory-mapped ad2cp file, starting at
+    byte `pos`, and return the positions of the records to index and
+    the position where the walk stopped.
+
+    Only the 10-byte headers are read here, the fields of the indexed
+    records are read in bulk afterwards. Records that are only partly
+    written (e.g. at the end of a file that is still growing) end the
+    walk, so they are picked up when the index is updated.
+    """
+    ids = set(_index_ids)
+    unpack = _hdr.unpack_from
+    nbuf = len(buf)
+    out = []
+    while pos <= eof and pos + _hdr.size <= nbuf:
+        dat = unpack(buf, pos)
+        if dat[4] < 0:
+            if debug:
+                getLogger().info("Invalid skip byte at pos: %10d\n" % (pos))
             break
         if dat[2] in ids:
-            idk = dat[2]
-            d_ver, d_off, config = struct.unpack("<BBH", fin.read(4))
-            if d_ver not in [1, 3]:
+            if pos + 50 + _seek_2ens[dat[2]] > nbuf:
+                break
+            if buf[pos + 10] not in (1, 3):
                 # 1 for bottom track, 3 for all others
+                pos += _hdr.size + 4
                 continue
-            fin.seek(4, 1)
-            yr, mo, dy, h, m, s, u = struct.unpack("6BH", fin.read(8))
-            fin.seek(14, 1)
-            beams_cy = struct.unpack("<H", fin.read(2))[0]
-            fin.seek(seek_2ens[dat[2]], 1)
-            ens[idk] = struct.unpack("<I", fin.read(4))[0]
-
-            if last_ens[idk] > 0:
-                if (ens[idk] == 1) or (ens[idk] < last_ens[idk]):
-                    # Covers all id keys saved in "burst mode"
-                    # Covers ID keys not saved in sequential order
-                    ens[idk] = last_ens[idk] + 1
-
-            if last_ens[idk] > 0 and last_ens[idk] != ens[idk]:
-                N[idk] += 1
-
-            fout.write(
-                struct.pack(
-                    "<QIQ4H6BHB",
-                    N[idk],
-                    ens[idk],
-                    pos,
-                    idk,
-                    config,
-                    beams_cy,
-                    0,
-                    yr,
-                    mo + 1,
-                    dy,
-                    h,
-                    m,
-                    s,
-                    u,
-                    d_ver,
+            out.append(pos)
+        pos += _hdr.size + dat[4]
+    return np.array(out, dtype=np.int64), pos
+
+
+def _index_records(buf, pos, eof, N, last_ens, debug=False):
+    """
+    Index the records of `buf` from byte `pos` to `eof`.
+
+    `N` and `last_ens` hold the ensemble counter and the last
+    instrument ensemble number of each ID, and are updated in place so
+    that indexing can be resumed later on.
+    """
+    logging = getLogger()
+    rec_pos, end = _scan_headers(buf, pos, eof, debug)
+    out = np.zeros(len(rec_pos), dtype=_index_dtype[_index_version])
+    if not len(rec_pos):
+        return out, end
+
+    idk = buf[rec_pos + 2].astype(np.uint16)
+    out["pos"] = rec_pos
+    out["ID"] = idk
+    out["d_ver"] = buf[rec_pos + 10]
+    out["config"] = _gather(buf, rec_pos + 12, "<u2")
+    for i, nm in enumerate(["year", "month", "day", "hour", "minute", "second"]):
+        out[nm] = buf[rec_pos + 18 + i]
+    out["month"] += 1
+    out["usec100"] = _gather(buf, rec_pos + 24, "<u2")
+    out["beams_cy"] = _gather(buf, rec_pos + 40, "<u2")
+    ens_pos = rec_pos + 42 + np.where(idk == 23, 42, 40)
+    hw_ens = _gather(buf, ens_pos, "<u4").tolist()
+
+    # The ensemble counters depend on the previous record of the same ID
+    ens = np.zeros(len(rec_pos), dtype=np.uint64)
+    for i, (id, e) in enumerate(zip(idk.tolist(), hw_ens)):
+        if last_ens[id] > 0:
+            if (e == 1) or (e < last_ens[id]):
+                # Covers all id keys saved in "burst mode"
+                # Covers ID keys not saved in sequential order
+                e = last_ens[id] + 1
+            if last_ens[id] != e:
+                N[id] += 1
+        hw_ens[i] = e
+        ens[i] = N[id]
+        last_ens[id] = e
+    out["hw_ens"] = hw_ens
+    out["ens"] = ens
+
+    if debug:
+        # File Position: Valid ID keys (1A, 10), Hex ID, Length in bytes, Ensemble #, Last Ensemble Found'
+        # hex: [18, 15, 1C, 17] = [vel_b5, vel, echo, bt]
+        nbyte = _gather(buf, rec_pos + 4, "<i2")
+        for i, p in enumerate(rec_pos.tolist()):
+            logging.info(
+                "%10d: %02X, %d, %02X, %d, %d, %d, %d\n"
+                % (
+                    p,
+                    buf[p],
+                    buf[p + 1],
+                    idk[i],
+                    nbyte[i],
+                    out["ens"][i],
+                    out["hw_ens"][i],
+                    out["hw_ens"][i],
                 )
             )
-            fin.seek(dat[4] - (36 + seek_2ens[idk]), 1)
-            last_ens[idk] = ens[idk]
+    return out, end
 
-            if debug:
-                # File Position: Valid ID keys (1A, 10), Hex ID, Length in bytes, Ensemble #, Last Ensemble Found'
-                # hex: [18, 15, 1C, 17] = [vel_b5, vel, echo, bt]
-                logging.info(
-                    "%10d: %02X, %d, %02X, %d, %d, %d, %d\n"
-                    % (
-                        pos,
-                        dat[0],
-                        dat[1],
-                        dat[2],
-                        dat[4],
-                        N[idk],
-                        ens[idk],
-                        last_ens[idk],
-                    )
-                )
-        else:
-            if dat[4] < 0:
-                if debug:
-                    logging.info("Invalid skip byte at pos: %10d\n" % (pos))
-                break
-            fin.seek(dat[4], 1)
-    fin.close()
-    fout.close()
+
+def _create_index(infile, outfile, init_pos, eof, debug):
+    print("Indexing {}...".format(infile), end="")
+    buf = np.memmap(_abspath(infile), dtype=np.uint8, mode="r")
+    N = dict.fromkeys(_index_ids, 0)
+    last_ens = dict.fromkeys(_index_ids, -1)
+    out, _ = _index_records(buf, init_pos, eof, N, last_ens, debug)
+    del buf
+    with open(_abspath(outfile), "wb") as fout:
+        fout.write(b"Index Ver:")
+        fout.write(struct.pack("<H", _index_version))
+        out.tofile(fout)
+    print(" Done.")
+
+
+def _update_index(infile, index_file, idx, init_pos, eof, debug):
+    """
+    Append the records written to `infile` since `idx` was created to
+    the index file, and return the full index.
+
+    Indexing resumes after the last indexed record, so the cost is
+    proportional to the amount of new data. The index is rebuilt if it
+    does not match the data file.
+    """
+    buf = np.memmap(_abspath(infile), dtype=np.uint8, mode="r")
+    N = dict.fromkeys(_index_ids, 0)
+    last_ens = dict.fromkeys(_index_ids, -1)
+    if len(idx):
+        last = int(idx["pos"][-1])
+        if (
+            last + _hdr.size > len(buf)
+            or buf[last] != 165
+            or buf[last + 2] != idx["ID"][-1]
+        ):
+            del buf
+            _create_index(infile, index_file, init_pos, eof, debug)
+            return _read_index(index_file)[0]
+        pos = last + _hdr.size + int(_gather(buf, np.array([last + 4]), "<i2")[0])
+        # Restore the ensemble counters of each ID
+        for id in np.unique(idx["ID"]):
+            i = np.nonzero(idx["ID"] == id)[0][-1]
+            N[id] = int(idx["ens"][i])
+            last_ens[id] = int(idx["hw_ens"][i])
+    else:
+        pos = init_pos
+    if pos + _hdr.size > min(eof, len(buf)):
+        # Nothing new to index
+        return idx
+    new, _ = _index_records(buf, pos, eof, N, last_ens, debug)
+    del buf
+    if not len(new):
+        return idx
+    print("Updating index {}...".format(infile), end="")
+    with open(_abspath(index_file), "ab") as fout:
+        new.tofile(fout)
     print(" Done.")
+    return np.concatenate((idx, new))
+
+
+def _read_index(index_file):
+    f = open(_abspath(index_file), "rb")
+    file_head = f.read(12)
+    if file_head[:10] == b"Index Ver:":
+        index_ver = struct.unpack("<H", file_head[10:])[0]
+    else:
+        # This is pre-versioning the index files
+        index_ver = None
+        f.seek(0, 0)
+    out = np.fromfile(f, dtype=_index_dtype[index_ver])
+    f.close()
+    return out, index_ver
 
 
 def _check_index(idx, infile, fix_hw_ens=False, dp=False):
@@ -276,7 +345,9 @@ def _boolarray_firstensemble_ping(index):
 
 def get_index(infile, pos=0, eof=2**32, rebuild=False, debug=False, dp=False):
     """
-    This function reads ad2cp.index files
+    This function reads ad2cp.index files. An existing index is
+    extended with any records appended to the datafile since it was
+    written.
 
     Parameters
     ----------
@@ -296,16 +367,10 @@ def get_index(infile, pos=0, eof=2**32, rebuild=False, debug=False, dp=False):
     index_file = infile + ".index"
     if not path.isfile(index_file) or rebuild or debug:
         _create_index(infile, index_file, pos, eof, debug)
-    f = open(_abspath(index_file), "rb")
-    file_head = f.read(12)
-    if file_head[:10] == b"Index Ver:":
-        index_ver = struct.unpack("<H", file_head[10:])[0]
-    else:
-        # This is pre-versioning the index files
-        index_ver = None
-        f.seek(0, 0)
-    out = np.fromfile(f, dtype=_index_dtype[index_ver])
-    f.close()
+    out, index_ver = _read_index(index_file)
+    if index_ver == _index_version:
+        # Index any data appended to the file since the last read
+        out = _update_index(infile, index_file, out, pos, eof, debug)
     dp = _check_index(out, infile, dp=dp)
     return out, dp
 
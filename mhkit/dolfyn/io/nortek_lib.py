@@ -1,8 +1,10 @@
+import struct
 from struct import unpack
 import numpy as np
 from datetime import datetime
 
 from .. import time
+from .base import _abspath, _gather, _get_index
 
 
 def _bcd2char(cBCD):
@@ -146,3 +148,114 @@ def rd_time(strng):
             _bcd2char(sec),
         )
     )[0]
+
+
+# This is the data-type of the index file.
+# This must match what is returned by the _create_index function.
+_index_version = 1
+_index_dtype = np.dtype([("pos", np.uint64), ("ID", np.uint8), ("nbyte", np.uint32)])
+
+
+def _record_size(buf, pos, endian):
+    """
+    Returns the size in bytes of the record starting at `pos`. The
+    Vector velocity record (0x10) is the only one without a size field.
+    """
+    if buf[pos + 1] == 16:
+        return 24
+    return 2 * struct.unpack_from(endian + "H", buf, pos + 2)[0]
+
+
+def _create_index(infile, endian):
+    """
+    Walk the records of a classic Nortek file and return the byte
+    position, ID and size of each complete record.
+
+    The walk stops at the first invalid sync byte, or at a record that
+    runs past the end of the file.
+    """
+    print("Indexing {}...".format(infile), end="")
+    buf = np.memmap(_abspath(infile), dtype=np.uint8, mode="r")
+    fsize = len(buf)
+    pos = 0
+    index = []
+    while pos + 4 <= fsize and buf[pos] == 165:
+        nbyte = _record_size(buf, pos, endian)
+        if nbyte < 4 or pos + nbyte > fsize:
+            break
+        index.append((pos, buf[pos + 1], nbyte))
+        pos += nbyte
+    del buf
+    print(" Done.")
+    return np.array(index, dtype=_index_dtype)
+
+
+def get_index(infile, endian="<", rebuild=False):
+    """
+    This function reads (and if necessary creates) classic Nortek
+    .index files
+
+    Parameters
+    ----------
+    infile: str
+      Path and filename of the Nortek datafile, not including ".index"
+    endian: str
+      Byte order of the datafile, '<' or '>'. Default = '<'
+    rebuild: bool
+      If true, ignore existing .index file and create a new one
+
+    Returns
+    -------
+    out: numpy.ndarray
+      Structured array of the byte position ('pos'), ID ('ID') and
+      size ('nbyte') of each record in the file. If the .index file
+      cannot be written, the index is only kept in memory.
+    """
+
+    return _get_index(
+        infile,
+        lambda fname: _create_index(fname, endian),
+        _index_dtype,
+        _index_version,
+        rebuild=rebuild,
+    )
+
+
+def _checksum_failed(buf, pos, nbyte, endian):
+    """
+    Returns a boolean array that is True for each record of size
+    `nbyte` starting at `pos` whose checksum does not match.
+    """
+    inds = np.asarray(pos, dtype=np.int64)[:, None] + np.arange(nbyte)
+    words = np.ascontiguousarray(buf[inds]).view(endian + "u2").astype(np.int64)
+    csum = (words[:, :-1].sum(axis=1) + 46476) % 65536
+    return csum != words[:, -1]
+
+
+def _rd_time_bulk(bcd):
+    """
+    Vectorized version of :func:`rd_time`.
+
+    Parameters
+    ----------
+    bcd : numpy.ndarray (6, n)
+      BCD-encoded minute, second, day, hour, year and month of each
+      timestamp.
+
+    Returns
+    -------
+    numpy.ndarray
+      The epoch time of each timestamp. Invalid timestamps are NaN.
+    """
+
+    bcd = np.minimum(np.asarray(bcd, dtype=np.int64), 153)
+    mi, sc, dy, hr, yr, mo = (bcd & 15) + 10 * (bcd >> 4)
+    yr = np.where(yr > 100, yr, yr + 1900 + 100 * (yr < 90))
+    good = (mo >= 1) & (mo <= 12) & (dy >= 1) & (hr < 24) & (mi < 60) & (sc < 60)
+    # First day of each month, as days since 1970-01-01
+    month = ((yr - 1970) * 12 + np.where(good, mo, 1) - 1).astype("datetime64[M]")
+    day0 = month.astype("datetime64[D]").astype(np.int64)
+    good &= dy <= (month + 1).astype("datetime64[D]").astype(np.int64) - day0
+    out = ((day0 + dy - 1) * 86400 + hr * 3600 + mi * 60 + sc).astype(np.float64)
+    out[~good] = np.nan
+    return out
@@ -21,6 +21,7 @@ def read_rdi(
     debug_level=-1,
     vmdas_search=False,
     winriver=False,
+    rebuild_index=False,
     **kwargs,
 ) -> xr.Dataset:
     """
@@ -43,6 +44,9 @@ def read_rdi(
     winriver : bool
       If file is winriver or not. Automatically set by dolfyn, this is helpful
       for debugging. Default = False
+    rebuild_index : bool
+      Force rebuild of dolfyn-written datafile index. Useful for code updates.
+      Default = False
 
     Returns
     -------
@@ -65,7 +69,11 @@ def read_rdi(
     # Reads into a dictionary of dictionaries using netcdf naming conventions
     # Should be easier to debug
     rdr = _RDIReader(
-        filename, debug_level=debug_level, vmdas_search=vmdas_search, winriver=winriver
+        filename,
+        debug_level=debug_level,
+        vmdas_search=vmdas_search,
+        winriver=winriver,
+        rebuild_index=rebuild_index,
     )
     datNB, datBB = rdr.load_data(nens=nens)
 
@@ -160,13 +168,21 @@ def _set_rdi_declination(dat, fname, inplace):
 
 class _RDIReader:
     def __init__(
-        self, fname, navg=1, debug_level=-1, vmdas_search=False, winriver=False
+        self,
+        fname,
+        navg=1,
+        debug_level=-1,
+        vmdas_search=False,
+        winriver=False,
+        rebuild_index=False,
     ):
         self.fname = base._abspath(fname)
         print("\nReading file {} ...".format(fname))
         self._debug_level = debug_level
         self._vmdas_search = vmdas_search
         self._winrivprob = winriver
+        self._rebuild_index = rebuild_index
+        self._bulk = False
         self._vm_source = 0
         self._pos = 0
         self.progress = 0
@@ -276,9 +292,13 @@ class _RDIReader:
 
     def load_data(self, nens=None):
         """Main function run after reader class is initiated."""
+        self._bulk = self.check_index()
         if nens is None:
+            if self._bulk:
+                # The index holds the exact number of ensembles
+                self._nens = len(self._index)
             # Attempt to overshoot WinRiver2 or *Pro filesize
-            if (self.cfg["coord_sys"] == "ship") or (
+            elif (self.cfg["coord_sys"] == "ship") or (
                 self.cfg["inst_model"]
                 in [
                     "RiverPro",
@@ -298,10 +318,22 @@ class _RDIReader:
             logging.info("  %d ensembles will be produced.\n" % self._nens)
         self.init_data()
 
+        # Start position, clock and number of each ensemble, used to
+        # decode profiles and timestamps in bulk after the loop
+        ens_pos = np.zeros(self._nens, dtype=np.int64)
+        clocks = [
+            np.zeros((7, self._nens), dtype=np.int64) for _ in range(1 + self._bb)
+        ]
+        numbers = np.zeros(self._nens, dtype=np.int64)
+        n_read = self._nens
         for iens in range(self._nens):
+            if self._bulk and iens < len(self._index):
+                self.f.seek(int(self._index["pos"][iens]), 0)
             if not self.read_buffer():
                 self.remove_end(iens)
+                n_read = iens
                 break
+            ens_pos[iens] = self._startpos
             self.ensemble.clean_data()
             if self._bb:
                 self.ensembleBB.clean_data()
@@ -315,31 +347,31 @@ class _RDIReader:
                 datl += [self.outdBB]
                 cfgl += [self.cfgbb]
 
-            for var, en, dat in zip(vars, ens, datl):
+            for var, en, dat, clock in zip(vars, ens, datl, clocks):
                 for nm in var:
+                    if self._bulk and nm in self._bulk_vars:
+                        continue
                     dat = self.save_profiles(dat, nm, en, iens)
                 # reset flag after all variables run
                 self.n_cells_diff = 0
 
                 # Set clock
-                clock = en.rtc[:, :]
-                if clock[0, 0] < 100:
-                    clock[0, :] += defs.century
-                try:
-                    dates = tmlib.date2epoch(
-                        tmlib.datetime(
-                            *clock[:6, 0], microsecond=int(float(clock[6, 0]) * 10000)
-                        )
-                    )[0]
-                except ValueError:
-                    warnings.warn(
-                        "Invalid time stamp in ping {}.".format(
-                            int(self.ensemble.number[0])
-                        )
-                    )
-                    dat["coords"]["time"][iens] = np.nan
-                else:
-                    dat["coords"]["time"][iens] = np.median(dates)
+                rtc = en.rtc[:, :]
+                if rtc[0, 0] < 100:
+                    rtc[0, :] += defs.century
+                clock[:, iens] = rtc[:, 0]
+            numbers[iens] = self.ensemble.number[0]
+
+        # Convert the timestamps of all ensembles at once
+        for dat, clock in zip(datl, clocks):
+            time = lib._rtc2epoch(clock[:, :n_read])
+            for ib in np.nonzero(np.isnan(time))[0]:
+                warnings.warn("Invalid time stamp in ping {}.".format(numbers[ib]))
+            n = min(n_read, len(dat["coords"]["time"]))
+            dat["coords"]["time"][:n] = time[:n]
+
+        if self._bulk:
+            self.read_bulk(ens_pos[:n_read])
 
         # Finalize dataset (runs through both nb and bb)
         for dat, cfg in zip(datl, cfgl):
@@ -351,6 +383,60 @@ class _RDIReader:
         datbb = self.outdBB if self._bb else None
         return self.outd, datbb
 
+    def check_index(self):
+        """
+        Load (or create) the ensemble index and check if the fixed-layout
+        profile blocks (velocity, correlation, amplitude and percent good)
+        can be decoded for all ensembles at once after the main loop.
+
+        This requires a single-profile file with one ping per ensemble
+        and the same number of cells in every ensemble. WinRiver and
+        VMDAS files, whose layout can change between ensembles, are read
+        ensemble-by-ensemble, as are all files when debugging.
+        """
+        if (
+            self.n_avg != 1
+            or self._debug_level > -1
+            or self._bb
+            or self._winrivprob
+            or self._vmdas_search
+            or (self.cfg["coord_sys"] == "ship")
+            or (self.cfg["inst_model"] in ["RiverPro", "StreamPro"])
+        ):
+            return False
+
+        self._index = lib.get_index(self.fname, rebuild=self._rebuild_index)
+        if not len(self._index):
+            return False
+        self._buf = np.memmap(self.fname, dtype=np.uint8, mode="r")
+        pos = self._index["pos"].astype(np.int64)
+        # The fixed leader is the first data type of every ensemble
+        fixed = pos + lib._gather(self._buf, pos + 6, "<u2")
+        if np.any(lib._gather(self._buf, fixed, "<u2") != 0):
+            return False
+        # Number of cells, from the fixed leader
+        if np.any(self._buf[fixed + 9] != self.cfg["n_cells"]):
+            return False
+        self._bulk_vars = [lib._bulk_ids[id][0] for id in lib._bulk_ids]
+        return True
+
+    def read_bulk(self, ens_pos):
+        """
+        Decode the fixed-layout profile blocks of all ensembles,
+        starting at the byte positions `ens_pos`, and save them to the
+        dataset.
+        """
+        ids = {
+            id: self.cfg["n_cells"]
+            for id in lib._bulk_ids
+            if lib._bulk_ids[id][0] in self.vars_read
+        }
+        if len(ens_pos):
+            bulk = lib._read_bulk(self._buf, ens_pos, ids)
+            for nm in bulk:
+                lib._get(self.outd, nm)[..., : len(ens_pos)] = bulk[nm]
+        del self._buf
+
     def init_data(self):
         """Initiate data structure"""
         outd = {
@@ -419,6 +505,7 @@ class _RDIReader:
             if not self.search_buffer():
                 return False
             startpos = fd.tell() - 2
+            self._startpos = startpos
             self.read_hdrseg()
             if self._debug_level > -1:
                 logging.info("Read Header", hdr)
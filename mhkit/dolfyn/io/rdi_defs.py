@@ -589,6 +589,10 @@ def read_vel(rdr, bb=0):
     """Read water velocity block"""
     ens, cfg, tg = switch_profile(rdr, bb)
     rdr.vars_read += ["vel" + tg]
+    if rdr._bulk and bb == 0:
+        # Decoded for all ensembles at once in _RDIReader.read_bulk
+        rdr._nbyte = 2
+        return
     n_cells = cfg["n_cells" + tg]
 
     k = ens.k
@@ -603,6 +607,10 @@ def read_corr(rdr, bb=0):
     """Read acoustic signal correlation block"""
     ens, cfg, tg = switch_profile(rdr, bb)
     rdr.vars_read += ["corr" + tg]
+    if rdr._bulk and bb == 0:
+        # Decoded for all ensembles at once in _RDIReader.read_bulk
+        rdr._nbyte = 2
+        return
     n_cells = cfg["n_cells" + tg]
 
     k = ens.k
@@ -618,6 +626,10 @@ def read_amp(rdr, bb=0):
     """Read acoustic signal amplitude block"""
     ens, cfg, tg = switch_profile(rdr, bb)
     rdr.vars_read += ["amp" + tg]
+    if rdr._bulk and bb == 0:
+        # Decoded for all ensembles at once in _RDIReader.read_bulk
+        rdr._nbyte = 2
+        return
     n_cells = cfg["n_cells" + tg]
 
     k = ens.k
@@ -633,6 +645,10 @@ def read_prcnt_gd(rdr, bb=0):
     """Read acoustic signal 'percent good' block"""
     ens, cfg, tg = switch_profile(rdr, bb)
     rdr.vars_read += ["prcnt_gd" + tg]
+    if rdr._bulk and bb == 0:
+        # Decoded for all ensembles at once in _RDIReader.read_bulk
+        rdr._nbyte = 2
+        return
     n_cells = cfg["n_cells" + tg]
 
     ens["prcnt_gd" + tg][:n_cells, :, ens.k] = np.array(
@@ -3,6 +3,7 @@ from struct import unpack
 from os.path import expanduser
 
 from .rdi_defs import data_defs
+from .base import _abspath, _gather, _get_index
 
 
 class bin_reader:
@@ -201,3 +202,176 @@ def _get_size(name, n=None, ncell=0):
     if n is None:
         return tuple(sz)
     return tuple(sz + [n])
+
+
+# This is the data-type of the index file.
+# This must match what is returned by the _create_index function.
+_index_version = 1
+_index_dtype = np.dtype([("pos", np.uint64), ("nbyte", np.uint16)])
+
+# Fixed-layout profile blocks that are decoded for all ensembles at once:
+# ID: (variable name, raw data type, scale factor)
+_bulk_ids = {
+    256: ("vel", "<i2", 0.001),
+    512: ("corr", "u1", None),
+    768: ("amp", "u1", None),
+    1024: ("prcnt_gd", "u1", None),
+}
+
+
+def _find_7f7f(buf, blocksize=2**24):
+    """
+    Return the byte positions of every 0x7F7F (ensemble header ID) in
+    `buf`, searching `blocksize` bytes at a time.
+    """
+    out = []
+    for i0 in range(0, max(buf.size - 1, 0), blocksize):
+        blk = buf[i0 : i0 + blocksize + 1]
+        out.append(np.flatnonzero((blk[:-1] == 127) & (blk[1:] == 127)) + i0)
+    if not out:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(out)
+
+
+def _create_index(infile):
+    """
+    Scan a TRDI file for ensembles with a valid checksum and return their
+    byte positions and sizes.
+    """
+    print("Indexing {}...".format(infile), end="")
+    buf = np.memmap(_abspath(infile), dtype=np.uint8, mode="r")
+    fsize = buf.size
+    hits = _find_7f7f(buf)
+    index = []
+    i = 0
+    while i < len(hits):
+        pos = int(hits[i])
+        if pos + 4 <= fsize:
+            nbyte = int(buf[pos + 2]) | (int(buf[pos + 3]) << 8)
+            end = pos + nbyte
+            if nbyte > 4 and end + 2 <= fsize:
+                checksum = int(buf[pos:end].sum(dtype=np.uint64)) & 0xFFFF
+                if checksum == int(buf[end]) | (int(buf[end + 1]) << 8):
+                    index.append((pos, nbyte))
+                    # Jump to the first header after this ensemble
+                    i = int(np.searchsorted(hits, end + 2))
+                    continue
+        i += 1
+    del buf
+    print(" Done.")
+    return np.array(index, dtype=_index_dtype)
+
+
+def get_index(infile, rebuild=False):
+    """
+    This function reads (and if necessary creates) TRDI .index files
+
+    Parameters
+    ----------
+    infile: str
+      Path and filename of the TRDI datafile, not including ".index"
+    rebuild: bool
+      If true, ignore existing .index file and create a new one
+
+    Returns
+    -------
+    out: numpy.ndarray
+      Structured array of the byte position ('pos') and size ('nbyte')
+      of each ensemble in the file. If the .index file cannot be
+      written, the index is only kept in memory.
+    """
+
+    return _get_index(
+        infile, _create_index, _index_dtype, _index_version, rebuild=rebuild
+    )
+
+
+def _rtc2epoch(rtc):
+    """
+    Convert TRDI real-time-clock values to epoch time.
+
+    Parameters
+    ----------
+    rtc : numpy.ndarray (7, n)
+      Year, month, day, hour, minute, second and hundredths of a second
+
+    Returns
+    -------
+    time : numpy.ndarray
+      Seconds since 1/1/1970 00:00:00. Invalid timestamps are NaN.
+    """
+
+    yr, mo, dy, hr, mi, sc, hs = np.asarray(rtc, dtype=np.int64)
+    good = (
+        (yr >= 1)
+        & (yr <= 9999)
+        & (mo >= 1)
+        & (mo <= 12)
+        & (dy >= 1)
+        & (hr < 24)
+        & (mi < 60)
+        & (sc < 60)
+        & (hs < 100)
+    )
+    # First day of each month, as days since 1970-01-01
+    month = ((np.where(good, yr, 1970) - 1970) * 12 + np.where(good, mo, 1) - 1).astype(
+        "datetime64[M]"
+    )
+    day0 = month.astype("datetime64[D]").astype(np.int64)
+    good &= dy <= (month + 1).astype("datetime64[D]").astype(np.int64) - day0
+
+    sec = (day0 + dy - 1) * 86400 + hr * 3600 + mi * 60 + sc
+    out = (sec * 10**6 + hs * 10**4) / 10**6
+    out[~good] = np.nan
+    return out
+
+
+def _read_bulk(buf, ens_pos, ids):
+    """
+    Decode the fixed-layout profile blocks of every ensemble at once.
+
+    Parameters
+    ----------
+    buf : numpy.ndarray
+      uint8 (memory-mapped) view of the file
+    ens_pos : numpy.ndarray
+      Byte position of the start (0x7F7F) of each ensemble
+    ids : dict
+      {ID: n_cells} of the data blocks to decode
+
+    Returns
+    -------
+    out : dict
+      {variable name: array of shape (n_cells, 4, len(ens_pos))}.
+      Ensembles that do not contain a block are left as NaN (or 0).
+    """
+
+    ens_pos = np.asarray(ens_pos, dtype=np.int64)
+    n_ens = len(ens_pos)
+    ndat = buf[ens_pos + 5].astype(np.int64)
+    out = {}
+    for id, n_cells in ids.items():
+        nm, dtype, scale = _bulk_ids[id]
+        dtype = np.dtype(dtype)
+        arr = np.zeros((n_ens, n_cells * 4), dtype=dtype)
+        blk_pos = np.full(n_ens, -1, dtype=np.int64)
+        # Search the data-type offsets of the ensembles for this ID,
+        # grouping ensembles with the same number of data types
+        for nd in np.unique(ndat):
+            inds = np.nonzero(ndat == nd)[0]
+            offsets = _gather(buf, ens_pos[inds] + 6, "<u2", nd).astype(np.int64)
+            bpos = ens_pos[inds, None] + offsets
+            blk_ids = _gather(buf, bpos.ravel(), "<u2").reshape(bpos.shape)
+            has_id = blk_ids == id
+            found = has_id.any(axis=1)
+            blk_pos[inds[found]] = bpos[found, np.argmax(has_id[found], axis=1)]
+        good = blk_pos >= 0
+        arr[good] = _gather(buf, blk_pos[good] + 2, dtype, n_cells * 4)
+        dat = arr.reshape(n_ens, n_cells, 4).transpose(1, 2, 0)
+        if scale is not None:
+            raw = dat
+            dat = (raw * scale).astype(data_defs[nm][2])
+            dat[raw == np.iinfo(dtype).min] = np.nan
+            dat[..., ~good] = np.nan
+        out[nm] = dat
+    return out
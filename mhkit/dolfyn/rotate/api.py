@@ -2,7 +2,7 @@ from . import vector as r_vec
 from . import awac as r_awac
 from . import signature as r_sig
 from . import rdi as r_rdi
-from .base import _make_model
+from .base import _make_model, _set_coords, _check_rotate_vars
 import numpy as np
 import xarray as xr
 import warnings
@@ -21,8 +21,19 @@ rot_module_dict = {
     "rdi": r_rdi,
 }
 
+# Non-rotated variables read by the instrument rotation functions
+_rotate_aux_vars = [
+    "orientmat",
+    "heading",
+    "pitch",
+    "roll",
+    "orientation_down",
+    "beam2inst_orientmat",
+    "inst2head_rotmat",
+]
 
-def rotate2(ds, out_frame="earth", inplace=True):
+
+def rotate2(ds, out_frame="earth", inplace=True, chunk_size=None):
     """
     Rotate a dataset to a new coordinate system.
 
@@ -35,6 +46,13 @@ def rotate2(ds, out_frame="earth", inplace=True):
     inplace : bool
       When True ``ds`` is modified. When False a copy is returned.
       Default = True
+    chunk_size : int (optional)
+      Number of timesteps to rotate at once. When set, the full chain of
+      rotations is applied to one block of timesteps at a time and the
+      result is written back into the existing arrays, which bounds the
+      memory needed to rotate long records. Dask-backed datasets are
+      always rotated blockwise (lazily), using `chunk_size` or their
+      existing chunks along 'time'. Default = None
 
     Returns
     -------
@@ -111,21 +129,129 @@ def rotate2(ds, out_frame="earth", inplace=True):
     else:
         reverse = True
 
-    while ds.coord_sys.lower() != out_frame.lower():
-        csin = ds.coord_sys
-        if csin == "ship":
-            csin = "inst"
-        inow = rc.index(csin)
-        if reverse:
-            func = getattr(rmod, "_" + rc[inow - 1] + "2" + rc[inow])
-        else:
-            func = getattr(rmod, "_" + rc[inow] + "2" + rc[inow + 1])
-        ds = func(ds, reverse=reverse)
+    # The chain of rotation functions between the two frames
+    if reverse:
+        funcs = [
+            getattr(rmod, "_" + rc[inow - 1] + "2" + rc[inow])
+            for inow in range(iframe_in, iframe_out, -1)
+        ]
+    else:
+        funcs = [
+            getattr(rmod, "_" + rc[inow] + "2" + rc[inow + 1])
+            for inow in range(iframe_in, iframe_out)
+        ]
+
+    if funcs and (chunk_size is not None or ds.chunks):
+        rotate_vars = _check_rotate_vars(ds, None)
+        ds = _rotate_chunked(ds, funcs, reverse, rotate_vars, chunk_size)
+        ds = _set_coords(ds, rc[iframe_out])
+    else:
+        for func in funcs:
+            ds = func(ds, reverse=reverse)
 
     if not inplace:
         return ds
 
 
+def _time_aligned(ds, rotate_vars):
+    """
+    Returns a dataset of the variables used in the rotation functions,
+    with all time dimensions the length of 'time' (e.g. 'time_b5')
+    renamed to 'time', and the list of those dimensions.
+
+    The rotation functions pair these variables with the orientation
+    matrix by index, so they can be sliced along a single dimension.
+    """
+
+    n_time = ds.sizes["time"]
+    tdims = [d for d in ds.dims if d.startswith("time") and ds.sizes[d] == n_time]
+
+    def _align(var):
+        dims = tuple("time" if d in tdims else d for d in var.dims)
+        return xr.Variable(dims, var.data, var.attrs)
+
+    names = list(rotate_vars) + [nm for nm in _rotate_aux_vars if nm in ds]
+    coords = {
+        ky: _align(ds[ky].variable)
+        for ky in ds.coords
+        if ky == "time" or not set(ds[ky].dims) & set(tdims)
+    }
+    data_vars = {nm: _align(ds[nm].variable) for nm in names if nm not in coords}
+    return xr.Dataset(data_vars, coords=coords, attrs=dict(ds.attrs)), tdims
+
+
+def _rotate_block(blk, funcs, reverse, rotate_vars):
+    """
+    Apply the chain of rotation functions `funcs` to the block `blk`
+    and return the rotated variables in their input data type.
+    """
+
+    blk = blk.copy(deep=False)
+    dtypes = {}
+    for nm in rotate_vars:
+        dtypes[nm] = blk[nm].dtype
+        blk[nm] = blk[nm].copy(deep=True)
+    for func in funcs:
+        blk = func(blk, reverse=reverse)
+    out = blk[rotate_vars].drop_vars(
+        [ky for ky in ["dir", "dirIMU"] if ky in blk.coords]
+    )
+    for nm in rotate_vars:
+        out[nm] = out[nm].astype(dtypes[nm])
+    return out
+
+
+def _rotate_chunked(ds, funcs, reverse, rotate_vars, chunk_size=None):
+    """
+    Rotate the `rotate_vars` of `ds` through the chain of rotation
+    functions `funcs`, one block of timesteps at a time.
+
+    In-memory variables are overwritten block by block. Dask-backed
+    variables are replaced by lazily rotated arrays.
+    """
+
+    for nm in rotate_vars:
+        # Rotated integer data (e.g. raw magnetometer counts) becomes float
+        dtype = np.result_type(ds[nm].dtype, np.float32)
+        if ds[nm].dtype != dtype:
+            ds[nm] = ds[nm].astype(dtype)
+
+    is_dask = any(ds[nm].chunks is not None for nm in rotate_vars)
+    if not is_dask:
+        for nm in rotate_vars:
+            # Make sure the data is in memory and writeable before the loop
+            var = ds[nm].variable.load()
+            if not var.values.flags.writeable:
+                var.values = var.values.copy()
+
+    sub, tdims = _time_aligned(ds, rotate_vars)
+
+    if is_dask:
+        if chunk_size is None:
+            chunk_size = ds[rotate_vars[0]].chunksizes.get("time", -1)
+        sub = sub.chunk({"time": chunk_size})
+        template = sub[rotate_vars].drop_vars(
+            [ky for ky in ["dir", "dirIMU"] if ky in sub.coords]
+        )
+        out = sub.map_blocks(
+            _rotate_block, args=[funcs, reverse, rotate_vars], template=template
+        )
+        for nm in rotate_vars:
+            ds[nm].data = out[nm].data
+        return ds
+
+    if chunk_size is None:
+        chunk_size = ds.sizes["time"]
+    for i0 in range(0, ds.sizes["time"], chunk_size):
+        slc = slice(i0, i0 + chunk_size)
+        out = _rotate_block(sub.isel(time=slc), funcs, reverse, rotate_vars)
+        for nm in rotate_vars:
+            idx = tuple(slc if d in tdims else slice(None) for d in ds[nm].dims)
+            ds[nm].values[idx] = out[nm].values
+
+    return ds
+
+
 def calc_principal_heading(vel, tidal_mode=True):
     """
     Compute the principal angle of the horizontal velocity.
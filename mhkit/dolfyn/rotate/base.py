@@ -232,32 +232,20 @@ def euler2orient(heading, pitch, roll, units="degree"):
     sp = np.sin(pitch)
     cr = np.cos(roll)
     sr = np.sin(roll)
-    zero = np.zeros_like(sr)
-    one = np.ones_like(sr)
-
-    H = np.array(
-        [
-            [ch, sh, zero],
-            [-sh, ch, zero],
-            [zero, zero, one],
-        ]
-    )
-    P = np.array(
-        [
-            [cp, zero, -sp],
-            [zero, one, zero],
-            [sp, zero, cp],
-        ]
-    )
-    R = np.array(
-        [
-            [one, zero, zero],
-            [zero, cr, sr],
-            [zero, -sr, cr],
-        ]
-    )
-
-    return np.einsum("ij...,jk...,kl...->il...", R, P, H)
+    # Closed form of the R @ P @ H matrix product, where H, P and R are
+    # the transposed rotations about z, y and x, respectively
+    omat = np.empty((3, 3) + np.shape(sr), dtype=np.result_type(sr, np.float64))
+    omat[0, 0] = cp * ch
+    omat[0, 1] = cp * sh
+    omat[0, 2] = -sp
+    omat[1, 0] = sr * sp * ch - cr * sh
+    omat[1, 1] = sr * sp * sh + cr * ch
+    omat[1, 2] = sr * cp
+    omat[2, 0] = cr * sp * ch + sr * sh
+    omat[2, 1] = cr * sp * sh - sr * ch
+    omat[2, 2] = cr * cp
+
+    return omat
 
 
 def orient2euler(omat):
@@ -301,7 +289,7 @@ def orient2euler(omat):
     )
 
 
-def quaternion2orient(quaternions):
+def quaternion2orient(quaternions, dtype=np.float64):
     """
     Calculate orientation from Nortek AHRS quaternions, where q = [W, X, Y, Z]
     instead of the standard q = [X, Y, Z, W] = [q1, q2, q3, q4]
@@ -310,10 +298,13 @@ def quaternion2orient(quaternions):
     ----------
     quaternions : xarray.DataArray
       Quaternion dataArray from the raw dataset
+    dtype : numpy.dtype
+      Data type of the returned orientation matrix. Use `numpy.float32`
+      to halve the memory footprint of long records. Default = numpy.float64
 
     Returns
     -------
-    orientmat : numpy.ndarray
+    orientmat : xarray.DataArray
       The earth2inst rotation maxtrix as calculated from the quaternions
 
     See Also
@@ -321,22 +312,15 @@ def quaternion2orient(quaternions):
     scipy.spatial.transform.Rotation
     """
 
-    omat = type(quaternions)(np.empty((3, 3, quaternions.time.size)))
-    omat = omat.rename({"dim_0": "earth", "dim_1": "inst", "dim_2": "time"})
-
-    for i in range(quaternions.time.size):
-        r = R.from_quat(
-            [
-                quaternions.isel(q=1, time=i),
-                quaternions.isel(q=2, time=i),
-                quaternions.isel(q=3, time=i),
-                quaternions.isel(q=0, time=i),
-            ]
-        )
-        omat[..., i] = r.as_matrix()
-
-    # quaternions in inst2earth reference frame, need to rotate to earth2inst
-    omat.values = np.rollaxis(omat.values, 1)
+    # Reorder from [W, X, Y, Z] to scipy's scalar-last [X, Y, Z, W]
+    quat = quaternions.transpose("time", "q").values[:, [1, 2, 3, 0]]
+    r = R.from_quat(quat)
+
+    # quaternions in inst2earth reference frame, need to rotate to earth2inst,
+    # i.e. omat[i, j, n] = r.as_matrix()[n, j, i]
+    omat = np.empty((3, 3, quaternions.time.size), dtype=dtype)
+    omat[:] = np.transpose(r.as_matrix(), (2, 1, 0))
+    omat = xr.DataArray(omat, dims=["earth", "inst", "time"])
 
     earth = xr.DataArray(
         ["E", "N", "U"],
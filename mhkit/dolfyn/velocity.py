@@ -27,7 +27,7 @@ class Velocity:
     ########
     # Major components of the dolfyn-API
 
-    def rotate2(self, out_frame="earth", inplace=True):
+    def rotate2(self, out_frame="earth", inplace=True, chunk_size=None):
         """
         Rotate the dataset to a new coordinate system.
 
@@ -40,6 +40,11 @@ class Velocity:
           When True the existing data object is modified. When False
           a copy is returned. Default = True
 
+        chunk_size : int (optional)
+          Number of timesteps to rotate at once, to bound memory use
+          for long records. Dask-backed datasets are always rotated
+          blockwise. Default = None
+
         Returns
         -------
         ds : xarray.Dataset or None
@@ -61,7 +66,7 @@ class Velocity:
           the principal direction.
         """
 
-        return rotate2(self.ds, out_frame, inplace)
+        return rotate2(self.ds, out_frame, inplace, chunk_size)
 
     def set_declination(self, declin, inplace=True):
         """
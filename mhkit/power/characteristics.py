@@ -19,22 +19,135 @@ Functions:
     (line-to-neutral or line-to-line).
 """
 
-from typing import Union
+from typing import Union, Optional, Tuple
 import pandas as pd
 import xarray as xr
 import numpy as np
 from scipy.signal import hilbert
+from scipy.fft import next_fast_len
 from mhkit.utils import convert_to_dataset
 
 
+def _tapered_analytic_signal(
+    segment: np.ndarray, taper: np.ndarray, edges: Tuple[bool, bool], overlap: int
+) -> np.ndarray:
+    """
+    Analytic signal of a segment of the record, transformed along the first
+    axis
+
+    Parameters
+    -----------
+    segment: numpy array
+        Samples of all signals, modified in place by the taper
+    taper: numpy array
+        Window whose first and second halves taper the head and tail
+    edges: tuple of bool
+        Whether the head and tail of the segment are tapered, i.e. are not
+        the ends of the record
+    overlap: int
+        Number of samples by which the segment was extended on either side
+
+    Returns
+    ---------
+    analytic: numpy array
+        Analytic signal of the segment, including any zero padding
+    """
+    n_taper = len(taper) // 2
+    if edges[0]:
+        segment[:n_taper] *= taper[:n_taper]
+    if edges[1]:
+        segment[len(segment) - n_taper :] *= taper[n_taper:]
+    n_fft = len(segment)
+    if overlap > 0:
+        # Zero pad to separate the segment from its periodic copies
+        n_fft = next_fast_len(n_fft + overlap)
+
+    return hilbert(segment, N=n_fft, axis=0)
+
+
+def _chunked_instantaneous_frequency(
+    measured_voltage: xr.Dataset,
+    time_dimension: str,
+    d_t: np.ndarray,
+    chunk_size: Optional[int],
+    overlap: Optional[int],
+) -> np.ndarray:
+    """
+    Instantaneous frequency of all signals of a Dataset, calculated one
+    overlapping segment at a time (overlap-save). See
+    `instantaneous_frequency`.
+
+    Parameters
+    -----------
+    measured_voltage: xarray Dataset
+        Measured voltage (V) indexed by time
+    time_dimension: string
+        Name of the dimension corresponding to time
+    d_t: numpy array
+        Time step (s) between consecutive samples
+    chunk_size: int or None
+        Number of samples per segment. None transforms the full record.
+    overlap: int or None
+        Number of samples by which segments are extended on either side.
+        None defaults to chunk_size // 4.
+
+    Returns
+    ---------
+    f_instantaneous: numpy array (time, signal)
+        Frequency (Hz) of each signal between consecutive samples
+    """
+    names = list(measured_voltage.data_vars)
+    n_samples = measured_voltage.sizes[time_dimension]
+    if chunk_size is None:
+        chunk_size = n_samples
+        overlap = 0
+    elif overlap is None:
+        overlap = chunk_size // 4
+    taper = np.hanning(2 * (overlap // 2))[:, None]
+
+    f_instantaneous = np.empty((n_samples - 1, len(names)))
+    for start in range(0, n_samples - 1, chunk_size):
+        stop = min(start + chunk_size, n_samples - 1)
+        seg_start = max(start - overlap, 0)
+        seg_stop = min(stop + 1 + overlap, n_samples)
+
+        segment = measured_voltage.isel({time_dimension: slice(seg_start, seg_stop)})
+        segment = np.stack([segment[var].to_numpy() for var in names], axis=-1).astype(
+            float
+        )
+        # Taper segment edges that are not the ends of the record
+        analytic = _tapered_analytic_signal(
+            segment, taper, (seg_start > 0, seg_stop < n_samples), overlap
+        )[start - seg_start : stop + 1 - seg_start]
+        # Phase difference between consecutive samples
+        f_instantaneous[start:stop] = (
+            np.angle(analytic[1:] * analytic[:-1].conj())
+            / (2.0 * np.pi)
+            / d_t[start:stop, None]
+        )
+
+    return f_instantaneous
+
+
 def instantaneous_frequency(
     measured_voltage: Union[pd.Series, pd.DataFrame, xr.DataArray, xr.Dataset],
     time_dimension: str = "",
     to_pandas: bool = True,
+    chunk_size: Optional[int] = None,
+    overlap: Optional[int] = None,
 ) -> Union[pd.DataFrame, xr.Dataset]:
     """
     Calculates instantaneous frequency of measured voltage
 
+    By default the analytic signal is calculated with a single Hilbert
+    transform over the full record. For long records, `chunk_size` limits
+    memory use by transforming overlapping segments of all signals together
+    (overlap-save): each segment is extended by `overlap` samples on either
+    side, the outer half of which is tapered to zero, and only the frequency
+    of the central `chunk_size` samples is kept. The difference from the
+    full transform decreases with `overlap`, except near the ends of the
+    record where both are affected by the edges of the record.
+
     Parameters
     -----------
     measured_voltage: pandas Series, pandas DataFrame, xarray DataArray,
@@ -47,6 +160,13 @@ def instantaneous_frequency(
     to_pandas: bool (Optional)
         Flag to save output to pandas instead of xarray. Default = True.
 
+    chunk_size: int (Optional)
+        Number of samples per segment. Default = None (full record).
+
+    overlap: int (Optional)
+        Number of samples by which segments are extended on either side.
+        Default = chunk_size // 4.
+
     Returns
     ---------
     frequency: pandas DataFrame or xarray Dataset
@@ -66,6 +186,10 @@ def instantaneous_frequency(
         raise TypeError(
             f"time_dimension must be of type bool. Got: {type(time_dimension)}"
         )
+    if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+        raise ValueError(f"chunk_size must be a positive integer. Got: {chunk_size}")
+    if overlap is not None and (not isinstance(overlap, int) or overlap < 0):
+        raise ValueError(f"overlap must be a non-negative integer. Got: {overlap}")
 
     # Convert input to xr.Dataset
     measured_voltage = convert_to_dataset(measured_voltage, "data")
@@ -89,17 +213,16 @@ def instantaneous_frequency(
         time = measured_voltage[time_dimension]
     d_t = np.diff(time)
 
-    # Calculate frequency
-    frequency = xr.Dataset()
-    for var in measured_voltage.data_vars:
-        freq = hilbert(measured_voltage[var])
-        instantaneous_phase = np.unwrap(np.angle(freq))
-        f_instantaneous = np.diff(instantaneous_phase) / (2.0 * np.pi) * (1 / d_t)
+    # Calculate frequency of all signals together, one segment at a time
+    names = list(measured_voltage.data_vars)
+    f_instantaneous = _chunked_instantaneous_frequency(
+        measured_voltage, time_dimension, d_t, chunk_size, overlap
+    )
 
-        frequency = frequency.assign({var: (time_dimension, f_instantaneous)})
-        frequency = frequency.assign_coords(
-            {time_dimension: measured_voltage.coords[time_dimension].values[0:-1]}
-        )
+    frequency = xr.Dataset(
+        {var: (time_dimension, f_instantaneous[:, i]) for i, var in enumerate(names)},
+        coords={time_dimension: measured_voltage.coords[time_dimension].values[0:-1]},
+    )
 
     if to_pandas:
         frequency = frequency.to_pandas()
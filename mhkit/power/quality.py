@@ -27,6 +27,13 @@ Functions in this module include:
   power system. Interharmonics, which are frequencies that occur between the 
   fundamental and harmonic frequencies, can arise from various sources and 
   potentially lead to power quality issues.
+
+- windowed_harmonics: Calculates harmonics, harmonic subgroups and interharmonic
+  subgroups in every 10/12-cycle (200 ms) window of a time series, processing
+  long records in chunks of windows.
+
+- aggregate_harmonics: Aggregates windowed harmonics to 3-second or 10-minute
+  values.
 """
 
 from typing import Union
@@ -377,3 +384,307 @@ def interharmonics(
         interharmonic_groups = interharmonic_groups.to_pandas()
 
     return interharmonic_groups
+
+
+def _harmonic_window_spectra(
+    windows: np.ndarray, n_cycles: int, n_harmonics: int
+) -> np.ndarray:
+    """
+    Squared harmonic amplitudes of a block of analysis windows, padded with
+    zeros to cover every bin up to (but not including) harmonic
+    `n_harmonics`.
+
+    Parameters
+    ----------
+    windows: numpy.ndarray (window, sample)
+        Non-overlapping analysis windows of `n_cycles` fundamental periods
+    n_cycles: int
+        Number of fundamental periods per window (10 for 50 Hz, 12 for 60 Hz)
+    n_harmonics: int
+        Number of harmonic orders to cover, starting at 0 (DC)
+
+    Returns
+    -------
+    spectra: numpy.ndarray (window, harmonic, bin)
+        Squared amplitudes, reshaped so that the last axis holds the
+        `n_cycles` 5 Hz bins from each harmonic up to the next
+    """
+    n_samples = windows.shape[-1]
+    n_bins = n_harmonics * n_cycles
+    spectra = np.fft.rfft(windows, axis=-1)[:, :n_bins]
+    # Same scaling as `harmonics`
+    spectra = np.abs(spectra) * (2 / n_samples)
+    spectra **= 2
+    if spectra.shape[-1] < n_bins:
+        # Bins above the Nyquist frequency are zero
+        spectra = np.pad(spectra, ((0, 0), (0, n_bins - spectra.shape[-1])))
+
+    return spectra.reshape(len(windows), n_harmonics, n_cycles)
+
+
+def _group_harmonic_bins(spectra: np.ndarray) -> np.ndarray:
+    """
+    Groups the squared amplitudes of `_harmonic_window_spectra` into
+    harmonics, harmonic subgroups and interharmonic centred subgroups.
+
+    Parameters
+    ----------
+    spectra: numpy.ndarray (window, harmonic, bin)
+        Squared amplitudes returned by `_harmonic_window_spectra`
+
+    Returns
+    -------
+    groups: numpy.ndarray (3, window, harmonic)
+        Sums of the squared amplitudes of the harmonic bin, of the harmonic
+        subgroup and of the interharmonic centred subgroup
+    """
+    groups = np.empty((3,) + spectra.shape[:2])
+    groups[0] = spectra[:, :, 0]
+    groups[1] = spectra[:, :, 0] + spectra[:, :, 1]
+    # Last bin below each harmonic
+    groups[1, :, 1:] += spectra[:, :-1, -1]
+    groups[2] = spectra[:, :, 2:-1].sum(axis=-1)
+
+    return groups
+
+
+def _windowed_harmonic_groups(
+    signal: xr.DataArray,
+    n_samples: int,
+    n_cycles: int,
+    n_harmonics: int,
+    chunk_size: int,
+) -> np.ndarray:
+    """
+    Harmonic, harmonic subgroup and interharmonic centred subgroup amplitudes
+    of every complete window of `n_samples` samples of a signal. Windows are
+    transformed `chunk_size` at a time.
+
+    Parameters
+    ----------
+    signal: xarray DataArray
+        One-dimensional time-series of voltage [V] or current [A]
+    n_samples: int
+        Number of samples per window
+    n_cycles: int
+        Number of fundamental periods per window (10 for 50 Hz, 12 for 60 Hz)
+    n_harmonics: int
+        Number of harmonic orders to cover, starting at 0 (DC)
+    chunk_size: int
+        Number of windows transformed at once
+
+    Returns
+    -------
+    groups: numpy.ndarray (3, window, harmonic)
+        Harmonic, harmonic subgroup and interharmonic subgroup amplitudes
+    """
+    n_windows = signal.size // n_samples
+    groups = np.empty((3, n_windows, n_harmonics))
+    for start in range(0, n_windows, chunk_size):
+        stop = min(start + chunk_size, n_windows)
+        # Windows are a view of the chunk
+        windows = (
+            signal[start * n_samples : stop * n_samples]
+            .to_numpy()
+            .reshape(stop - start, n_samples)
+        )
+        groups[:, start:stop] = _group_harmonic_bins(
+            _harmonic_window_spectra(windows, n_cycles, n_harmonics)
+        )
+
+    return np.sqrt(groups, out=groups)
+
+
+def windowed_harmonics(
+    signal_data: Union[pd.Series, pd.DataFrame, xr.DataArray, xr.Dataset],
+    freq: Union[float, int],
+    grid_freq: int,
+    time_dimension: str = "",
+    chunk_size: int = 3000,
+) -> xr.Dataset:
+    """
+    Calculates harmonics, harmonic subgroups and interharmonic subgroups of
+    voltage or current in every 10/12-cycle window based on IEC 61000-4-7.
+
+    The time series is split into non-overlapping windows of 10 (50 Hz) or
+    12 (60 Hz) fundamental periods, i.e. 200 ms with a 5 Hz frequency
+    resolution. Windows are transformed `chunk_size` at a time, so that
+    long records (or dask-backed xarray input) are processed with bounded
+    memory. Samples that do not fill a complete window at the end of the
+    record are discarded.
+
+    For harmonic order h and N = 10 (50 Hz) or 12 (60 Hz) bins per
+    harmonic, the harmonic subgroup is the root-sum-square of bins
+    N*h-1 to N*h+1 and the interharmonic centred subgroup is the
+    root-sum-square of bins N*h+2 to N*h+N-2. Amplitudes are scaled as in
+    `harmonics`.
+
+    Parameters
+    ----------
+    signal_data: pandas Series, pandas DataFrame, xarray DataArray, or xarray Dataset
+        Time-series of voltage [V] or current [A]
+
+    freq: float or Int
+        Frequency of the time-series data [Hz]. Must be a multiple of 5 Hz, so
+        that each window holds a whole number of samples
+
+    grid_freq: int
+        Value indicating if the power supply is 50 or 60 Hz. Options = 50 or 60
+
+    time_dimension: string (optional)
+        Name of the xarray dimension corresponding to time. If not supplied,
+        defaults to the first dimension. Does not affect pandas input.
+
+    chunk_size: int (optional)
+        Number of windows transformed at once. Default = 3000 (10 minutes).
+
+    Returns
+    -------
+    harmonic_windows: xarray Dataset
+        'harmonics', 'harmonic_subgroups' and 'interharmonic_subgroups' of
+        each signal, indexed by window start time, harmonic frequency and
+        signal name
+    """
+    if not isinstance(signal_data, (pd.Series, pd.DataFrame, xr.DataArray, xr.Dataset)):
+        raise TypeError(
+            "signal_data must be of type pd.Series, pd.DataFrame, "
+            + f"xr.DataArray, or xr.Dataset. Got {type(signal_data)}"
+        )
+
+    if not isinstance(freq, (float, int)):
+        raise TypeError(f"freq must be of type float or integer. Got {type(freq)}")
+
+    if grid_freq not in [50, 60]:
+        raise ValueError(f"grid_freq must be either 50 or 60. Got {grid_freq}")
+
+    if not isinstance(time_dimension, str):
+        raise TypeError(
+            f"time_dimension must be of type str. Got: {type(time_dimension)}"
+        )
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer. Got {chunk_size}")
+
+    # Convert input to xr.Dataset
+    signal_data = convert_to_dataset(signal_data, "data")
+
+    if time_dimension != "" and time_dimension not in signal_data.dims:
+        raise ValueError(
+            "time_dimension was supplied but is not a dimension "
+            + f"of signal_data. Got {time_dimension}"
+        )
+    if time_dimension == "":
+        time_dimension = list(signal_data.dims)[0]
+
+    n_cycles = 12 if grid_freq == 60 else 10
+    n_harmonics = 51
+    hertz = np.arange(n_harmonics) * grid_freq
+    # 200 ms windows, whose bins only fall on the harmonic frequencies if
+    # they hold a whole number of samples
+    n_samples = freq * n_cycles / grid_freq
+    if not np.isclose(n_samples, round(n_samples)):
+        raise ValueError(
+            f"freq must give a whole number of samples per {n_cycles}-cycle "
+            + f"window, i.e. be a multiple of 5 Hz. Got {freq}"
+        )
+    n_samples = int(round(n_samples))
+    n_windows = signal_data.sizes[time_dimension] // n_samples
+    if n_windows == 0:
+        raise ValueError(
+            f"signal_data must contain at least one window of {n_samples} samples"
+        )
+
+    names = list(signal_data.data_vars)
+    groups = np.stack(
+        [
+            _windowed_harmonic_groups(
+                signal_data[var], n_samples, n_cycles, n_harmonics, chunk_size
+            )
+            for var in names
+        ],
+        axis=-1,
+    )
+
+    time = signal_data[time_dimension].values[: n_windows * n_samples : n_samples]
+    dims = ["time", "frequency", "signal"]
+    harmonic_windows = xr.Dataset(
+        {
+            "harmonics": (dims, groups[0]),
+            "harmonic_subgroups": (dims, groups[1]),
+            "interharmonic_subgroups": (dims, groups[2]),
+        },
+        coords={"time": time, "frequency": hertz, "signal": names},
+        attrs={"interval": n_cycles / grid_freq},
+    )
+
+    return harmonic_windows
+
+
+def aggregate_harmonics(
+    harmonic_windows: xr.Dataset,
+    interval: str = "3s",
+) -> xr.Dataset:
+    """
+    Aggregates windowed harmonics to 3-second or 10-minute values, as the
+    root-mean-square of consecutive 200 ms values (IEC 61000-4-30).
+
+    Incomplete intervals at the end of the record are discarded.
+
+    Parameters
+    ----------
+    harmonic_windows: xarray Dataset
+        Output of `windowed_harmonics` (or of a previous aggregation to a
+        shorter interval)
+
+    interval: string (optional)
+        Aggregation interval. Options = "3s" or "10min". Default = "3s".
+
+    Returns
+    -------
+    harmonic_aggregates: xarray Dataset
+        Aggregated values indexed by interval start time, harmonic frequency
+        and signal name
+    """
+    if not isinstance(harmonic_windows, xr.Dataset):
+        raise TypeError(
+            "harmonic_windows must be of type xr.Dataset. "
+            + f"Got {type(harmonic_windows)}"
+        )
+
+    intervals = {"3s": 3.0, "10min": 600.0}
+    if interval not in intervals:
+        raise ValueError(f"interval must be either '3s' or '10min'. Got {interval}")
+
+    if "time" not in harmonic_windows.dims:
+        raise ValueError("harmonic_windows must have a 'time' dimension")
+
+    window_length = harmonic_windows.attrs.get("interval", 0.2)
+    n_windows = int(round(intervals[interval] / window_length))
+    n_intervals = harmonic_windows.sizes["time"] // n_windows
+    if n_intervals == 0:
+        raise ValueError(
+            f"harmonic_windows must contain at least {n_windows} values "
+            + f"to aggregate to {interval}"
+        )
+
+    harmonic_windows = harmonic_windows.transpose("time", ...)
+    harmonic_aggregates = xr.Dataset(
+        coords={"time": harmonic_windows["time"].values[::n_windows][:n_intervals]}
+    )
+    for var in harmonic_windows.data_vars:
+        values = harmonic_windows[var].values[: n_intervals * n_windows]
+        values = values.reshape(n_intervals, n_windows, *values.shape[1:])
+        harmonic_aggregates[var] = (
+            harmonic_windows[var].dims,
+            np.sqrt(np.mean(values**2, axis=1)),
+        )
+    harmonic_aggregates = harmonic_aggregates.assign_coords(
+        {
+            dim: harmonic_windows[dim]
+            for dim in harmonic_windows.dims
+            if dim != "time" and dim in harmonic_windows.coords
+        }
+    )
+    harmonic_aggregates.attrs["interval"] = intervals[interval]
+
+    return harmonic_aggregates
@@ -1,9 +1,9 @@
 import os
 import json
+import datetime
 import requests
-import shutil
 import pandas as pd
-from mhkit.utils.cache import handle_caching
+from mhkit.utils.cache import handle_tile_caching, month_tiles
 
 
 def _read_usgs_json(text, to_pandas=True):
@@ -27,7 +27,7 @@ def _read_usgs_json(text, to_pandas=True):
             pass
 
     if not to_pandas:
-        data = data.to_dataset()
+        data = data.to_xarray()
 
     return data
 
@@ -70,10 +70,13 @@ def request_usgs_data(
     write_json=None,
     clear_cache=False,
     to_pandas=True,
+    max_workers=4,
 ):
     """
     Loads USGS data directly from https://waterdata.usgs.gov/nwis using a
-    GET request
+    GET request. Data is cached by month, so that only the months missing
+    from the cache are requested, concurrently. The current month is
+    requested every time.
 
     The request URL prints to the screen.
 
@@ -99,6 +102,8 @@ def request_usgs_data(
         If True, the cache for this specific request will be cleared.
     to_pandas: bool (optional)
         Flag to output pandas instead of xarray. Default = True.
+    max_workers: int (optional)
+        Maximum number of months requested at once. Default = 4.
 
     Returns
     -------
@@ -112,24 +117,54 @@ def request_usgs_data(
     if not isinstance(to_pandas, bool):
         raise TypeError(f"to_pandas must be of type bool. Got: {type(to_pandas)}")
 
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError(f"max_workers must be a positive int. Got: {max_workers}")
+
     # Define the path to the cache directory
     cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "mhkit", "usgs")
 
-    # Create a unique filename based on the function parameters
-    hash_params = f"{station}_{parameter}_{start_date}_{end_date}_{data_type}"
+    begin = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+
+    # Data is cached by month, so only the months that are not cached are
+    # requested
+    with requests.Session() as session:
+
+        def fetch(tile_start, tile_end):
+            data = _request_usgs_tile(
+                session, station, parameter, tile_start, tile_end, data_type, proxy
+            )
+            return data, None
+
+        data, _ = handle_tile_caching(
+            f"{station}_{parameter}_{data_type}",
+            cache_dir,
+            month_tiles(begin, end),
+            fetch,
+            max_workers=max_workers,
+            write_json=write_json,
+            clear_cache_file=clear_cache,
+        )
+
+    if data is None:
+        data = pd.DataFrame()
 
-    # Use handle_caching to manage cache
-    cached_data, metadata, cache_filepath = handle_caching(
-        hash_params,
-        cache_dir,
-        cache_content={"data": None, "metadata": None, "write_json": write_json},
-        clear_cache_file=clear_cache,
-    )
+    if not to_pandas:
+        data = data.to_xarray()
 
-    if cached_data is not None:
-        return cached_data
+    return data
+
+
+def _request_usgs_tile(
+    session, station, parameter, start_date, end_date, data_type, proxy=None
+):
+    """
+    Returns the data of a USGS request between two dates (inclusive), with
+    times in UTC
+    """
+    start_date = start_date.strftime("%Y-%m-%d")
+    end_date = end_date.strftime("%Y-%m-%d")
 
-    # If no cached data, proceed with the API request
     if data_type == "Daily":
         data_url = "https://waterservices.usgs.gov/nwis/dv"
         api_query = (
@@ -160,25 +195,8 @@ def request_usgs_data(
 
     print("Data request URL: ", data_url + api_query)
 
-    response = requests.get(url=data_url + api_query, proxies=proxy)
+    response = session.get(url=data_url + api_query, proxies=proxy)
     text = json.loads(response.text)
 
     # handle_caching is only set-up for pandas, so force this data to output as pandas for now
-    data = _read_usgs_json(text, True)
-
-    # After making the API request and processing the response, write the
-    #  response to a cache file
-    handle_caching(
-        hash_params,
-        cache_dir,
-        cache_content={"data": data, "metadata": None, "write_json": None},
-        clear_cache_file=clear_cache,
-    )
-
-    if write_json:
-        shutil.copy(cache_filepath, write_json)
-
-    if not to_pandas:
-        data = data.to_dataset()
-
-    return data
+    return _read_usgs_json(text, True)
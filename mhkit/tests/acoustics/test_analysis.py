@@ -3,6 +3,10 @@ from os.path import abspath, dirname, join, normpath
 import numpy as np
 import xarray as xr
 import unittest
+import functools
+import importlib.util
+import shutil
+from scipy.io import wavfile
 
 import mhkit.acoustics as acoustics
 
@@ -235,6 +239,47 @@ class TestAnalysis(unittest.TestCase):
             calibrated_spsd.values, spsd.values
         )  # Calibration should reduce values
 
+    def test_apply_calibration_level_inplace(self):
+        """
+        Test calibration of spectral density levels and in-place calibration.
+        """
+        time = np.arange(0, 10, 0.1)
+        freq = np.linspace(10, 1000, len(time))
+        spsd = xr.DataArray(
+            np.random.random((len(time), len(freq))),
+            coords=[time, freq],
+            dims=["time", "freq"],
+            attrs={"units": "V^2/Hz"},
+        )
+        sensitivity_curve = xr.DataArray(
+            -170 - 10 * np.random.random(len(freq) // 2),
+            coords=[freq[::2]],
+            dims=["freq"],
+        )
+
+        expected = acoustics.apply_calibration(spsd, sensitivity_curve, -177.0)
+        self.assertEqual(spsd.attrs["units"], "V^2/Hz")
+
+        # Levels are shifted by the same calibration, in dB
+        spsdl = acoustics.sound_pressure_spectral_density_level(spsd)
+        calibrated_spsdl = acoustics.apply_calibration(spsdl, sensitivity_curve, -177.0)
+        self.assertEqual(calibrated_spsdl.dtype, spsdl.dtype)
+        self.assertEqual(calibrated_spsdl.attrs["units"], "dB re 1 uPa^2/Hz")
+        np.testing.assert_allclose(
+            calibrated_spsdl.values,
+            acoustics.sound_pressure_spectral_density_level(expected).values,
+            rtol=1e-5,
+        )
+
+        # Calibrating in place on transposed data gives the same values
+        spsd_t = spsd.T.copy()
+        out = acoustics.apply_calibration(
+            spsd_t, sensitivity_curve, -177.0, inplace=True
+        )
+        self.assertIs(out, spsd_t)
+        self.assertEqual(spsd_t.attrs["units"], "Pa^2/Hz")
+        np.testing.assert_allclose(spsd_t.T.values, expected.values, rtol=1e-12)
+
     def test_fmax_warning(self):
         """
         Test that fmax warning adjusts the maximum frequency if necessary.
@@ -286,6 +331,165 @@ class TestAnalysis(unittest.TestCase):
         with self.assertRaises(ValueError):
             _validate_method({"quantile": 1.5})  # Out of valid range (0,1)
 
+    def test_band_operator(self):
+        from mhkit.acoustics.analysis import _band_operator
+
+        freq = np.arange(0, 1001, 0.5)
+        spsd = xr.DataArray(
+            np.random.default_rng(3).random((4, freq.size)),
+            coords={"time": np.arange(4), "freq": freq},
+            attrs={"fs": 2000, "units": "dB"},
+        )
+        bands = (2 ** (1 / 3), 2 ** (1 / 6), 10, 1000)
+        center_freq, operator = _band_operator(freq, bands)
+        _, operator_cached = _band_operator(freq.copy(), bands)
+        self.assertIs(operator, operator_cached)
+        self.assertEqual(operator.shape, (len(center_freq), freq.size))
+
+        # Trapezoidal integration over each band
+        td_spl3 = acoustics.third_octave_sound_pressure_level(spsd, fmax=1000)
+        lower = center_freq / 2 ** (1 / 6)
+        upper = center_freq * 2 ** (1 / 6)
+        for i in [0, 5, len(center_freq) - 1]:
+            band = spsd.sel(freq=slice(lower[i], upper[i]))
+            cd = 10 * np.log10(np.trapz(band, band["freq"]) / 1e-12)
+            np.testing.assert_allclose(td_spl3[:, i], cd, rtol=1e-6)
+
+        # Band averages match xarray's groupby_bins
+        for method in ["mean", "sum"]:
+            td = acoustics.band_aggregate(spsd, 3, fmax=1000, method=method)
+            bins = np.append(lower, upper[-1])
+            cd = getattr(spsd.groupby_bins("freq", bins, labels=center_freq), method)()
+            np.testing.assert_allclose(td, cd)
+
+    def test_aggregate_windows(self):
+        time = np.datetime64("2024-01-01") + np.arange(200) * np.timedelta64(1, "s")
+        freq = np.arange(0, 1001, 2.0)
+        spsdl = xr.DataArray(
+            np.random.default_rng(4).random((200, freq.size)).astype(np.float32),
+            coords={"time": time, "freq": freq},
+            attrs={"units": "dB re 1 uPa^2/Hz"},
+        )
+        time_bins = time[0] + np.arange(0, 211, 30) * np.timedelta64(1, "s")
+        quantiles = [0.05, 0.5, 0.95]
+
+        # Uniform windows are reshaped, with a shorter last window
+        td = acoustics.time_aggregate(spsdl, 30, method={"quantile": quantiles})
+        cd = spsdl.groupby_bins("time", time_bins).quantile(quantiles)
+        self.assertEqual(td.dims, ("time_bins", "freq", "quantile"))
+        np.testing.assert_allclose(td, cd)
+
+        td = acoustics.time_aggregate(spsdl, 30, method="median")
+        cd = spsdl.groupby_bins("time", time_bins).median()
+        np.testing.assert_allclose(td, cd)
+
+        # Irregular time falls back to groupby_bins
+        spsdl_irr = spsdl.isel(time=np.r_[0:50, 70:200])
+        td = acoustics.time_aggregate(spsdl_irr, 30, method={"quantile": quantiles})
+        cd = spsdl_irr.groupby_bins("time", time_bins).quantile(quantiles)
+        np.testing.assert_allclose(td, cd)
+
+        # Fractional octave bands
+        td = acoustics.band_aggregate(spsdl, 3, fmax=1000, method={"quantile": 0.25})
+        center_freq = 10 ** np.arange(1, np.log10(1000 * 2 ** (1 / 3)), np.log10(2) / 3)
+        bins = np.append(center_freq / 2 ** (1 / 6), center_freq[-1] * 2 ** (1 / 6))
+        cd = spsdl.groupby_bins("freq", bins, labels=center_freq).quantile(0.25)
+        np.testing.assert_allclose(td, cd)
+        self.assertEqual(td["quantile"], 0.25)
+
+    def test_spectral_probability_density(self):
+        freq = np.arange(0, 101.0)
+        levels = np.random.default_rng(5).normal(80, 10, (2000, freq.size))
+        levels[0, 0] = np.nan
+        spsdl = xr.DataArray(
+            levels,
+            coords={"time": np.arange(2000), "freq": freq},
+            dims=["time", "freq"],
+        )
+
+        spd1 = acoustics.SpectralProbabilityDensity(freq, db_step=0.5)
+        spd2 = acoustics.SpectralProbabilityDensity(freq, db_step=0.5)
+        spd1.update(spsdl[:1200])
+        spd2.update(spsdl[1200:].values)
+        spd = spd1 + spd2
+        spd1.merge(spd2)
+        np.testing.assert_equal(spd.counts, spd1.counts)
+        self.assertEqual(spd.n_spectra[0], 1999)
+
+        td = spd.quantile([0.05, 0.5, 0.95])
+        cd = np.nanquantile(levels, [0.05, 0.5, 0.95], axis=0).T
+        np.testing.assert_allclose(td, cd, atol=0.5)
+        np.testing.assert_allclose(spd.mean(), np.nanmean(levels, axis=0))
+        np.testing.assert_allclose(
+            spd.mean(linear=True),
+            10 * np.log10(np.nanmean(10 ** (levels / 10), axis=0)),
+        )
+        np.testing.assert_allclose(spd.probability_density().sum("level") * 0.5, 1)
+
+        # Round trip through a Dataset
+        spd_ds = acoustics.SpectralProbabilityDensity.from_dataset(spd.to_dataset())
+        np.testing.assert_equal(spd_ds.counts, spd.counts)
+
+        # Round trip through a netCDF file
+        file_name = join(testdir, "test_spd.nc")
+        spd.to_dataset().to_netcdf(file_name)
+        spd_nc = acoustics.SpectralProbabilityDensity.from_dataset(
+            xr.load_dataset(file_name)
+        )
+        os.remove(file_name)
+        np.testing.assert_equal(spd_nc.counts, spd.counts)
+        self.assertEqual(spd_nc.db_max, spd.db_max)
+
+        with self.assertRaises(ValueError):
+            spd.merge(acoustics.SpectralProbabilityDensity(freq, db_step=1))
+
+        # The upper limit is rounded to a whole number of bins
+        spd = acoustics.SpectralProbabilityDensity(freq, db_max=100.3, db_step=1)
+        self.assertEqual(spd.db_max, 100)
+        self.assertEqual(spd.level_edges[-1], 100)
+
+    def test_process_files(self):
+        fs = 4000
+        rng = np.random.default_rng(2)
+        file_names = []
+        for i in range(3):
+            file_name = join(testdir, f"test_process_files{i}.wav")
+            raw = rng.integers(-(2**15), 2**15, fs * 25, dtype=np.int16)
+            wavfile.write(file_name, fs, raw)
+            file_names.append(file_name)
+        reader = functools.partial(
+            acoustics.io.read_hydrophone, peak_voltage=1, sensitivity=-177
+        )
+
+        td = acoustics.process_files(file_names, reader, block_length=10, fmax=2000)
+        td_pool = acoustics.process_files(
+            file_names, reader, block_length=None, fmax=2000, n_workers=2
+        )
+
+        # Reference from the single-file functions
+        P = reader(file_names[1])
+        spsd = acoustics.sound_pressure_spectral_density(P, fs, bin_length=1)
+        cd = acoustics.decidecade_sound_pressure_level(spsd, fmax=2000)
+
+        self.assertEqual(td["band_spl"].shape, (75, cd.sizes["freq_bins"]))
+        np.testing.assert_allclose(
+            td["band_spl"].isel(time=slice(25, 50)).values, cd.values, rtol=1e-6
+        )
+        np.testing.assert_allclose(td_pool["band_spl"].values, td["band_spl"].values)
+
+        if importlib.util.find_spec("zarr") is not None:
+            store = join(testdir, "test_process_files.zarr")
+            td_store = acoustics.process_files(
+                file_names, reader, output=store, fmax=2000
+            ).load()
+            shutil.rmtree(store)
+            np.testing.assert_allclose(
+                td_store["band_spl"].values, td["band_spl"].values
+            )
+
+        for file_name in file_names:
+            os.remove(file_name)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,11 @@
 import os
+import struct
 from os.path import abspath, dirname, join, normpath, isfile
 import numpy as np
 import pandas as pd
 import unittest
+import pytest
+from scipy.io import wavfile
 
 import mhkit.acoustics as acoustics
 
@@ -59,6 +62,47 @@ class TestIO(unittest.TestCase):
         )
         pd.testing.assert_index_equal(time, expected_time)
 
+    def test_read_hydrophone_lazy(self):
+        pytest.importorskip("dask")
+        file_name = join(testdir, "test_hydrophone.wav")
+        raw = np.random.default_rng(1).integers(-(2**15), 2**15, 4800, dtype=np.int16)
+        wavfile.write(file_name, 1600, raw)
+
+        td = acoustics.io.read_hydrophone(file_name, peak_voltage=1, sensitivity=-177)
+        td_lazy = acoustics.io.read_hydrophone(
+            file_name, peak_voltage=1, sensitivity=-177, chunks=1000
+        )
+        td_32 = acoustics.io.read_hydrophone(
+            file_name, peak_voltage=1, sensitivity=-177, dtype="float32"
+        )
+
+        self.assertIsNotNone(td_lazy.chunks)
+        self.assertEqual(td_32.dtype, np.float32)
+        self.assertEqual(td_lazy.attrs, td.attrs)
+        np.testing.assert_equal(td_lazy.values, td.values)
+        np.testing.assert_equal(td_lazy["time"].values, td["time"].values)
+        np.testing.assert_allclose(td_32.values, td.values, rtol=1e-6)
+
+        del td_lazy
+        os.remove(file_name)
+
+    def test_read_hydrophone_extensible_float(self):
+        # WAVE_FORMAT_EXTENSIBLE header with a 32-bit float subformat
+        file_name = join(testdir, "test_extensible.wav")
+        data = np.random.default_rng(2).uniform(-1, 1, 1600).astype("<f4")
+        subformat = struct.pack("<H", 3) + bytes.fromhex("000000001000800000aa00389b71")
+        fmt = struct.pack("<HHIIHHHHI", 0xFFFE, 1, 1600, 6400, 4, 32, 22, 32, 4)
+        with open(file_name, "wb") as f:
+            f.write(b"RIFF" + struct.pack("<I", 60 + data.nbytes) + b"WAVE")
+            f.write(b"fmt " + struct.pack("<I", 40) + fmt + subformat)
+            f.write(b"data" + struct.pack("<I", data.nbytes) + data.tobytes())
+
+        td = acoustics.io.read_hydrophone(file_name, peak_voltage=2.5)
+        os.remove(file_name)
+
+        # Float samples are normalized to full scale
+        np.testing.assert_allclose(td.values, data * 2.5, rtol=1e-6)
+
     def test_read_iclisten_metadata(self):
         from mhkit.acoustics.io import _read_iclisten_metadata
 
@@ -88,6 +88,21 @@ class analysis_testcase(unittest.TestCase):
         np.testing.assert_equal(f, np.arange(1, 17, 1, dtype="float"))
         np.testing.assert_equal(omega, np.arange(1, 17, 1, dtype="float") * (2 * np.pi))
 
+    def test_reshape(self):
+        arr = np.arange(2 * 23, dtype=float).reshape(2, 23)
+        binner = VelBinner(n_bin=5, fs=1)
+
+        out = binner.reshape(arr)
+        assert np.shares_memory(out, arr)
+        np.testing.assert_equal(out, arr[:, :20].reshape(2, 4, 5))
+
+        out = binner.reshape(arr, n_pad=4)
+        assert out.shape == (2, 4, 9)
+        np.testing.assert_equal(out[:, 0, :2], 0)
+        np.testing.assert_equal(out[:, -1, -2:], 0)
+        np.testing.assert_equal(out[:, 1], arr[:, 3:12])
+        np.testing.assert_equal(out[:, 2, :2], out[:, 1, 5:7])
+
     def test_adv_turbulence(self):
         dat = tv.dat.copy(deep=True)
         bnr = avm.ADVBinner(n_bin=20.0, fs=dat.fs)
@@ -182,6 +182,10 @@ class orient_testcase(unittest.TestCase):
             err_msg="Disagreement b/t quaternion-calc'd & HPR-calc'd orientmat",
         )
 
+        dcm32 = quaternion2orient(dat.quaternions, dtype=np.float32)
+        assert dcm32.dtype == np.float32
+        assert_allclose(dcm32, dcm, atol=1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,14 @@
 from mhkit.tests.dolfyn.base import assert_allclose
 from mhkit.tests.dolfyn import base as tb
 import mhkit.dolfyn.io.nortek2 as sig
-from mhkit.dolfyn.io.nortek2_lib import crop_ensembles
+from mhkit.dolfyn.io.nortek2_lib import crop_ensembles, get_index
 from mhkit.dolfyn.io.api import read_example as read
+from mhkit.dolfyn.io.rdi import read_rdi
+import numpy as np
 import warnings
 import unittest
 import pytest
+import shutil
 import os
 
 make_data = False
@@ -42,10 +45,10 @@ class io_adp_testcase(unittest.TestCase):
     def test_io_rdi(self):
         warnings.simplefilter("ignore", UserWarning)
         nens = 100
-        td_rdi = read("RDI_test01.000")
-        td_7f79 = read("RDI_7f79.000")
-        td_7f79_2 = read("RDI_7f79_2.000")
-        td_rdi_bt = read("RDI_withBT.000", nens=nens)
+        td_rdi = read("RDI_test01.000", rebuild_index=True)
+        td_7f79 = read("RDI_7f79.000", rebuild_index=True)
+        td_7f79_2 = read("RDI_7f79_2.000", rebuild_index=True)
+        td_rdi_bt = read("RDI_withBT.000", nens=nens, rebuild_index=True)
         td_vm = read("vmdas01_wh.ENX", nens=nens)
         td_os = read("vmdas02_os.ENR", nens=nens)
         td_wr1 = read("winriver01.PD0")
@@ -53,6 +56,11 @@ class io_adp_testcase(unittest.TestCase):
         td_rp = read("RiverPro_test01.PD0")
         td_transect = read("winriver02_transect.PD0", nens=nens)
 
+        os.remove(tb.exdt("RDI_test01.000.index"))
+        os.remove(tb.exdt("RDI_7f79.000.index"))
+        os.remove(tb.exdt("RDI_7f79_2.000.index"))
+        os.remove(tb.exdt("RDI_withBT.000.index"))
+
         if make_data:
             save(td_rdi, "RDI_test01.nc")
             save(td_7f79, "RDI_7f79.nc")
@@ -186,6 +194,44 @@ class io_adp_testcase(unittest.TestCase):
         assert_allclose(td_sig_ie_crop, cd_sig_ie_crop, atol=1e-6)
         assert_allclose(td_sig_crop, cd_sig_crop, atol=1e-6)
 
+    def test_nortek2_index_append(self):
+        # Index a file that grows between reads
+        with open(tb.exdt("BenchFile01.ad2cp"), "rb") as f:
+            data = f.read()
+        fname = tb.rfnm("BenchFile01_grow.ad2cp")
+        with open(fname, "wb") as f:
+            f.write(data[: len(data) // 2])
+        idx0, _ = get_index(fname, eof=len(data) // 2, rebuild=True)
+        with open(fname, "ab") as f:
+            f.write(data[len(data) // 2 :])
+        idx1, _ = get_index(fname, eof=len(data))
+        idx2, _ = get_index(fname, eof=len(data), rebuild=True)
+
+        os.remove(fname)
+        os.remove(fname + ".index")
+
+        assert len(idx0) < len(idx1)
+        np.testing.assert_equal(idx1, idx2)
+        np.testing.assert_equal(idx1[: len(idx0)], idx0)
+
+    def test_rdi_index_not_writable(self):
+        # The index is kept in memory when the .index file can't be written
+        fname = tb.rfnm("RDI_test01_nowrite.000")
+        shutil.copyfile(tb.exdt("RDI_test01.000"), fname)
+        os.mkdir(fname + ".index")
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                td_rdi = read_rdi(fname)
+        finally:
+            os.rmdir(fname + ".index")
+            os.remove(fname)
+
+        td_rdi.attrs.pop("filename", None)
+        cd_rdi = dat_rdi.copy()
+        cd_rdi.attrs.pop("filename", None)
+        assert_allclose(td_rdi, cd_rdi, atol=1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
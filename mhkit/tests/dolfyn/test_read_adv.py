@@ -1,9 +1,12 @@
 from mhkit.tests.dolfyn import base as tb
 from mhkit.dolfyn.rotate.api import set_inst2head_rotmat
 from mhkit.dolfyn.io.api import read_example as read
+from mhkit.dolfyn.io.nortek import read_nortek
+from mhkit.dolfyn.io.nortek_lib import get_index
 import numpy as np
 import unittest
 import pytest
+import os
 
 make_data = False
 load = tb.load_netcdf
@@ -45,6 +48,29 @@ class io_adv_testcase(unittest.TestCase):
         assert_allclose(tdb, dat_burst, atol=1e-6)
         assert_allclose(tdm2, dat_imu_json, atol=1e-6)
 
+    def test_io_adv_index(self):
+        nens = 100
+        td = read("vector_data01.VEC", nens=nens, rebuild_index=True, do_checksum=True)
+        idx = get_index(tb.exdt("vector_data01.VEC"))
+
+        # Corrupt a velocity sample in a copy of the file
+        with open(tb.exdt("vector_data01.VEC"), "rb") as f:
+            data = bytearray(f.read(20000))
+        ivel = np.nonzero(idx["ID"] == 16)[0][10]
+        data[int(idx["pos"][ivel]) + 10] ^= 255
+        fname = tb.rfnm("vector_data01_corrupt.VEC")
+        with open(fname, "wb") as f:
+            f.write(data)
+        with pytest.raises(Exception, match="CheckSum Failed"):
+            read_nortek(fname, userdata=False, do_checksum=True)
+
+        os.remove(tb.exdt("vector_data01.VEC.index"))
+        os.remove(fname)
+        os.remove(fname + ".index")
+
+        assert len(idx) == np.sum(idx["ID"] == 16) + np.sum(idx["ID"] == 17) + 5
+        assert_allclose(td, dat, atol=1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,8 +12,11 @@ import mhkit.dolfyn.io.rdi as wh
 import mhkit.dolfyn.io.nortek as awac
 import mhkit.dolfyn.io.nortek2 as sig
 from mhkit.dolfyn.io.api import read_example as read
+from mhkit.dolfyn.io.api import open_dataset, save, load
+from xarray.testing import assert_identical
 import unittest
 import pytest
+import shutil
 import os
 
 make_data = False
@@ -35,6 +38,36 @@ class io_testcase(unittest.TestCase):
         os.remove(rfnm("test_save_comp.nc"))
         os.remove(rfnm("test_save.mat"))
 
+    def test_open_dataset(self):
+        pytest.importorskip("dask")
+        ds = open_dataset(rfnm("vector_data01_bin.nc"), chunks={"time": 2})
+
+        assert ds["csd"].chunks is not None
+        assert ds["vel"].chunks is not None
+        assert_identical(ds.load(), load(rfnm("vector_data01_bin.nc")))
+
+    def test_save_zarr(self):
+        pytest.importorskip("zarr")
+        pytest.importorskip("dask")
+        ds = tv.dat.copy(deep=True)
+        fname = rfnm("test_save.zarr")
+        save(ds.isel(time=slice(0, 60)), fname, compression="zstd", chunks={"time": 25})
+        save(ds.isel(time=slice(60, None)), fname, append_dim="time")
+        td = open_dataset(fname)
+        assert td["vel"].chunks is not None
+        td = td.load()
+
+        with pytest.raises(ValueError):
+            save(ds, rfnm("test_save_zarr.nc"), append_dim="time")
+
+        save_netcdf(ds, "test_save_zarr")
+        cd = load(rfnm("test_save_zarr.nc"))
+
+        shutil.rmtree(fname)
+        os.remove(rfnm("test_save_zarr.nc"))
+
+        assert_allclose(td, cd, atol=1e-6)
+
     def test_matlab_io(self):
         nens = 100
         td_vec = read("vector_data_imu01.VEC", nens=nens)
@@ -4,6 +4,7 @@ from mhkit.dolfyn.rotate.api import rotate2, calc_principal_heading
 import numpy as np
 import numpy.testing as npt
 import unittest
+import pytest
 
 make_data = False
 
@@ -167,6 +168,23 @@ class rotate_adp_testcase(unittest.TestCase):
         assert_allclose(td_awac, cd_awac, atol=1e-5)
         assert_allclose(td_sig, cd_sig, atol=1e-5)
 
+    def test_rotate_chunked(self):
+        for dat in [tr.dat_rdi, tr.dat_sig_ieb]:
+            dat = dat.copy(deep=True)
+            dat.attrs["principal_heading"] = 30.0
+            td = rotate2(dat, "principal", inplace=False)
+            td_chunk = rotate2(dat, "principal", inplace=False, chunk_size=7)
+
+            assert_allclose(td, td_chunk, atol=1e-5)
+
+    def test_rotate_dask(self):
+        pytest.importorskip("dask")
+        td = rotate2(tr.dat_sig_ieb, "earth", inplace=False)
+        td_dask = rotate2(tr.dat_sig_ieb.chunk({"time": 13}), "earth", inplace=False)
+
+        assert td_dask["vel"].chunks is not None
+        assert_allclose(td, td_dask.compute(), atol=1e-5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -108,6 +108,59 @@ class TestDevice(unittest.TestCase):
         for i, j in zip(inter_harmonics.values, self.interharmonic):
             self.assertAlmostEqual(i[0], j, 1)
 
+    def test_windowed_harmonics_sine_wave(self):
+        signal = pd.DataFrame(
+            {
+                "a": self.signal + 0.1 * np.sin(2 * np.pi * 300 * self.samples),
+                "b": self.signal,
+            },
+            index=self.samples,
+        )
+        harmonic_windows = power.quality.windowed_harmonics(
+            signal, 1000, self.frequency, chunk_size=1000
+        )
+
+        # 12-cycle (200 ms) windows
+        self.assertEqual(harmonic_windows.sizes["time"], self.t * 5)
+        np.testing.assert_allclose(harmonic_windows["time"][:2], [0, 0.2])
+
+        # Each window matches the single-record functions
+        window = signal.iloc[200:400]
+        harmonics = power.quality.harmonics(window, 1000, self.frequency)
+        hsg = power.quality.harmonic_subgroups(harmonics, self.frequency)
+        np.testing.assert_allclose(
+            harmonic_windows["harmonics"].isel(time=1),
+            harmonics.loc[hsg.index].values,
+            atol=1e-10,
+        )
+        np.testing.assert_allclose(
+            harmonic_windows["harmonic_subgroups"].isel(time=1)[1:],
+            hsg.iloc[1:].values,
+            atol=1e-10,
+        )
+        np.testing.assert_allclose(
+            harmonic_windows["harmonic_subgroups"].sel(frequency=[60, 300]),
+            np.broadcast_to([[1.0, 1.0], [0.1, 0.0]], (self.t * 5, 2, 2)),
+            atol=1e-8,
+        )
+        np.testing.assert_allclose(
+            harmonic_windows["interharmonic_subgroups"], 0, atol=1e-8
+        )
+
+        # 12-cycle windows of 1024 Hz samples are not a whole number of samples
+        with self.assertRaises(ValueError):
+            power.quality.windowed_harmonics(signal, 1024, self.frequency)
+
+        three_second = power.quality.aggregate_harmonics(harmonic_windows)
+        ten_minute = power.quality.aggregate_harmonics(three_second, "10min")
+        self.assertEqual(three_second.sizes["time"], self.t / 3)
+        self.assertEqual(ten_minute.sizes["time"], 1)
+        np.testing.assert_allclose(
+            ten_minute["harmonic_subgroups"].sel(frequency=300),
+            [[0.1, 0.0]],
+            atol=1e-8,
+        )
+
     def test_instfreq_pandas(self):
         um = pd.Series(self.signal, index=self.samples)
 
@@ -123,6 +176,23 @@ class TestDevice(unittest.TestCase):
         for i in freq.values:
             self.assertAlmostEqual(i[0], self.frequency, 1)
 
+    def test_instfreq_chunked(self):
+        um = pd.DataFrame(
+            {"a": self.signal, "b": np.roll(self.signal, 5)}, index=self.samples
+        )
+
+        freq = power.characteristics.instantaneous_frequency(um)
+        freq_chunked = power.characteristics.instantaneous_frequency(
+            um, chunk_size=50000
+        )
+        self.assertEqual(freq_chunked.shape, freq.shape)
+        self.assertTrue((freq_chunked.index == freq.index).all())
+        # Away from the ends of the record, segments match the full transform
+        np.testing.assert_allclose(
+            freq_chunked.values[50000:-50000], freq.values[50000:-50000], atol=1e-6
+        )
+        np.testing.assert_allclose(freq_chunked.values[1000:-1000], 60, atol=0.1)
+
     def test_dc_power_pandas(self):
         current = pd.DataFrame(self.current_data, columns=["A1", "A2", "A3"])
         voltage = pd.DataFrame(self.voltage_data, columns=["V1", "V2", "V3"])
@@ -1,7 +1,10 @@
 from os.path import abspath, dirname, join, isfile, normpath, relpath
+from unittest import mock
 import mhkit.river as river
+import numpy as np
 import pandas as pd
 import unittest
+import tempfile
 import os
 
 
@@ -61,6 +64,52 @@ class TestIO(unittest.TestCase):
         # Every 15 minutes or 4 times per hour
         self.assertEqual(data.shape, (10 * 24 * 4, 1))
 
+    def test_request_usgs_data_monthly_cache(self):
+        requested = []
+
+        def request_tile(session, station, parameter, start, end, data_type, proxy):
+            requested.append((start.strftime("%Y%m%d"), end.strftime("%Y%m%d")))
+            index = pd.date_range(start, end, freq="D", tz="UTC")
+            return pd.DataFrame(
+                {
+                    "Discharge, cubic feet per second": np.arange(
+                        len(index), dtype=float
+                    )
+                },
+                index,
+            )
+
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.object(
+            river.io.usgs, "_request_usgs_tile", side_effect=request_tile
+        ), mock.patch("os.path.expanduser", return_value=tmpdir):
+            data = river.io.usgs.request_usgs_data(
+                "15515500", "00060", "2009-08-15", "2009-10-10"
+            )
+            self.assertEqual(
+                requested,
+                [
+                    ("20090815", "20090831"),
+                    ("20090901", "20090930"),
+                    ("20091001", "20091010"),
+                ],
+            )
+            self.assertEqual(data.shape, (57, 1))
+
+            # Extending the request only requests the new months
+            requested.clear()
+            data = river.io.usgs.request_usgs_data(
+                "15515500", "00060", "2009-09-01", "2009-11-30", to_pandas=False
+            )
+            self.assertEqual(
+                requested, [("20091001", "20091031"), ("20091101", "20091130")]
+            )
+            self.assertEqual(data.sizes["index"], 91)
+
+        with self.assertRaises(ValueError):
+            river.io.usgs.request_usgs_data(
+                "15515500", "00060", "2009-08-15", "2009-10-10", max_workers=0
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
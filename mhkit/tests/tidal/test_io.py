@@ -14,11 +14,14 @@ These tests include:
 """
 
 from os.path import abspath, dirname, join, normpath, relpath
+from unittest import mock
 import unittest
+import tempfile
 import os
 import json
 
 import numpy as np
+import pandas as pd
 import mhkit.tidal as tidal
 
 
@@ -137,6 +140,52 @@ class TestIO(unittest.TestCase):
         self.assertIn("d", loaded_data["columns"])
         self.assertIn("b", loaded_data["columns"])
 
+    def test_request_noaa_data_monthly_cache(self):
+        """
+        Test the request_noaa_data function assembles requests from
+        monthly tiles and only requests the months missing from the cache.
+        """
+        requested = []
+
+        def request_tile(session, station, parameter, start, end, proxy=None):
+            requested.append((start.strftime("%Y%m%d"), end.strftime("%Y%m%d")))
+            index = pd.date_range(start, end, freq="D")
+            data = pd.DataFrame({"s": np.arange(len(index), dtype=float)}, index)
+            return data, {"id": station}
+
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.object(
+            tidal.io.noaa, "_request_noaa_tile", side_effect=request_tile
+        ), mock.patch("os.path.expanduser", return_value=tmpdir):
+            data, metadata = tidal.io.noaa.request_noaa_data(
+                "s08010", "currents", "20180115", "20180310"
+            )
+            self.assertEqual(
+                requested,
+                [
+                    ("20180115", "20180131"),
+                    ("20180201", "20180228"),
+                    ("20180301", "20180310"),
+                ],
+            )
+            self.assertEqual(len(data), 55)
+            self.assertEqual(metadata["id"], "s08010")
+
+            # Extending the request only requests the new month
+            requested.clear()
+            data, _ = tidal.io.noaa.request_noaa_data(
+                "s08010", "currents", "20180201", "20180430"
+            )
+            self.assertEqual(
+                requested, [("20180301", "20180331"), ("20180401", "20180430")]
+            )
+            self.assertEqual(data.index[0], pd.Timestamp("2018-02-01"))
+            self.assertEqual(data.index[-1], pd.Timestamp("2018-04-30"))
+
+        with self.assertRaises(ValueError):
+            tidal.io.noaa.request_noaa_data(
+                "s08010", "currents", "20180115", "20180310", max_workers=0
+            )
+
     def test_request_noaa_data_invalid_dates(self):
         """
         Test the request_noaa_data function with an invalid date format
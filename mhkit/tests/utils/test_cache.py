@@ -31,12 +31,19 @@ Date: 2023-08-18
 """
 
 import unittest
+import datetime
 import hashlib
 import tempfile
 import shutil
+import json
 import os
 import pandas as pd
-from mhkit.utils.cache import handle_caching, clear_cache
+from mhkit.utils.cache import (
+    handle_caching,
+    handle_tile_caching,
+    month_tiles,
+    clear_cache,
+)
 
 
 class TestCacheUtils(unittest.TestCase):
@@ -159,6 +166,63 @@ class TestCacheUtils(unittest.TestCase):
 
         assert os.path.isfile(cache_filepath)
 
+    def test_handle_tile_caching(self):
+        """
+        Test if the `handle_tile_caching` function only fetches the tiles
+        missing from the cache.
+
+        The method tests the following scenario:
+        1. Assembles hourly data over three months from monthly tiles.
+        2. Extends the range by one month, and to today.
+        3. Checks which tiles were fetched by each request.
+
+        Asserts:
+        - Each month is fetched once; the month of today is not cached.
+        - The assembled data spans the requested range, with timezone-aware
+          times kept through the cache and the JSON file.
+        """
+        cache_dir = os.path.join(self.cache_dir, "tiles")
+        fetched = []
+
+        def fetch(start, end):
+            fetched.append(start)
+            index = pd.date_range(
+                start, end + datetime.timedelta(days=1), freq="h", tz="UTC"
+            )[:-1]
+            data = pd.DataFrame({"A": index.day.astype(float)}, index=index)
+            return data, {"end": str(end)}
+
+        tiles = month_tiles(datetime.date(2020, 1, 15), datetime.date(2020, 3, 31))
+        self.assertEqual(
+            [start.isoformat() for start, _ in tiles],
+            ["2020-01-15", "2020-02-01", "2020-03-01"],
+        )
+        data, metadata = handle_tile_caching("tiles", cache_dir, tiles, fetch)
+        self.assertEqual(len(fetched), 3)
+        self.assertEqual(metadata, {"end": "2020-03-31"})
+        self.assertEqual(data.index[0], pd.Timestamp("2020-01-15", tz="UTC"))
+        self.assertEqual(data.index[-1], pd.Timestamp("2020-03-31 23:00", tz="UTC"))
+        self.assertTrue(data.index.is_unique)
+
+        fetched.clear()
+        json_file = os.path.join(cache_dir, "tiles.json")
+        tiles = month_tiles(datetime.date(2020, 2, 1), datetime.date(2020, 4, 30))
+        extended, _ = handle_tile_caching(
+            "tiles", cache_dir, tiles, fetch, write_json=json_file
+        )
+        self.assertEqual(fetched, [datetime.date(2020, 4, 1)])
+        pd.testing.assert_frame_equal(
+            extended.loc[:"2020-03-31"], data.loc["2020-02-01":], check_freq=False
+        )
+        with open(json_file, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["index"]), len(extended))
+
+        fetched.clear()
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        for _ in range(2):
+            handle_tile_caching("tiles", cache_dir, month_tiles(today, today), fetch)
+        self.assertEqual(fetched, [today, today])
+
     def test_clear_cache(self):
         """
         Test if the `clear_cache` function correctly clears the specified cache directory.
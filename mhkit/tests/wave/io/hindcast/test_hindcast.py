@@ -23,11 +23,18 @@ Run the script directly as a standalone program, or import the
 TestWPTOhindcast class in another test suite.
 """
 
+import os
+import tempfile
 import unittest
+from unittest import mock
 from os.path import abspath, dirname, join, normpath
 from pandas.testing import assert_frame_equal
 import xarray.testing as xrt
+import numpy as np
 import pandas as pd
+import pytest
+import h5py
+from rex import MultiYearWaveX
 import mhkit.wave as wave
 import xarray as xr
 
@@ -37,6 +44,40 @@ datadir = normpath(
 )
 
 
+def _write_wave_file(filename, year, seed):
+    """
+    Write a small WPTO-format hindcast file on a 4x4 grid off the West Coast
+    """
+    rng = np.random.default_rng(seed)
+    time = pd.date_range(f"{year}-01-01", f"{year}-01-05", freq="3h")
+    lat = np.repeat(np.arange(40, 42, 0.5), 4)
+    lon = np.tile(np.arange(-126, -124, 0.5), 4)
+    meta = np.zeros(
+        len(lat),
+        dtype=[
+            ("latitude", "f4"),
+            ("longitude", "f4"),
+            ("water_depth", "f4"),
+            ("jurisdiction", "S20"),
+        ],
+    )
+    meta["latitude"] = lat
+    meta["longitude"] = lon
+    meta["water_depth"] = rng.random(len(lat)) * 100
+    meta["jurisdiction"] = b"Federal"
+    with h5py.File(filename, "w") as f:
+        f["meta"] = meta
+        f["time_index"] = np.array([str(t) for t in time], dtype="S")
+        f["coordinates"] = np.stack([lat, lon], axis=1).astype("f4")
+        for name in ["significant_wave_height", "energy_period"]:
+            f[name] = (rng.random((len(time), len(lat))) * 10).astype("f4")
+        f["frequency"] = np.linspace(0.03, 0.5, 5).astype("f4")
+        f["direction"] = np.arange(0, 360, 90).astype("f4")
+        f["directional_wave_spectrum"] = rng.random((len(time), 5, 4, len(lat))).astype(
+            "f4"
+        )
+
+
 class TestWPTOhindcast(unittest.TestCase):
     """
     A test call designed to check the WPTO hindcast retrival
@@ -302,6 +343,153 @@ class TestWPTOhindcast(unittest.TestCase):
         ), "The directional spectrum datasets are not equal"
         assert_frame_equal(self.dir_spectra_meta, meta)
 
+    def test_region_selection_array(self):
+        """
+        Test an (N, 2) array of coordinates is classified in one call the
+        same as each pair on its own
+        """
+        rng = np.random.default_rng(0)
+        lat_lon = np.column_stack(
+            [rng.uniform(15, 48, 1000), rng.uniform(-164, -66, 1000)]
+        )
+        inside = wave.io.hindcast.regions.region_index("wpto").contains(lat_lon)
+        lat_lon = lat_lon[inside.any(axis=1)]
+
+        regions = wave.io.hindcast.hindcast.region_selection(lat_lon)
+
+        self.assertEqual(regions.shape, (len(lat_lon),))
+        self.assertEqual(
+            regions.tolist(),
+            [
+                wave.io.hindcast.hindcast.region_selection(tuple(point))
+                for point in lat_lon.tolist()
+            ],
+        )
+        self.assertEqual(set(regions.tolist()), {"Hawaii", "West_Coast", "Atlantic"})
+        with self.assertRaises(ValueError):
+            wave.io.hindcast.hindcast.region_selection(
+                np.array([[44.6, -124.3], [0.0, 0.0]])
+            )
+
+    def test_point_data_local_cache(self):
+        """
+        Test point requests against local files are cached per gid,
+        parameter, and year, and re-requests do not reopen the files
+        """
+        points = [(40.6, -125.4), (41.1, -124.6)]
+        parameters = ["significant_wave_height", "energy_period"]
+        years = [1995, 1996]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for year in years:
+                _write_wave_file(join(tmpdir, f"West_Coast_wave_{year}.h5"), year, year)
+            path = join(tmpdir, "West_Coast_wave_*.h5")
+            with MultiYearWaveX(path, years=years, hsds=False) as rex_wave:
+                expected = rex_wave.get_lat_lon_df(parameters[1], points)
+
+            with mock.patch.object(
+                wave.io.hindcast.hindcast,
+                "_get_cache_dir",
+                return_value=join(tmpdir, "hindcast"),
+            ):
+                data, meta = wave.io.hindcast.hindcast.request_wpto_point_data(
+                    "3-hour", parameters, points, years, hsds=False, path=path
+                )
+                # 2 gids, then 2 gids x 2 parameters x 2 years
+                self.assertEqual(len(os.listdir(join(tmpdir, "hindcast"))), 10)
+
+                with mock.patch.object(
+                    wave.io.hindcast.hindcast,
+                    "MultiYearWaveX",
+                    side_effect=AssertionError("file reopened"),
+                ):
+                    cached, cached_meta = (
+                        wave.io.hindcast.hindcast.request_wpto_point_data(
+                            "3-hour",
+                            parameters[1],
+                            points,
+                            years,
+                            hsds=False,
+                            path=path,
+                        )
+                    )
+                    dataset, _ = wave.io.hindcast.hindcast.request_wpto_point_data(
+                        "3-hour",
+                        parameters,
+                        points,
+                        years,
+                        hsds=False,
+                        path=path,
+                        to_pandas=False,
+                    )
+
+        # One parameter coordinate per data variable, i.e. parameter and point
+        self.assertEqual(list(dataset["parameter"].values), list(data.columns))
+        np.testing.assert_array_equal(
+            dataset["energy_period_1"].values, data["energy_period_1"].values
+        )
+        self.assertEqual(
+            list(data.columns),
+            [f"{p}_{i}" for p in parameters for i in range(len(points))],
+        )
+        np.testing.assert_array_equal(
+            data[["energy_period_0", "energy_period_1"]].values, expected.values
+        )
+        assert_frame_equal(cached, data[["energy_period_0", "energy_period_1"]])
+        assert_frame_equal(cached_meta, meta)
+        self.assertEqual(list(meta["gid"]), list(expected.columns))
+
+    def test_directional_spectrum_store(self):
+        """
+        Test directional spectra downloaded in chunks into a Zarr store
+        match the in-memory request, and an interrupted download resumes
+        from the last completed chunk
+        """
+        pytest.importorskip("zarr")
+        pytest.importorskip("dask")
+        hindcast = wave.io.hindcast.hindcast
+        points = [(40.6, -125.4), (41.1, -124.6)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = join(tmpdir, "West_Coast_wave_1995.h5")
+            _write_wave_file(path, 1995, 1995)
+            output = join(tmpdir, "spectra.zarr")
+            kwargs = {"output": output, "chunk_size": 10}
+            with mock.patch.object(
+                hindcast, "_get_cache_dir", return_value=join(tmpdir, "hindcast")
+            ):
+                expected, expected_meta = hindcast.request_wpto_directional_spectrum(
+                    points, "1995", hsds=False, path=path
+                )
+
+            request_spectrum = hindcast._request_spectrum
+            requested = []
+
+            def interrupted(rex_waves, time_slice, gid):
+                requested.append(time_slice.start)
+                if len(requested) == 3:
+                    raise ConnectionError("interrupted")
+                return request_spectrum(rex_waves, time_slice, gid)
+
+            with mock.patch.object(
+                hindcast, "_request_spectrum", side_effect=interrupted
+            ):
+                with self.assertRaises(ConnectionError):
+                    hindcast.request_wpto_directional_spectrum(
+                        points, "1995", hsds=False, path=path, **kwargs
+                    )
+                data, meta = hindcast.request_wpto_directional_spectrum(
+                    points, "1995", hsds=False, path=path, **kwargs
+                )
+            self.assertEqual(requested, [0, 10, 20, 20, 30])
+            self.assertEqual(data.attrs["completed_chunks"], 4)
+            self.assertIsNotNone(data["spectral_density"].chunks)
+            xrt.assert_equal(data.load(), expected)
+            assert_frame_equal(meta, expected_meta)
+
+            with self.assertRaises(ValueError):
+                hindcast.request_wpto_directional_spectrum(
+                    points[0], "1995", hsds=False, path=path, output=output
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ from os.path import abspath, dirname, join, isfile, normpath, relpath
 from pandas.testing import assert_frame_equal
 import matplotlib.pylab as plt
 import mhkit.wave.io.hindcast.wind_toolkit as wtk
+import numpy as np
 import pandas as pd
 import unittest
 import pytest
@@ -342,6 +343,24 @@ class TestWINDToolkit(unittest.TestCase):
         region = wtk.region_selection((39.3, -70.3), preferred_region="")
         assert region == "Mid_Atlantic"
 
+    # test region_selection on an array of coordinates
+    def test_region_array(self):
+        lat_lon = np.array(
+            [(41.9, -125.3), (36.3, -122.3), (16.3, -155.3), (45.3, -126.3)]
+        )
+        regions = wtk.region_selection(lat_lon, preferred_region="NW_Pacific")
+        assert regions.tolist() == [
+            "NW_Pacific",
+            "Offshore_CA",
+            "Hawaii",
+            "NW_Pacific",
+        ]
+
+        with self.assertRaises(TypeError):
+            wtk.region_selection(lat_lon)
+        with self.assertRaises(TypeError):
+            wtk.region_selection(np.array([(39.3, -70.3), (0.0, 0.0)]))
+
     # test the check for multiple region
     def test_multi_region(self):
         data_type = "1-hour"
@@ -2,7 +2,10 @@ from os.path import abspath, dirname, join, isfile, normpath
 import matplotlib.pylab as plt
 from datetime import datetime
 import mhkit.wave as wave
+import numpy as np
+import pandas as pd
 import unittest
+import tempfile
 import netCDF4
 import pytz
 import os
@@ -193,5 +196,131 @@ class TestIOcdip(unittest.TestCase):
         os.remove(filename)
 
 
+class TestIOcdipLocal(unittest.TestCase):
+    """
+    Tests the CDIP parsing functions against a local netCDF file standing
+    in for the THREDDS server
+    """
+
+    @classmethod
+    def setUpClass(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        filename = join(self.tmpdir.name, "cdip_test.nc")
+        rng = np.random.default_rng(0)
+        wave_time = pd.date_range("2011-01-01", "2013-01-01", freq="3h")
+        sst_time = pd.date_range("2011-01-01", "2013-01-01", freq="12h")
+        self.wave_time = wave_time.astype("int64").values // 10**9
+        self.sst_time = sst_time.astype("int64").values // 10**9
+        self.frequency = np.linspace(0.025, 0.58, 16).astype("f4")
+        self.Hs = rng.random(len(wave_time)).astype("f4")
+        self.energy_density = rng.random((len(wave_time), 16)).astype("f4")
+
+        with netCDF4.Dataset(filename, "w") as nc:
+            nc.createDimension("waveTime", len(wave_time))
+            nc.createDimension("sstTime", len(sst_time))
+            nc.createDimension("waveFrequency", 16)
+            nc.createDimension("metaStationNameLength", 4)
+
+            def add(name, dtype, dims, values, **kwargs):
+                nc.createVariable(name, dtype, dims, **kwargs)[:] = values
+
+            add("waveTime", "i4", ("waveTime",), self.wave_time)
+            add("waveHs", "f4", ("waveTime",), self.Hs)
+            add("waveFrequency", "f4", ("waveFrequency",), self.frequency)
+            add(
+                "waveEnergyDensity",
+                "f4",
+                ("waveTime", "waveFrequency"),
+                self.energy_density,
+            )
+            # A missing time value
+            sst_time = np.ma.masked_equal(self.sst_time, self.sst_time[100])
+            add("sstTime", "i4", ("sstTime",), sst_time, fill_value=-1)
+            sst = rng.random(len(sst_time))
+            add("sstSeaSurfaceTemperature", "f4", ("sstTime",), sst)
+            name = np.array(list("TEST"), "S1")
+            add("metaStationName", "S1", ("metaStationNameLength",), name)
+        self.test_nc = netCDF4.Dataset(filename)
+
+    @classmethod
+    def tearDownClass(self):
+        self.test_nc.close()
+        self.tmpdir.cleanup()
+
+    def test_get_netcdf_variables_time_window(self):
+        data = wave.io.cdip.get_netcdf_variables(
+            self.test_nc,
+            start_date="2011-10-01",
+            end_date="2011-10-31",
+            parameters=["waveHs", "waveEnergyDensity", "sstSeaSurfaceTemperature"],
+            silent=True,
+        )
+
+        start = datetime(2011, 10, 1).timestamp()
+        end = datetime(2011, 10, 31).timestamp()
+        inside = (self.wave_time >= start) & (self.wave_time <= end)
+        wave1D = data["data"]["wave"]
+        self.assertEqual(data["metadata"]["name"], "TEST")
+        np.testing.assert_array_equal(
+            wave1D.index, pd.to_datetime(self.wave_time[inside], unit="s")
+        )
+        np.testing.assert_array_equal(wave1D["waveHs"], self.Hs[inside])
+        np.testing.assert_array_equal(
+            data["data"]["wave2D"]["waveEnergyDensity"], self.energy_density[inside]
+        )
+        np.testing.assert_array_equal(
+            data["metadata"]["wave"]["waveFrequency"], self.frequency
+        )
+        # The missing sst time is dropped
+        sst_inside = (self.sst_time >= start) & (self.sst_time <= end)
+        sst_inside[100] = False
+        self.assertEqual(len(data["data"]["sst"]), sst_inside.sum())
+
+    def test_process_multiyear_data(self):
+        parameters = ["waveHs", "waveEnergyDensity", "sstSeaSurfaceTemperature"]
+        data = wave.io.cdip._process_multiyear_data(
+            self.test_nc, [2011, 2012], parameters, False
+        )
+
+        for year in [2011, 2012]:
+            start = datetime(year, 1, 1).timestamp()
+            end = datetime(year + 1, 1, 1).timestamp()
+            inside = (self.wave_time >= start) & (self.wave_time <= end)
+            wave1D = data[year]["data"]["wave"]
+            np.testing.assert_array_equal(
+                wave1D.index, pd.to_datetime(self.wave_time[inside], unit="s")
+            )
+            np.testing.assert_array_equal(wave1D["waveHs"], self.Hs[inside])
+            np.testing.assert_array_equal(
+                data[year]["data"]["wave2D"]["waveEnergyDensity"],
+                self.energy_density[inside],
+            )
+            # The missing sst time is dropped
+            sst_inside = (self.sst_time >= start) & (self.sst_time <= end)
+            sst_inside[100] = False
+            self.assertEqual(len(data[year]["data"]["sst"]), sst_inside.sum())
+
+    def test_read_time_windows(self):
+        class Variable:
+            def __init__(self, values):
+                self.values = values
+                self.shape = values.shape
+                self.dtype = values.dtype
+                self.requests = []
+
+            def __getitem__(self, index):
+                self.requests.append(index)
+                return self.values[index]
+
+        variable = Variable(np.arange(100))
+        slices = [slice(40, 60), slice(0, 10), slice(10, 20), slice(45, 50)]
+        values = wave.io.cdip._read_time_windows(variable, slices)
+
+        # Adjacent and overlapping windows are read together
+        self.assertEqual(variable.requests, [slice(0, 20), slice(40, 60)])
+        for index, value in zip(slices, values):
+            np.testing.assert_array_equal(value, variable.values[index])
+
+
 if __name__ == "__main__":
     unittest.main()
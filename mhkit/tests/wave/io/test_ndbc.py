@@ -134,6 +134,32 @@ class TestIOndbc(unittest.TestCase):
         self.assertEqual(data.shape, (28468, 5))
         self.assertEqual(units, wave.io.ndbc.parameter_units("cwind"))
 
+    def test_ndbc_read_text(self):
+        # Units row below the header is skipped when parsing downloaded bytes
+        with open(join(datadir, "46002c2016.txt"), "rb") as f:
+            data, units = wave.io.ndbc._read_ndbc_text(f.read())
+        self.assertEqual(list(data.columns[:5]), ["#YY", "MM", "DD", "hh", "mm"])
+        self.assertEqual(units[:2], ["#yr", "mo"])
+        self.assertEqual(data.shape, (28468, 10))
+        self.assertEqual(data["#YY"].dtype, np.int64)
+
+        # Missing values of realtime data are mapped while parsing
+        data, _ = wave.io.ndbc.read_file(join(datadir, "46097.txt"))
+        self.assertTrue((data.dtypes == float).all())
+        self.assertTrue(data["GST"].isna().any())
+
+        # Two digit years of historical spectral files
+        dt = wave.io.ndbc.to_datetime_index("swden", self.swden)
+        self.assertEqual(dt.index[1], datetime(1996, 1, 1, 1, 0))
+        date = wave.io.ndbc._ndbc_datetime(
+            [96, 5], [12, 1], [31, 2], [23, 0], two_digit_year=True
+        )
+        np.testing.assert_array_equal(
+            date, np.array(["1996-12-31T23:00", "2005-01-02T00:00"], "M8[ns]")
+        )
+        with self.assertRaises(ValueError):
+            wave.io.ndbc._ndbc_datetime([2020], [13], [1], [0])
+
     def test_ndbc_available_data(self):
         data = wave.io.ndbc.available_data("swden", buoy_number="46029")
         cols = data.columns.tolist()
@@ -249,6 +275,67 @@ class TestIOndbc(unittest.TestCase):
         self.assertEqual(spectrum.shape, (47, 180))
         self.assertEqual(spectrum.units, "m^2/Hz/deg")
 
+    def test_ndbc_directional_spectrum_dates(self):
+        rng = np.random.default_rng(1)
+        dates = pd.date_range("2021-01-01", periods=10, freq="h")
+        frequencies = np.linspace(0.02, 0.485, 47)
+        bounds = {
+            "swden": (0, 5),
+            "swdir": (0, 360),
+            "swdir2": (0, 360),
+            "swr1": (0, 1),
+            "swr2": (0, 1),
+        }
+        data = xr.Dataset(
+            {
+                name: (("date", "frequency"), rng.uniform(*bound, (10, 47)))
+                for name, bound in bounds.items()
+            },
+            coords={"date": dates, "frequency": frequencies},
+        )
+        directions = np.arange(0, 360, 2.0)
+
+        spectrum = wave.io.ndbc.create_directional_spectrum(data, directions)
+        self.assertEqual(spectrum.dims, ("date", "frequency", "direction"))
+        self.assertEqual(spectrum.shape, (10, 47, 180))
+        # Each date matches the spectrum of that date alone
+        single = wave.io.ndbc.create_directional_spectrum(data.isel(date=3), directions)
+        np.testing.assert_allclose(spectrum.isel(date=3), single, rtol=1e-12)
+
+        spectrum32 = wave.io.ndbc.create_directional_spectrum(
+            data, directions, chunk_size=3, dtype=np.float32
+        )
+        self.assertEqual(spectrum32.dtype, np.float32)
+        np.testing.assert_allclose(spectrum32, spectrum, rtol=1e-4, atol=1e-5)
+
+        spread = wave.io.ndbc.create_spread_function(data, directions, chunk_size=4)
+        self.assertEqual(spread.units, "1/Hz/deg")
+        np.testing.assert_allclose(
+            spread * data["swden"], spectrum, rtol=1e-12, atol=1e-14
+        )
+
+        # Integrated quantities match those of the full spectrum
+        statistics = wave.io.ndbc.directional_spectrum_statistics(data, directions)
+        angle = np.deg2rad(directions)
+        mean_direction = np.rad2deg(
+            np.arctan2(
+                (spectrum * np.sin(angle)).sum("direction"),
+                (spectrum * np.cos(angle)).sum("direction"),
+            )
+        )
+        np.testing.assert_allclose(
+            statistics["mean_direction"], mean_direction % 360, atol=1e-8
+        )
+        np.testing.assert_allclose(
+            statistics["direction_spectrum"],
+            spectrum.integrate("frequency"),
+            rtol=1e-10,
+        )
+        self.assertEqual(statistics["directional_spread"].dims, ("date", "frequency"))
+
+        with self.assertRaises(ValueError):
+            wave.io.ndbc.create_directional_spectrum(data, directions, dtype=int)
+
     def test_plot_directional_spectrum(self):
         directions = np.arange(0, 360, 2.0)
         spectrum = wave.io.ndbc.create_spread_function(
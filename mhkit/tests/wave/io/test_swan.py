@@ -71,6 +71,54 @@ class TestSWAN(unittest.TestCase):
         sumSum = swanBlockTxt["Significant wave height"].sum().sum()
         self.assertAlmostEqual(self.expected_table["Hsig"].sum(), sumSum, places=-2)
 
+    def test_read_block_txt_nan_fields(self):
+        swan_file = join(testdir, "swan_nan_fields.DAT")
+        with open(swan_file, "w") as f:
+            f.write(
+                "% Run:TEST  Frame:  COMPGRID **  Significant wave height"
+                "     , Unit:  0.1000E-01 m\n%\n%\n%         X --->\n%\n"
+                "%     0   1   2   3\n%Y\n"
+                "    1 100.****998.  0.\n"
+                "    0 ********  5. 12.\n"
+            )
+        swanBlockTxt, metaData = wave.io.swan.read_block(swan_file)
+        os.remove(swan_file)
+
+        assert_allclose(
+            swanBlockTxt["Significant wave height"].values,
+            [[1.0, np.nan, 9.98, 0.0], [np.nan, np.nan, 0.05, 0.12]],
+        )
+        self.assertEqual(metaData["Significant wave height"]["unitMultiplier"], 0.01)
+
+    def test_read_block_dataset(self):
+        swanBlockTxt, _ = wave.io.swan.read_block(self.swan_block_txt_file)
+        dataset, _ = wave.io.swan.read_block_dataset(self.swan_block_txt_file)
+        self.assertEqual(dict(dataset.sizes), {"x": 101, "y": 101})
+        self.assertEqual(dataset["Significant wave height"].units, "m")
+
+        table = wave.io.swan.dictionary_of_block_to_table(swanBlockTxt)
+        for name in swanBlockTxt:
+            assert_allclose(dataset[name].values.ravel(), table[name].values)
+
+        dataset_mat, _ = wave.io.swan.read_block_dataset(self.swan_block_mat_file)
+        self.assertEqual(list(dataset_mat.data_vars), ["Hsig", "Dir", "RTpeak", "TDir"])
+
+    def test_read_block_mat_lazy(self):
+        swanBlockMat, metaDataMat = wave.io.swan.read_block(self.swan_block_mat_file)
+        lazyBlockMat, lazyMetaData = wave.io.swan.read_block(
+            self.swan_block_mat_file, lazy=True
+        )
+        self.assertEqual(lazyMetaData, metaDataMat)
+        self.assertEqual(len(lazyBlockMat), 4)
+        assert_frame_equal(lazyBlockMat["Hsig"], swanBlockMat["Hsig"])
+        # Only the accessed variable has been read
+        self.assertEqual(list(lazyBlockMat._loaded), ["Hsig"])
+
+        lazyBlockMat, _ = wave.io.swan.read_block(
+            self.swan_block_mat_file, to_pandas=False, lazy=True
+        )
+        self.assertIsInstance(lazyBlockMat["Dir"], xr.Dataset)
+
     def test_block_to_table(self):
         x = np.arange(5)
         y = np.arange(5, 10)
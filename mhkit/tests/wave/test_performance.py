@@ -1,6 +1,7 @@
 from os.path import abspath, dirname, join, isfile, normpath, relpath
 import matplotlib.pylab as plt
 import xarray.testing as xrt
+import xarray as xr
 import mhkit.wave as wave
 import pandas as pd
 import numpy as np
@@ -74,6 +75,40 @@ class TestPerformance(unittest.TestCase):
         self.assertEqual(JM.shape, (38, 9))
         self.assertEqual(JM.isna().sum().sum(), 131)
 
+    def test_performance_matrices(self):
+        L = wave.performance.capture_length(self.data["P"], self.data["J"])
+        data = {"L": L, "J": self.data["J"]}
+        statistics = ["mean", "std", "median", "count", "sum", "min", "max"]
+        statistics.append("frequency")
+        M = wave.performance.performance_matrices(
+            self.data["Hm0"], self.data["Te"], data, self.Hm0_bins, self.Te_bins
+        )
+
+        self.assertEqual(M["L"].shape, (8, 38, 9))
+        for name, values in data.items():
+            for statistic in statistics:
+                expected = wave.performance.capture_length_matrix(
+                    self.data["Hm0"],
+                    self.data["Te"],
+                    values,
+                    statistic,
+                    self.Hm0_bins,
+                    self.Te_bins,
+                    to_pandas=False,
+                )
+                np.testing.assert_allclose(
+                    M[name].sel(statistic=statistic), expected, rtol=1e-10
+                )
+
+        # Matrices updated in chunks of sea states match
+        accumulator = wave.performance.PerformanceMatrices(self.Hm0_bins, self.Te_bins)
+        for i in range(0, len(self.data), 30000):
+            chunk = self.data.iloc[i : i + 30000]
+            accumulator.update(
+                chunk["Hm0"], chunk["Te"], {"L": L.iloc[i : i + 30000], "J": chunk["J"]}
+            )
+        xrt.assert_allclose(accumulator.to_dataset(), M, rtol=1e-10)
+
     def test_power_matrix(self):
         L = wave.performance.capture_length(self.data["P"], self.data["J"])
         LM = wave.performance.capture_length_matrix(
@@ -100,6 +135,55 @@ class TestPerformance(unittest.TestCase):
 
         self.assertAlmostEqual(maep, 1754020.077, 2)
 
+    def test_mean_annual_energy_production_accumulator(self):
+        L = wave.performance.capture_length(self.data["P"], self.data["J"])
+        M = wave.performance.performance_matrices(
+            self.data["Hm0"],
+            self.data["Te"],
+            {"L": L, "J": self.data["J"]},
+            self.Hm0_bins,
+            self.Te_bins,
+            statistics=["mean", "frequency"],
+        )
+        LM = M["L"].sel(statistic="mean", drop=True)
+        JM = M["J"].sel(statistic="mean", drop=True)
+        expected = wave.performance.mean_annual_energy_production_matrix(
+            LM, JM, M["L"].sel(statistic="frequency", drop=True)
+        )
+
+        # Accumulate sea states in two parts, then merge
+        first = wave.performance.PerformanceMatrices(
+            self.Hm0_bins, self.Te_bins, ["frequency"]
+        )
+        second = wave.performance.PerformanceMatrices(
+            self.Hm0_bins, self.Te_bins, ["frequency"]
+        )
+        for part, sl in [(first, slice(0, 40000)), (second, slice(40000, None))]:
+            data = self.data[sl]
+            part.update(data["Hm0"], data["Te"], {"J": data["J"]})
+        accumulator = first + second
+        self.assertEqual(accumulator.n_samples, len(self.data))
+
+        # Medians cannot be merged from matrices that did not keep the samples
+        median = wave.performance.PerformanceMatrices(
+            self.Hm0_bins, self.Te_bins, ["frequency", "median"]
+        )
+        median.update(
+            self.data["Hm0"][:10], self.data["Te"][:10], {"J": self.data["J"][:10]}
+        )
+        with self.assertRaises(ValueError):
+            median.merge(second)
+
+        scale = xr.DataArray([0.5, 1.0, 2.0], dims="wec")
+        maep = accumulator.mean_annual_energy_production(scale * LM * JM)
+        self.assertEqual(maep.dims, ("wec",))
+        np.testing.assert_allclose(maep, [0.5 * expected, expected, 2 * expected])
+        self.assertAlmostEqual(
+            accumulator.mean_annual_energy_production(capture_length_matrices=LM.values)
+            / expected,
+            1,
+        )
+
     def test_plot_matrix(self):
         filename = abspath(join(plotdir, "wave_plot_matrix.png"))
         if isfile(filename):
@@ -10,10 +10,10 @@ JSON formats, and writing data to a JSON file.
 Functions:
 ----------
 request_noaa_data(station, parameter, start_date, end_date, proxy=None,
-  write_json=None):
+  write_json=None, clear_cache=False, to_pandas=True, max_workers=4):
     Loads NOAA current data from the API into a pandas DataFrame,
     with optional support for proxy settings and writing data to a JSON
-    file.
+    file. Data is cached by month.
 
 _xml_to_dataframe(response):
     Converts NOAA response data in XML format into a pandas DataFrame
@@ -28,11 +28,9 @@ import os
 import xml.etree.ElementTree as ET
 import datetime
 import json
-import math
-import shutil
 import pandas as pd
 import requests
-from mhkit.utils.cache import handle_caching
+from mhkit.utils.cache import handle_tile_caching, month_tiles
 
 
 def request_noaa_data(
@@ -44,12 +42,15 @@ def request_noaa_data(
     write_json=None,
     clear_cache=False,
     to_pandas=True,
+    max_workers=4,
 ):
     """
     Loads NOAA current data directly from https://api.tidesandcurrents.noaa.gov/api/prod/
     into a pandas DataFrame. NOAA sets max of 31 days between start and end date.
     See https://api.tidesandcurrents.noaa.gov/api/prod/ for options. All times are reported as
-    GMT and metric units are returned for data. Uses cached data if available.
+    GMT and metric units are returned for data. Data is cached by month, so that only
+    the months missing from the cache are requested, concurrently. The current month
+    is requested every time.
 
     The request URL prints to the screen.
 
@@ -74,6 +75,8 @@ def request_noaa_data(
         If True, the cache for this specific request will be cleared.
     to_pandas : bool, optional
         Flag to output pandas instead of xarray. Default = True.
+    max_workers : int, optional
+        Maximum number of months requested at once. Default = 4.
 
     Returns
     -------
@@ -115,112 +118,90 @@ def request_noaa_data(
         )
     if not isinstance(to_pandas, bool):
         raise TypeError(f"to_pandas must be of type bool. Got: {type(to_pandas)}")
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError(
+            f"Expected 'max_workers' to be a positive int, but got {max_workers}"
+        )
 
     # Define the path to the cache directory
     cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "mhkit", "noaa")
 
-    # Create a unique filename based on the function parameters
-    hash_params = f"{station}_{parameter}_{start_date}_{end_date}"
-
-    # Use handle_caching to manage cache
-    cached_data, cached_metadata, cache_filepath = handle_caching(
-        hash_params,
-        cache_dir,
-        cache_content={"data": None, "metadata": None, "write_json": write_json},
-        clear_cache_file=clear_cache,
-    )
+    # Convert start and end dates to datetime objects
+    begin = datetime.datetime.strptime(start_date, "%Y%m%d").date()
+    end = datetime.datetime.strptime(end_date, "%Y%m%d").date()
 
-    if cached_data is not None:
-        if write_json:
-            shutil.copy(cache_filepath, write_json)
-        if to_pandas:
-            return cached_data, cached_metadata
-        else:
-            cached_data = cached_data.to_xarray()
-            cached_data.attrs = cached_metadata
-            return cached_data
-    # If no cached data is available, make the API request
-    # no coverage bc in coverage runs we have already cached the data/ run this code
-    else:  # pragma: no cover
-        # Convert start and end dates to datetime objects
-        begin = datetime.datetime.strptime(start_date, "%Y%m%d").date()
-        end = datetime.datetime.strptime(end_date, "%Y%m%d").date()
-
-        # Determine the number of 30 day intervals
-        delta = 30
-        interval = math.ceil(((end - begin).days) / delta)
-
-        # Create date ranges with 30 day intervals
-        date_list = [
-            begin + datetime.timedelta(days=i * delta) for i in range(interval + 1)
-        ]
-        date_list[-1] = end
-
-        # Iterate over date_list (30 day intervals) and fetch data
-        data_frames = []
-        for i in range(len(date_list) - 1):
-            start_date = date_list[i].strftime("%Y%m%d")
-            end_date = date_list[i + 1].strftime("%Y%m%d")
-
-            api_query = f"begin_date={start_date}&end_date={end_date}&station={station}&product={parameter}&units=metric&time_zone=gmt&application=web_services&format=xml"
-            # Add datum to water level inquiries
-            if parameter == "water_level":
-                api_query += "&datum=MLLW"
-            data_url = f"https://tidesandcurrents.noaa.gov/api/datagetter?{api_query}"
-
-            print(f"Data request URL: {data_url}\n")
-
-            # Get response
-            try:
-                response = requests.get(url=data_url, proxies=proxy)
-                response.raise_for_status()
-                # Catch non-exception errors
-                if "error" in response.content.decode():
-                    raise Exception(response.content.decode())
-            except Exception as err:
-                if err.__class__ == requests.exceptions.HTTPError:
-                    print(f"HTTP error occurred: {err}")
-                    print(f"Error message: {response.content.decode()}\n")
-                    continue
-                elif err.__class__ == requests.exceptions.RequestException:
-                    print(f"Requests error occurred: {err}")
-                    print(f"Error message: {response.content.decode()}\n")
-                    continue
-                else:
-                    print(f"Requests error occurred: {err}\n")
-                    continue
-
-            # Convert to DataFrame and save in data_frames list
-            df, metadata = _xml_to_dataframe(response)
-            data_frames.append(df)
-
-        # Concatenate all DataFrames
-        if data_frames:
-            data = pd.concat(data_frames, ignore_index=False)
-        else:
-            raise ValueError("No data retrieved.")
+    # Data is cached by month, so only the months that are not cached are
+    # requested. NOAA sets a max of 31 days per request.
+    with requests.Session() as session:
 
-        # Remove duplicated date values
-        data = data.loc[~data.index.duplicated()]
+        def fetch(tile_start, tile_end):  # pragma: no cover
+            return _request_noaa_tile(
+                session, station, parameter, tile_start, tile_end, proxy
+            )
 
-        # After making the API request and processing the response, write the
-        #  response to a cache file
-        handle_caching(
-            hash_params,
+        data, metadata = handle_tile_caching(
+            f"{station}_{parameter}",
             cache_dir,
-            cache_content={"data": data, "metadata": metadata, "write_json": None},
+            month_tiles(begin, end),
+            fetch,
+            max_workers=max_workers,
+            write_json=write_json,
             clear_cache_file=clear_cache,
         )
 
-        if write_json:
-            shutil.copy(cache_filepath, write_json)
+    if data is None:
+        raise ValueError("No data retrieved.")
+
+    if to_pandas:
+        return data, metadata
+    else:
+        data = data.to_xarray()
+        data.attrs = metadata
+        return data
+
 
-        if to_pandas:
-            return data, metadata
+def _request_noaa_tile(
+    session, station, parameter, start_date, end_date, proxy=None
+):  # pragma: no cover
+    """
+    Returns the data and metadata of a NOAA request between two dates
+    (inclusive), or (None, None) if the request failed
+    """
+    start_date = start_date.strftime("%Y%m%d")
+    end_date = end_date.strftime("%Y%m%d")
+
+    api_query = f"begin_date={start_date}&end_date={end_date}&station={station}&product={parameter}&units=metric&time_zone=gmt&application=web_services&format=xml"
+    # Add datum to water level inquiries
+    if parameter == "water_level":
+        api_query += "&datum=MLLW"
+    data_url = f"https://tidesandcurrents.noaa.gov/api/datagetter?{api_query}"
+
+    print(f"Data request URL: {data_url}\n")
+
+    # Get response
+    try:
+        response = session.get(url=data_url, proxies=proxy)
+        response.raise_for_status()
+        # Catch non-exception errors
+        if "error" in response.content.decode():
+            raise Exception(response.content.decode())
+    except Exception as err:
+        if err.__class__ == requests.exceptions.HTTPError:
+            print(f"HTTP error occurred: {err}")
+            print(f"Error message: {response.content.decode()}\n")
+        elif err.__class__ == requests.exceptions.RequestException:
+            print(f"Requests error occurred: {err}")
+            print(f"Error message: {response.content.decode()}\n")
         else:
-            data = data.to_xarray()
-            data.attrs = metadata
-            return data
+            print(f"Requests error occurred: {err}\n")
+        return None, None
+
+    # Convert to DataFrame
+    result = _xml_to_dataframe(response)
+    if result is None:
+        return None, None
+
+    return result
 
 
 def _xml_to_dataframe(response):
@@ -13,7 +13,7 @@ from .stat_utils import (
     magnitude_phase,
     unorm,
 )
-from .cache import handle_caching, clear_cache
+from .cache import handle_caching, handle_tile_caching, month_tiles, clear_cache
 from .upcrossing import upcrossing, peaks, troughs, heights, periods, custom
 from .type_handling import (
     to_numeric_array,
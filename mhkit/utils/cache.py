@@ -6,7 +6,7 @@ perform cache clearing operations. Cache files are utilized to store data
 temporarily, mitigating the need to re-fetch or recompute the same data multiple 
 times, which can be especially useful in network-dependent tasks.
 
-The module consists of two main functions:
+The module consists of three main functions:
 
 1. `handle_caching`:
    This function manages the caching of data. It provides options to read from 
@@ -18,7 +18,14 @@ The module consists of two main functions:
    pickle file formats for caching. This function returns the loaded data and 
    metadata from the cache file, along with the cache file path.
 
-2. `clear_cache`:
+2. `handle_tile_caching`:
+   This function assembles a time range of data from fixed time tiles, such
+   as the months returned by `month_tiles`. Each tile is cached separately
+   with `handle_caching`, so that only the tiles missing from the cache are
+   fetched, concurrently. Tiles that end before today are cached; the tile
+   holding today's data is fetched on every request.
+
+3. `clear_cache`:
    This function enables the clearing of either specific sub-directories or the 
    entire cache directory, depending on the parameter passed. It removes the 
    specified directory and then recreates it to ensure future caching tasks can 
@@ -27,6 +34,8 @@ The module consists of two main functions:
 
 Module Dependencies:
 --------------------
+    - concurrent.futures: For fetching missing time tiles concurrently.
+    - datetime: For splitting date ranges into time tiles.
     - hashlib: For creating unique filenames based on hashed parameters.
     - json: For reading and writing JSON formatted cache files.
     - os: For performing operating system dependent tasks like directory creation.
@@ -39,7 +48,9 @@ Author: ssolson
 Date: 2023-09-26
 """
 
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Callable, List
+from concurrent.futures import ThreadPoolExecutor
+import datetime
 import hashlib
 import json
 import os
@@ -126,16 +137,7 @@ def handle_caching(
     def _write_cache(data, metadata, file_extension, cache_filepath):
         """Store data in the cache file based on the extension."""
         if file_extension == ".json":
-            py_data = data.to_dict(orient="split")
-            py_data["metadata"] = metadata
-            if isinstance(data.index, pd.DatetimeIndex):
-                py_data["index"] = [
-                    dt.strftime("%Y-%m-%d %H:%M:%S") for dt in py_data["index"]
-                ]
-            else:
-                py_data["index"] = list(data.index)
-            with open(cache_filepath, "w", encoding="utf-8") as f:
-                json.dump(py_data, f)
+            _write_json(data, metadata, cache_filepath)
         elif file_extension == ".pkl":
             with open(cache_filepath, "wb") as f:
                 pickle.dump((data, metadata), f)
@@ -172,6 +174,219 @@ def handle_caching(
     return None, None, cache_filepath
 
 
+def _write_json(data: pd.DataFrame, metadata: Optional[Dict[str, Any]], filepath: str):
+    """Writes data and metadata to a JSON file in the cache format."""
+    py_data = data.to_dict(orient="split")
+    py_data["metadata"] = metadata
+    if isinstance(data.index, pd.DatetimeIndex):
+        # Keep the UTC offset of timezone-aware times
+        time_format = "%Y-%m-%d %H:%M:%S%z" if data.index.tz else "%Y-%m-%d %H:%M:%S"
+        py_data["index"] = [dt.strftime(time_format) for dt in py_data["index"]]
+    else:
+        py_data["index"] = list(data.index)
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(py_data, f)
+
+
+def month_tiles(
+    start_date: datetime.date, end_date: datetime.date
+) -> List[Tuple[datetime.date, datetime.date]]:
+    """
+    Splits an inclusive date range into tiles at month boundaries.
+
+    Parameters
+    ----------
+    start_date : datetime.date
+        First date of the range.
+    end_date : datetime.date
+        Last date of the range.
+
+    Returns
+    -------
+    List[Tuple[datetime.date, datetime.date]]
+        Inclusive (start, end) dates of each tile. Tiles of whole months
+        are the same for every range that covers them.
+    """
+    tiles = []
+    tile_start = start_date
+    while tile_start <= end_date:
+        month_start = tile_start.replace(day=1)
+        next_month = (month_start + datetime.timedelta(days=32)).replace(day=1)
+        tile_end = min(next_month - datetime.timedelta(days=1), end_date)
+        tiles.append((tile_start, tile_end))
+        tile_start = next_month
+
+    return tiles
+
+
+def _read_cached_tile(
+    params: str, cache_dir: str, clear_cache_file: bool
+) -> Optional[Tuple[pd.DataFrame, Optional[Dict[str, Any]]]]:
+    """
+    Reads a tile cached with `handle_caching`.
+
+    Parameters
+    ----------
+    params : str
+        Parameters of the tile's cache file hash.
+    cache_dir : str
+        Directory where cache files are stored.
+    clear_cache_file : bool
+        Whether to clear the existing cache of the tile.
+
+    Returns
+    -------
+    Optional[Tuple[pd.DataFrame, Optional[Dict[str, Any]]]]
+        Data and metadata of the tile, or None if it is not cached.
+    """
+    data, metadata, _ = handle_caching(
+        params,
+        cache_dir,
+        cache_content={"data": None, "metadata": None, "write_json": None},
+        clear_cache_file=clear_cache_file,
+    )
+    if data is None:
+        return None
+
+    return data, metadata
+
+
+def _fetch_tiles(
+    fetch: Callable[
+        [datetime.date, datetime.date],
+        Tuple[Optional[pd.DataFrame], Optional[Dict[str, Any]]],
+    ],
+    tiles: List[Tuple[Tuple[datetime.date, datetime.date], str]],
+    cache_dir: str,
+    max_workers: int,
+) -> List[Optional[Tuple[pd.DataFrame, Optional[Dict[str, Any]]]]]:
+    """
+    Fetches tiles concurrently and caches those that end before today (UTC).
+
+    Parameters
+    ----------
+    fetch : Callable
+        Function of a tile's start and end dates returning the tile's data
+        and metadata, or (None, None) if the tile could not be retrieved.
+    tiles : List[Tuple[Tuple[datetime.date, datetime.date], str]]
+        Inclusive (start, end) dates of each tile, and the parameters of
+        its cache file hash.
+    cache_dir : str
+        Directory where cache files are stored.
+    max_workers : int
+        Maximum number of tiles fetched at once.
+
+    Returns
+    -------
+    List[Optional[Tuple[pd.DataFrame, Optional[Dict[str, Any]]]]]
+        Data and metadata of each tile, or None if it was not retrieved.
+    """
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        fetched = pool.map(lambda tile: fetch(*tile[0]), tiles)
+        for ((_, end), params), (data, metadata) in zip(tiles, fetched):
+            if data is None:
+                results.append(None)
+                continue
+            results.append((data, metadata))
+            if end < today:
+                handle_caching(
+                    params,
+                    cache_dir,
+                    cache_content={
+                        "data": data,
+                        "metadata": metadata,
+                        "write_json": None,
+                    },
+                )
+
+    return results
+
+
+def handle_tile_caching(  # pylint: disable=too-many-arguments
+    hash_params: str,
+    cache_dir: str,
+    tiles: List[Tuple[datetime.date, datetime.date]],
+    fetch: Callable[
+        [datetime.date, datetime.date],
+        Tuple[Optional[pd.DataFrame], Optional[Dict[str, Any]]],
+    ],
+    *,
+    max_workers: int = 4,
+    write_json: Optional[str] = None,
+    clear_cache_file: bool = False,
+) -> Tuple[Optional[pd.DataFrame], Optional[Dict[str, Any]]]:
+    """
+    Assembles time-indexed data from tiles cached with `handle_caching`.
+
+    Tiles missing from the cache are fetched concurrently. A fetched tile
+    is cached if it ends before today (UTC); later tiles may still receive
+    data, so they are fetched on every request.
+
+    Parameters
+    ----------
+    hash_params : str
+        Parameters to generate the cache file hash of each tile, to which
+        the tile's start and end dates are added.
+    cache_dir : str
+        Directory where cache files are stored.
+    tiles : List[Tuple[datetime.date, datetime.date]]
+        Inclusive (start, end) dates of each tile, e.g. from `month_tiles`.
+    fetch : Callable
+        Function of a tile's start and end dates returning the tile's data
+        and metadata, or (None, None) if the tile could not be retrieved.
+        Must be thread-safe if `max_workers` > 1.
+    max_workers : int
+        Maximum number of tiles fetched at once. Default is 4.
+    write_json : str or None, optional
+        Name of JSON file to write the assembled data to. Default is None.
+    clear_cache_file : bool
+        Whether to clear the existing cache of the tiles.
+
+    Returns
+    -------
+    Tuple[Optional[pd.DataFrame], Optional[Dict[str, Any]]]
+        Data of all retrieved tiles with duplicated times removed, and the
+        metadata of the last tile. (None, None) if no tile was retrieved.
+    """
+    tile_params = [f"{hash_params}_{start:%Y%m%d}_{end:%Y%m%d}" for start, end in tiles]
+
+    results = [
+        _read_cached_tile(params, cache_dir, clear_cache_file) for params in tile_params
+    ]
+
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        for i, result in zip(
+            missing,
+            _fetch_tiles(
+                fetch,
+                [(tiles[i], tile_params[i]) for i in missing],
+                cache_dir,
+                max_workers,
+            ),
+        ):
+            results[i] = result
+
+    results = [result for result in results if result is not None]
+    if not results:
+        return None, None
+
+    frames = [data for data, _ in results if not data.empty] or [results[0][0]]
+    data = pd.concat(frames)
+    data = data.loc[~data.index.duplicated()]
+    metadata = next(
+        (metadata for _, metadata in reversed(results) if metadata is not None),
+        None,
+    )
+
+    if write_json:
+        _write_json(data, metadata, write_json)
+
+    return data, metadata
+
+
 def clear_cache(specific_dir: Optional[str] = None) -> None:
     """
     Clears the cache.
@@ -99,6 +99,30 @@ def _dates_to_timestamp(nc, start_date=None, end_date=None):
         )
 
     time_all = nc.variables["waveTime"][:].compressed()
+
+    return _timestamps_in_range(time_all, start_date, end_date)
+
+
+def _timestamps_in_range(time_all, start_date=None, end_date=None):
+    """
+    Returns timestamps from dates, limited to the range of `time_all`.
+
+    Parameters
+    ----------
+    time_all: numpy array
+        Wave times in seconds since the Epoch
+    start_date: datetime.datetime
+        Start date
+    end_date: datetime.datetime
+        End date
+
+    Returns
+    -------
+    start_stamp: float
+         seconds since the Epoch to start_date
+    end_stamp: float
+         seconds since the Epoch to end_date
+    """
     t_i = datetime.datetime.fromtimestamp(time_all[0]).astimezone(pytz.timezone("UTC"))
     t_f = datetime.datetime.fromtimestamp(time_all[-1]).astimezone(pytz.timezone("UTC"))
     time_range_all = [t_i, t_f]
@@ -348,6 +372,7 @@ def request_parse_workflow(
     else:
         data = {"data": {}, "metadata": {}}
         multiyear_data = {}
+        missing_years = []
         for year in years:
             start_date = datetime.datetime(year, 1, 1, tzinfo=pytz.UTC)
             end_date = datetime.datetime(year + 1, 1, 1, tzinfo=pytz.UTC)
@@ -360,15 +385,27 @@ def request_parse_workflow(
                 cache_content={"data": None, "metadata": None, "write_json": None},
             )
             if year_data is None:
-                year_data = get_netcdf_variables(
-                    nc,
-                    start_date=start_date,
-                    end_date=end_date,
-                    parameters=parameters,
-                    all_2D_variables=all_2D_variables,
-                    silent=silent,
+                missing_years.append(year)
+            else:
+                multiyear_data[year] = year_data["data"]
+
+        # Request all years that are not cached in one pass
+        if missing_years:
+            windows = [
+                (
+                    datetime.datetime(year, 1, 1, tzinfo=pytz.UTC),
+                    datetime.datetime(year + 1, 1, 1, tzinfo=pytz.UTC),
                 )
+                for year in missing_years
+            ]
+            missing_data = _get_netcdf_windows(
+                nc, windows, parameters, all_2D_variables, silent
+            )
+            for year, (start_date, end_date), year_data in zip(
+                missing_years, windows, missing_data
+            ):
                 # Cache the individual year's data
+                hash_params = f"{station_number}-{parameters}-{start_date}-{end_date}"
                 handle_caching(
                     hash_params,
                     cache_dir,
@@ -378,12 +415,13 @@ def request_parse_workflow(
                         "write_json": None,
                     },
                 )
-            multiyear_data[year] = year_data["data"]
+                multiyear_data[year] = year_data["data"]
 
-        for data_key in year_data["data"].keys():
+        last_year_data = multiyear_data[years[-1]]
+        for data_key in last_year_data.keys():
             if data_key.endswith("2D"):
                 data["data"][data_key] = {}
-                for data_key2D in year_data["data"][data_key].keys():
+                for data_key2D in last_year_data[data_key].keys():
                     data_list = []
                     for year in years:
                         data2D = multiyear_data[year][data_key][data_key2D]
@@ -486,6 +524,47 @@ def get_netcdf_variables(
     if not isinstance(to_pandas, bool):
         raise TypeError(f"to_pandas must be of type bool. Got: {type(to_pandas)}")
 
+    results = _get_netcdf_windows(
+        nc, [(start_date, end_date)], parameters, all_2D_variables, silent
+    )[0]
+
+    if not to_pandas:
+        results = convert_nested_dict_and_pandas(results)
+
+    return results
+
+
+def _get_netcdf_windows(nc, windows, parameters, all_2D_variables, silent):
+    """
+    Extracts variables from CDIP buoy data for several time windows in one
+    pass. Each time variable is read once and binary searched for the index
+    range of each window, so that other variables are only read over those
+    contiguous ranges, which OPeNDAP subsets on the server.
+
+    Parameters
+    ----------
+    nc: netCDF Object
+        netCDF data for the given station number and data type
+    windows: list of tuples
+        (start_date, end_date) datetimes, or None for the start or end of
+        the data
+    parameters: string or list of strings
+        Parameters to return. If None will return all varaibles except
+        2D-variables.
+    all_2D_variables: boolean
+        Will return all 2D data.
+    silent: boolean
+        Set to True to prevent the print statement that announces when 2D
+        variable processing begins.
+
+    Returns
+    -------
+    results: list of dictionaries
+        Results of `get_netcdf_variables` for each window, as pandas objects
+    """
+    if isinstance(parameters, str):
+        parameters = [parameters]
+
     buoy_name = (
         nc.variables["metaStationName"][:].compressed().tobytes().decode("utf-8")
     )
@@ -538,9 +617,19 @@ def get_netcdf_variables(
     if not parameters and not all_2D_variables:
         include_vars = allVariableSet - twoDimensionalVarsSet
 
-    start_stamp, end_stamp = _dates_to_timestamp(
-        nc, start_date=start_date, end_date=end_date
-    )
+    # Each time variable is only read once for all windows
+    times = {}
+
+    def read_time(prefix):
+        if prefix not in times:
+            times[prefix] = nc.variables[f"{prefix}Time"][:]
+        return times[prefix]
+
+    wave_time = read_time("wave").compressed()
+    stamps = [
+        _timestamps_in_range(wave_time, start_date=start, end_date=end)
+        for start, end in windows
+    ]
 
     prefixs = ["wave", "sst", "gps", "dwr", "meta"]
     variables_by_type = {
@@ -551,63 +640,136 @@ def get_netcdf_variables(
         prefix: vars for prefix, vars in variables_by_type.items() if vars
     }
 
-    results = {"data": {}, "metadata": {}}
+    results = [{"data": {}, "metadata": {}} for _ in windows]
     for prefix in variables_by_type:
-        time_variables = {}
         metadata = {}
 
         if prefix != "meta":
-            prefixTime = nc.variables[f"{prefix}Time"][:]
-
-            masked_time = np.ma.masked_outside(prefixTime, start_stamp, end_stamp)
-            mask = masked_time.mask
-            var_time = masked_time.compressed()
-            N_time = masked_time.size
-
+            prefixTime = read_time(prefix)
+            indices = [_time_window_index(prefixTime, *stamp) for stamp in stamps]
+            slices = [index for index, _ in indices]
+            time_slices = [
+                pd.to_datetime(np.ma.getdata(prefixTime[index])[keep], unit="s")
+                for index, keep in indices
+            ]
+
+            time_variables = [{} for _ in windows]
             for var in variables_by_type[prefix]:
-                variable = np.ma.filled(nc.variables[var])
-                if variable.size == N_time:
-                    variable = np.ma.masked_array(variable, mask).astype(float)
-                    time_variables[var] = variable.compressed()
+                if nc.variables[var].size == prefixTime.size:
+                    values = _read_time_windows(nc.variables[var], slices)
+                    for i, (_, keep) in enumerate(indices):
+                        time_variables[i][var] = values[i][keep].astype(float)
                 else:
                     metadata[var] = nc.variables[var][:].compressed()
 
-            time_slice = pd.to_datetime(var_time, unit="s")
-            data = pd.DataFrame(time_variables, index=time_slice)
-            results["data"][prefix] = data
-            results["data"][prefix].name = buoy_name
+            for result, variables, time_slice in zip(
+                results, time_variables, time_slices
+            ):
+                data = pd.DataFrame(variables, index=time_slice)
+                result["data"][prefix] = data
+                result["data"][prefix].name = buoy_name
 
-        results["metadata"][prefix] = metadata
+        for result in results:
+            result["metadata"][prefix] = dict(metadata)
 
         if (prefix == "wave") and (include_2D_variables):
             if not silent:
                 print("Processing 2D Variables:")
 
-            vars2D = {}
+            vars2D = [{} for _ in windows]
             columns = metadata["waveFrequency"]
-            N_time = len(time_slice)
-            N_frequency = len(columns)
-            try:
-                l = len(mask)
-            except:
-                mask = np.array([False] * N_time)
-
-            mask2D = np.tile(mask, (len(columns), 1)).T
             for var in include_params_2D:
-                variable2D = nc.variables[var][:].data
-                variable2D = np.ma.masked_array(variable2D, mask2D)
-                variable2D = variable2D.compressed().reshape(N_time, N_frequency)
-                variable = pd.DataFrame(variable2D, index=time_slice, columns=columns)
-                vars2D[var] = variable
-            results["data"]["wave2D"] = vars2D
-    results["metadata"]["name"] = buoy_name
+                values = _read_time_windows(nc.variables[var], slices)
+                for i, (_, keep) in enumerate(indices):
+                    vars2D[i][var] = pd.DataFrame(
+                        values[i][keep], index=time_slices[i], columns=columns
+                    )
+            for result, variables in zip(results, vars2D):
+                result["data"]["wave2D"] = variables
 
-    if not to_pandas:
-        results = convert_nested_dict_and_pandas(results)
+    for result in results:
+        result["metadata"]["name"] = buoy_name
 
     return results
 
 
+def _time_window_index(time, start_stamp, end_stamp):
+    """
+    Returns the contiguous index range of the times between start_stamp
+    and end_stamp (inclusive), found by binary search when the times are
+    sorted, and which of the times in that range are valid.
+
+    Parameters
+    ----------
+    time: numpy masked array
+        Times in seconds since the Epoch
+    start_stamp: float
+        Start of the window in seconds since the Epoch
+    end_stamp: float
+        End of the window in seconds since the Epoch
+
+    Returns
+    -------
+    index: slice
+        Index range spanning the window
+    keep: numpy array
+        Boolean mask of the valid times within `index`
+    """
+    values = np.ma.filled(time.astype(float), np.nan)
+
+    # Comparisons with missing (NaN) times are False, so these use the mask
+    if np.all(values[1:] >= values[:-1]):
+        start = np.searchsorted(values, start_stamp, side="left")
+        end = np.searchsorted(values, end_stamp, side="right")
+    else:
+        inside = np.flatnonzero((values >= start_stamp) & (values <= end_stamp))
+        start, end = (inside[0], inside[-1] + 1) if inside.size else (0, 0)
+
+    window = values[start:end]
+    keep = (window >= start_stamp) & (window <= end_stamp)
+
+    return slice(start, end), keep
+
+
+def _read_time_windows(variable, slices):
+    """
+    Reads a netCDF variable over several index ranges of its first
+    dimension. Overlapping or adjacent ranges are merged into a single
+    contiguous read.
+
+    Parameters
+    ----------
+    variable: netCDF4.Variable
+        Variable indexed by time along its first dimension
+    slices: list of slices
+        Index ranges to read
+
+    Returns
+    -------
+    values: list of numpy arrays
+        Unmasked values of `variable` over each range
+    """
+    values = [None] * len(slices)
+
+    runs = []
+    for i in sorted(range(len(slices)), key=lambda i: slices[i].start):
+        if runs and slices[i].start <= runs[-1][1]:
+            runs[-1][1] = max(runs[-1][1], slices[i].stop)
+            runs[-1][2].append(i)
+        else:
+            runs.append([slices[i].start, slices[i].stop, [i]])
+
+    for start, stop, members in runs:
+        if stop > start:
+            data = np.ma.getdata(variable[start:stop])
+        else:
+            data = np.empty((0,) + variable.shape[1:], dtype=variable.dtype)
+        for i in members:
+            values[i] = data[slices[i].start - start : slices[i].stop - start]
+
+    return values
+
+
 def _process_multiyear_data(nc, years, parameters, all_2D_variables):
     """
     A helper function to process multiyear data.
@@ -629,18 +791,13 @@ def _process_multiyear_data(nc, years, parameters, all_2D_variables):
         A dictionary containing the processed data
     """
 
-    data = {}
-    for year in years:
-        start_date = datetime.datetime(year, 1, 1)
-        end_date = datetime.datetime(year + 1, 1, 1)
-
-        year_data = get_netcdf_variables(
-            nc,
-            start_date=start_date,
-            end_date=end_date,
-            parameters=parameters,
-            all_2D_variables=all_2D_variables,
-        )
-        data[year] = year_data
+    windows = [
+        (datetime.datetime(year, 1, 1), datetime.datetime(year + 1, 1, 1))
+        for year in years
+    ]
+    year_data = _get_netcdf_windows(
+        nc, windows, parameters, all_2D_variables, silent=False
+    )
+    data = dict(zip(years, year_data))
 
     return data
@@ -1,3 +1,4 @@
+from mhkit.wave.io.hindcast import regions
 from mhkit.wave.io.hindcast import wind_toolkit
 
 try:
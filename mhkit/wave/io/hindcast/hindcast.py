@@ -13,12 +13,12 @@ Functions:
       hindcast hosted on AWS at the specified latitude and longitude point(s) for
       the requested data type, parameter, and years.
     - request_wpto_directional_spectrum(lat_lon, year, tree=None, unscale=True,
-      str_decode=True, hsds=True): Returns directional spectra data from the WPTO
-      wave hindcast hosted on AWS at the specified latitude and longitude point(s)
-      for the given year.
+      str_decode=True, hsds=True, output=None, chunk_size=500): Returns directional
+      spectra data from the WPTO wave hindcast hosted on AWS at the specified
+      latitude and longitude point(s) for the given year, optionally downloaded
+      in chunks into a Zarr store.
 
 Dependencies:
-    - sys
     - time.sleep
     - pandas
     - xarray
@@ -30,7 +30,7 @@ Date: 2023-09-26
 """
 
 import os
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 import pandas as pd
 import xarray as xr
@@ -38,6 +38,9 @@ import numpy as np
 from rex import MultiYearWaveX, WaveX
 from mhkit.utils.cache import handle_caching
 from mhkit.utils.type_handling import convert_to_dataset
+from mhkit.wave.io.hindcast.regions import region_index
+
+_SPECTRUM_DIMS = ["time_index", "frequency", "direction", "gid"]
 
 
 def region_selection(lat_lon):
@@ -48,40 +51,31 @@ def region_selection(lat_lon):
 
     Parameters
     ----------
-    lat_lon : list or tuple
-        Latitude and longitude coordinates as floats or integers
+    lat_lon : list, tuple or numpy.ndarray
+        Latitude and longitude coordinates as floats or integers, or an
+        (N, 2) array of latitude longitude pairs
 
     Returns
     -------
-    region : string
-        Name of predefined region for given coordinates
+    region : string or numpy.ndarray
+        Name of predefined region for given coordinates, or an (N,) array
+        of names for an (N, 2) array of coordinates
     """
-    if not isinstance(lat_lon, (list, tuple)):
+    if not isinstance(lat_lon, (list, tuple, np.ndarray)):
         raise TypeError(f"lat_lon must be of type list or tuple. Got: {type(lat_lon)}")
 
-    if not all(isinstance(coord, (float, int)) for coord in lat_lon):
-        raise TypeError(
-            f"lat_lon values must be of type float or int. Got: {type(lat_lon[0])}"
-        )
-
-    regions = {
-        "Hawaii": {"lat": [15.0, 27.000002], "lon": [-164.0, -151.0]},
-        "West_Coast": {"lat": [30.0906, 48.8641], "lon": [-130.072, -116.899]},
-        "Atlantic": {"lat": [24.382, 44.8247], "lon": [-81.552, -65.721]},
-    }
-
-    def region_search(lat_lon, region, regions):
-        return all(
-            regions[region][dk][0] <= d <= regions[region][dk][1]
-            for dk, d in {"lat": lat_lon[0], "lon": lat_lon[1]}.items()
-        )
+    if isinstance(lat_lon, (list, tuple)) and not isinstance(lat_lon[0], (list, tuple)):
+        if not all(isinstance(coord, (float, int)) for coord in lat_lon):
+            raise TypeError(
+                f"lat_lon values must be of type float or int. Got: {type(lat_lon[0])}"
+            )
 
-    region = [region for region in regions if region_search(lat_lon, region, regions)]
+    region = region_index("wpto").classify(lat_lon)
 
-    if not region:
+    if (region == "").any():
         raise ValueError("ERROR: coordinates out of bounds.")
 
-    return region[0]
+    return str(region) if region.ndim == 0 else region
 
 
 def request_wpto_point_data(
@@ -95,11 +89,17 @@ def request_wpto_point_data(
     hsds=True,
     path=None,
     to_pandas=True,
+    max_workers=4,
 ):
     """
     Returns data from the WPTO wave hindcast hosted on AWS at the
     specified latitude and longitude point(s), or the closest
     available point(s).
+
+    Points may lie in different regions. Requests are grouped by region,
+    parameter and year and fetched concurrently, and the time series of
+    each (region, gid, parameter, year) is cached separately, so that
+    overlapping requests only fetch what is not cached yet.
     Visit https://registry.opendata.aws/wpto-pds-us-wave/ for more
     information about the dataset and available locations and years.
 
@@ -147,15 +147,20 @@ def request_wpto_point_data(
         local machine, not AWS. Default = True
     path : string (optional)
         Optionally override with a custom .h5 filepath. Useful when setting
-        `hsds=False`.
+        `hsds=False`. May contain '{region}', which is replaced by the name
+        of the region of each point.
     to_pandas: bool (optional)
         Flag to output pandas instead of xarray. Default = True.
+    max_workers: int (optional)
+        Maximum number of concurrent requests. Default = 4.
 
     Returns
     ---------
     data: pandas DataFrame or xarray Dataset
         Data indexed by datetime with columns named for parameter
-        and cooresponding metadata index
+        and cooresponding metadata index. For xarray output with a list of
+        parameters, the 'parameter' coordinate lists these names, i.e. one
+        entry per parameter and point.
     meta: DataFrame
         Location metadata for the requested data location
     """
@@ -188,106 +193,211 @@ def request_wpto_point_data(
             f"If specified, to_pandas must be bool type. Got: {type(to_pandas)}"
         )
 
-    # Attempt to load data from cache
-    # Construct a string representation of the function parameters
-    hash_params = f"{data_type}_{parameter}_{lat_lon}_{years}_{tree}_{unscale}_{str_decode}_{hsds}_{path}_{to_pandas}"
+    if data_type not in ["3-hour", "1-hour"]:
+        raise ValueError(f"data_type must be '3-hour' or '1-hour'. Got: {data_type}")
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError(f"max_workers must be a positive integer. Got: {max_workers}")
+
+    parameters = [parameter] if isinstance(parameter, str) else parameter
+    if any("directional_wave_spectrum" in param for param in parameters):
+        raise ValueError(
+            "This function does not support directional_wave_spectrum output"
+        )
+
+    points = _as_points(lat_lon)
     cache_dir = _get_cache_dir()
-    data, meta, _ = handle_caching(
-        hash_params,
+    hash_base = f"{data_type}_{tree}_{unscale}_{str_decode}_{hsds}_{path}"
+    wave_kwargs = {
+        "tree": tree,
+        "unscale": unscale,
+        "str_decode": str_decode,
+        "hsds": hsds,
+    }
+
+    # Plan requests by region: look up the gid of each point, then fetch each
+    # (region, parameter, year) that is not cached for every gid
+    regions = region_selection(np.array(points, dtype=float)).tolist()
+    gids = [None] * len(points)
+    meta_rows = [None] * len(points)
+    for region in dict.fromkeys(regions):
+        index = [i for i, r in enumerate(regions) if r == region]
+        wave_path = _wave_path(data_type, region, path)
+        region_gids, region_meta = _point_gids(
+            [points[i] for i in index],
+            wave_path,
+            {**wave_kwargs, "years": years[:1]},
+            cache_dir,
+            f"{hash_base}_{region}",
+        )
+        for i, gid, row in zip(index, region_gids, region_meta):
+            gids[i] = gid
+            meta_rows[i] = row
+
+    requests = {}
+    for region in dict.fromkeys(regions):
+        region_gids = [g for g, r in zip(gids, regions) if r == region]
+        region_gids = list(dict.fromkeys(region_gids))
+        for param in parameters:
+            for year in years:
+                requests[(region, param, year)] = region_gids
+
+    series = _request_gid_data(
+        requests,
+        data_type,
+        path,
+        wave_kwargs,
         cache_dir,
-        cache_content={"data": None, "metadata": None, "write_json": None},
+        hash_base,
+        max_workers,
     )
 
-    if data is not None:
-        return data, meta
-    else:
-        if "directional_wave_spectrum" in parameter:
-            sys.exit("This function does not support directional_wave_spectrum output")
+    data_list = []
+    for param in parameters:
+        for i, (region, gid) in enumerate(zip(regions, gids)):
+            temp_data = [series[(region, param, year, gid)] for year in years]
+            data_list.append(pd.concat(temp_data).rename(f"{param}_{i}"))
+    data = pd.concat(data_list, axis=1)
+    data.index.name = "time_index"
 
-        # Check for multiple region selection
-        if isinstance(lat_lon[0], float):
-            region = region_selection(lat_lon)
-        else:
-            region_list = []
-            for loc in lat_lon:
-                region_list.append(region_selection(loc))
-            if region_list.count(region_list[0]) == len(lat_lon):
-                region = region_list[0]
-            else:
-                sys.exit("Coordinates must be within the same region!")
-
-        if path:
-            wave_path = path
-        elif data_type == "3-hour":
-            wave_path = f"/nrel/US_wave/{region}/{region}_wave_*.h5"
-        elif data_type == "1-hour":
-            wave_path = (
-                f"/nrel/US_wave/virtual_buoy/{region}/{region}_virtual_buoy_*.h5"
-            )
-        else:
-            print("ERROR: invalid data_type")
-
-        wave_kwargs = {
-            "tree": tree,
-            "unscale": unscale,
-            "str_decode": str_decode,
-            "hsds": hsds,
-            "years": years,
-        }
-        data_list = []
+    meta = pd.concat(meta_rows).reset_index(drop=True)
+    meta["gid"] = gids[0] if len(gids) == 1 else np.array(gids)
 
-        with MultiYearWaveX(wave_path, **wave_kwargs) as rex_waves:
-            if isinstance(parameter, list):
-                for param in parameter:
-                    temp_data = rex_waves.get_lat_lon_df(param, lat_lon)
-                    gid = rex_waves.lat_lon_gid(lat_lon)
-                    cols = temp_data.columns[:]
-                    for i, col in zip(range(len(cols)), cols):
-                        temp = f"{param}_{i}"
-                        temp_data = temp_data.rename(columns={col: temp})
-
-                    data_list.append(temp_data)
-                data = pd.concat(data_list, axis=1)
+    if not to_pandas:
+        data = convert_to_dataset(data)
+        data["time_index"] = pd.to_datetime(data.time_index)
 
-            else:
-                data = rex_waves.get_lat_lon_df(parameter, lat_lon)
-                cols = data.columns[:]
-
-                for i, col in zip(range(len(cols)), cols):
-                    temp = f"{parameter}_{i}"
-                    data = data.rename(columns={col: temp})
-
-            meta = rex_waves.meta.loc[cols, :]
-            meta = meta.reset_index(drop=True)
-            gid = rex_waves.lat_lon_gid(lat_lon)
-            meta["gid"] = gid
-
-            if not to_pandas:
-                data = convert_to_dataset(data)
-                data["time_index"] = pd.to_datetime(data.time_index)
-
-                if isinstance(parameter, list):
-                    param_coords = [f"{param}_{i}" for param in parameter]
-                    data.coords["parameter"] = xr.DataArray(
-                        param_coords, dims="parameter"
-                    )
+        if isinstance(parameter, list):
+            param_coords = [
+                f"{param}_{i}" for param in parameter for i in range(len(points))
+            ]
+            data.coords["parameter"] = xr.DataArray(param_coords, dims="parameter")
+
+        data.coords["year"] = xr.DataArray(years, dims="year")
 
-                data.coords["year"] = xr.DataArray(years, dims="year")
+        meta_ds = meta.to_xarray()
+        data = xr.merge([data, meta_ds])
 
-                meta_ds = meta.to_xarray()
-                data = xr.merge([data, meta_ds])
+        # Remove the 'index' coordinate
+        data = data.drop_vars("index")
+
+    return data, meta
+
+
+def _as_points(lat_lon):
+    """
+    Returns a list of (lat, lon) tuples from a single pair or a sequence of
+    pairs.
+    """
+    if isinstance(lat_lon[0], (float, int)):
+        return [tuple(lat_lon)]
+    return [tuple(point) for point in lat_lon]
 
-                # Remove the 'index' coordinate
-                data = data.drop_vars("index")
 
-        # save_to_cache(hash_params, data, meta)
-        handle_caching(
-            hash_params,
+def _wave_path(data_type, region, path=None):
+    """
+    Returns the path of the WPTO hindcast files of a region. A custom `path`
+    may contain '{region}', which is replaced by the region name.
+    """
+    if path:
+        return path.replace("{region}", region)
+    if data_type == "3-hour":
+        return f"/nrel/US_wave/{region}/{region}_wave_*.h5"
+    return f"/nrel/US_wave/virtual_buoy/{region}/{region}_virtual_buoy_*.h5"
+
+
+def _point_gids(points, wave_path, wave_kwargs, cache_dir, hash_base):
+    """
+    Returns the gid and metadata row of each point in a region, using
+    cached values where available.
+    """
+    gids = [None] * len(points)
+    meta_rows = [None] * len(points)
+    missing = []
+    for i, point in enumerate(points):
+        gid, meta_row, _ = handle_caching(
+            f"{hash_base}_{point}_gid",
             cache_dir,
-            cache_content={"data": data, "metadata": meta, "write_json": None},
+            cache_content={"data": None, "metadata": None, "write_json": None},
         )
+        if gid is None:
+            missing.append(i)
+        else:
+            gids[i] = gid
+            meta_rows[i] = meta_row
 
-        return data, meta
+    if missing:
+        with MultiYearWaveX(wave_path, **wave_kwargs) as rex_waves:
+            found = rex_waves.lat_lon_gid([points[i] for i in missing])
+            found = np.atleast_1d(found)
+            for i, gid in zip(missing, found):
+                gids[i] = int(gid)
+                meta_rows[i] = rex_waves.meta.loc[[gid], :]
+                handle_caching(
+                    f"{hash_base}_{points[i]}_gid",
+                    cache_dir,
+                    cache_content={
+                        "data": gids[i],
+                        "metadata": meta_rows[i],
+                        "write_json": None,
+                    },
+                )
+
+    return gids, meta_rows
+
+
+def _request_gid_data(
+    requests, data_type, path, wave_kwargs, cache_dir, hash_base, max_workers
+):
+    """
+    Returns the time series of each (region, parameter, year, gid), reading
+    cached series and fetching the missing gids of each
+    (region, parameter, year) concurrently.
+    """
+
+    def gid_hash(region, param, year, gid):
+        return f"{hash_base}_{region}_{gid}_{param}_{year}"
+
+    def fetch(region, param, year, gids):
+        wave_path = _wave_path(data_type, region, path)
+        with MultiYearWaveX(wave_path, years=[year], **wave_kwargs) as rex_waves:
+            data = rex_waves.get_gid_df(param, gids)
+        fetched = {}
+        for j, gid in enumerate(gids):
+            fetched[gid] = data.iloc[:, j]
+            handle_caching(
+                gid_hash(region, param, year, gid),
+                cache_dir,
+                cache_content={
+                    "data": fetched[gid],
+                    "metadata": None,
+                    "write_json": None,
+                },
+            )
+        return fetched
+
+    series = {}
+    missing = {}
+    for (region, param, year), gids in requests.items():
+        for gid in gids:
+            cached, _, _ = handle_caching(
+                gid_hash(region, param, year, gid),
+                cache_dir,
+                cache_content={"data": None, "metadata": None, "write_json": None},
+            )
+            if cached is None:
+                missing.setdefault((region, param, year), []).append(gid)
+            else:
+                series[(region, param, year, gid)] = cached
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            key: executor.submit(fetch, *key, gids) for key, gids in missing.items()
+        }
+        for (region, param, year), future in futures.items():
+            for gid, values in future.result().items():
+                series[(region, param, year, gid)] = values
+
+    return series
 
 
 def request_wpto_directional_spectrum(
@@ -298,6 +408,8 @@ def request_wpto_directional_spectrum(
     str_decode=True,
     hsds=True,
     path=None,
+    output=None,
+    chunk_size=500,
 ):
     """
     Returns directional spectra data from the WPTO wave hindcast hosted
@@ -309,6 +421,13 @@ def request_wpto_directional_spectrum(
     with multiple `gids` representing the data closest to each requested
     `lat`, `lon`.
 
+    A full year of spectra is large, so they may instead be downloaded
+    in chunks of `chunk_size` time steps into the Zarr store `output`.
+    Each chunk is written to disk as soon as it is received, an
+    interrupted download resumes from the last completed chunk when
+    the request is repeated, and the returned Dataset is lazily loaded
+    from the store.
+
     Visit https://registry.opendata.aws/wpto-pds-us-wave/ for more
     information about the dataset and available
     locations and years.
@@ -341,6 +460,14 @@ def request_wpto_directional_spectrum(
     path : string (optional)
         Optionally override with a custom .h5 filepath. Useful when setting
         `hsds=False`
+    output : string (optional)
+        Path of a Zarr store to download the spectra into. If the store
+        already holds part of the same request, the download is resumed.
+        If None, the spectra are returned in memory and cached.
+        Requires zarr and dask. Default = None
+    chunk_size : int (optional)
+        Number of time steps requested and written at a time when
+        `output` is given. Default = 500
 
     Returns
     ---------
@@ -368,16 +495,42 @@ def request_wpto_directional_spectrum(
         raise TypeError(f"If specified, hsds must be bool type. Got: {type(hsds)}")
     if not isinstance(path, (str, type(None))):
         raise TypeError(f"If specified, path must be a string. Got: {type(path)}")
+    if not isinstance(output, (str, type(None))):
+        raise TypeError(f"If specified, output must be a string. Got: {type(output)}")
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise TypeError(f"chunk_size must be a positive integer. Got: {chunk_size}")
 
     # check for multiple region selection
     if isinstance(lat_lon[0], float):
         region = region_selection(lat_lon)
     else:
-        reglist = [region_selection(loc) for loc in lat_lon]
-        if reglist.count(reglist[0]) == len(lat_lon):
-            region = reglist[0]
+        reglist = region_selection(np.array(lat_lon, dtype=float))
+        if (reglist == reglist[0]).all():
+            region = str(reglist[0])
         else:
-            sys.exit("Coordinates must be within the same region!")
+            raise ValueError("Coordinates must be within the same region!")
+
+    wave_path = path or (
+        f"/nrel/US_wave/virtual_buoy/{region}/{region}_virtual_buoy_{year}.h5"
+    )
+    wave_kwargs = {
+        "tree": tree,
+        "unscale": unscale,
+        "str_decode": str_decode,
+        "hsds": hsds,
+    }
+
+    if output is not None:
+        with WaveX(wave_path, **wave_kwargs) as rex_waves:
+            gid, meta = _spectrum_meta(rex_waves, lat_lon)
+            data = _download_spectrum(
+                rex_waves,
+                gid,
+                output,
+                chunk_size,
+                attrs={"source": wave_path, "year": year, "unscale": int(unscale)},
+            )
+        return data, meta
 
     # Attempt to load data from cache
     hash_params = f"{lat_lon}_{year}_{tree}_{unscale}_{str_decode}_{hsds}_{path}"
@@ -391,30 +544,9 @@ def request_wpto_directional_spectrum(
     if data is not None:
         return data, meta
 
-    wave_path = path or (
-        f"/nrel/US_wave/virtual_buoy/{region}/{region}_virtual_buoy_{year}.h5"
-    )
-    parameter = "directional_wave_spectrum"
-    wave_kwargs = {
-        "tree": tree,
-        "unscale": unscale,
-        "str_decode": str_decode,
-        "hsds": hsds,
-    }
-
     with WaveX(wave_path, **wave_kwargs) as rex_waves:
-        # Get graphical identifier
-        gid = rex_waves.lat_lon_gid(lat_lon)
-
-        # Setup index and columns
-        columns = [gid] if isinstance(gid, (int, np.integer)) else gid
-        time_index = rex_waves.time_index
-        frequency = rex_waves["frequency"]
-        direction = rex_waves["direction"]
-        index = pd.MultiIndex.from_product(
-            [time_index, frequency, direction],
-            names=["time_index", "frequency", "direction"],
-        )
+        gid, meta = _spectrum_meta(rex_waves, lat_lon)
+        coords = _spectrum_coords(rex_waves, gid)
 
         # Create bins for multiple smaller API dataset requests
         N = 6
@@ -422,75 +554,17 @@ def request_wpto_directional_spectrum(
         quotient, remainder = divmod(length, N)
         bins = [i * quotient for i in range(N + 1)]
         bins[-1] += remainder
-        index_bins = (np.array(bins) * len(frequency) * len(direction)).tolist()
-
-        # Request multiple datasets and add to dictionary
-        datas = {}
-        for i in range(len(bins) - 1):
-            idx = index[index_bins[i] : index_bins[i + 1]]
-
-            # Request with exponential back off wait time
-            sleep_time = 2
-            num_retries = 4
-            for _ in range(num_retries):
-                try:
-                    data_array = rex_waves[parameter, bins[i] : bins[i + 1], :, :, gid]
-                    str_error = None
-                except Exception as err:
-                    str_error = str(err)
-
-                if str_error:
-                    sleep(sleep_time)
-                    sleep_time *= 2
-                else:
-                    break
-
-            ax1 = np.prod(data_array.shape[:3])
-            ax2 = data_array.shape[-1] if len(data_array.shape) == 4 else 1
-            datas[i] = pd.DataFrame(
-                data_array.reshape(ax1, ax2), columns=columns, index=idx
-            )
-
-        data_raw = pd.concat(datas.values())
-        data = data_raw.to_xarray()
-        data["time_index"] = pd.to_datetime(data.time_index)
-
-        # Get metadata
-        meta = rex_waves.meta.loc[columns, :]
-        meta = meta.reset_index(drop=True)
-        meta["gid"] = gid
 
-        # Convert gid to integer or list of integers
-        gid_list = (
-            [int(g) for g in gid] if isinstance(gid, (list, np.ndarray)) else [int(gid)]
+        spectral_density = np.concatenate(
+            [
+                _request_spectrum(rex_waves, slice(bins[i], bins[i + 1]), gid)
+                for i in range(N)
+            ]
         )
 
-        data_var_concat = xr.concat([data[g] for g in gid_list], dim="gid")
-
-        # Create a new DataArray with the correct dimensions and coordinates
-        spectral_density = xr.DataArray(
-            data_var_concat.data.reshape(
-                -1, len(frequency), len(direction), len(gid_list)
-            ),
-            dims=["time_index", "frequency", "direction", "gid"],
-            coords={
-                "time_index": data["time_index"],
-                "frequency": data["frequency"],
-                "direction": data["direction"],
-                "gid": gid_list,
-            },
-        )
-
-        # Create the new dataset
-        data = xr.Dataset(
-            {"spectral_density": spectral_density},
-            coords={
-                "time_index": data["time_index"],
-                "frequency": data["frequency"],
-                "direction": data["direction"],
-                "gid": gid_list,
-            },
-        )
+    data = xr.Dataset(
+        {"spectral_density": (_SPECTRUM_DIMS, spectral_density)}, coords=coords
+    )
 
     handle_caching(
         hash_params,
@@ -501,6 +575,119 @@ def request_wpto_directional_spectrum(
     return data, meta
 
 
+def _spectrum_meta(rex_waves, lat_lon):
+    """
+    Returns the gid(s) nearest to `lat_lon` and their location metadata
+    """
+    gid = rex_waves.lat_lon_gid(lat_lon)
+    columns = [gid] if isinstance(gid, (int, np.integer)) else gid
+    meta = rex_waves.meta.loc[columns, :]
+    meta = meta.reset_index(drop=True)
+    meta["gid"] = gid
+
+    return gid, meta
+
+
+def _spectrum_coords(rex_waves, gid):
+    """
+    Returns the time_index, frequency, direction and gid coordinates of
+    the directional spectra at `gid`
+    """
+    gid_list = [int(g) for g in np.atleast_1d(gid)]
+
+    return {
+        "time_index": rex_waves.time_index.tz_localize(None),
+        "frequency": rex_waves["frequency"],
+        "direction": rex_waves["direction"],
+        "gid": gid_list,
+    }
+
+
+def _request_spectrum(rex_waves, time_slice, gid, num_retries=4):
+    """
+    Requests the directional spectra at `gid` for `time_slice`, with an
+    exponential back off wait time between retries. Returns an array of
+    shape (time, frequency, direction, gid).
+    """
+    sleep_time = 2
+    for attempt in range(num_retries):
+        try:
+            data_array = rex_waves["directional_wave_spectrum", time_slice, :, :, gid]
+            break
+        except Exception:  # pylint: disable=broad-except
+            if attempt == num_retries - 1:
+                raise
+            sleep(sleep_time)
+            sleep_time *= 2
+
+    if data_array.ndim == 3:
+        data_array = data_array[..., np.newaxis]
+
+    return data_array
+
+
+def _download_spectrum(rex_waves, gid, output, chunk_size, attrs):
+    """
+    Downloads the directional spectra at `gid` into the Zarr store
+    `output` in chunks of `chunk_size` time steps, resuming after the
+    last completed chunk if the store already holds the same request.
+    The number of completed chunks is kept in the store's attributes
+    and only updated once a chunk has been written.
+    """
+    import dask.array as da  # pylint: disable=import-outside-toplevel
+    import zarr  # pylint: disable=import-outside-toplevel
+
+    coords = _spectrum_coords(rex_waves, gid)
+    attrs = {**attrs, "gid": coords["gid"], "chunk_size": chunk_size}
+    length = len(coords["time_index"])
+    n_chunks = -(-length // chunk_size)
+
+    completed = 0
+    group = None
+    if os.path.exists(output):
+        stored = xr.open_zarr(output, consolidated=False).attrs
+        if any(stored.get(key) != value for key, value in attrs.items()):
+            raise ValueError(
+                f"{output} holds a different directional spectrum request. "
+                "Remove it or choose another output."
+            )
+        completed = stored["completed_chunks"]
+
+    for i in range(completed, n_chunks):
+        time_slice = slice(i * chunk_size, min((i + 1) * chunk_size, length))
+        chunk = _request_spectrum(rex_waves, time_slice, gid)
+
+        if i == 0:
+            # Lay out the full store, without writing any spectra
+            shape = (length,) + chunk.shape[1:]
+            template = xr.Dataset(
+                {
+                    "spectral_density": (
+                        _SPECTRUM_DIMS,
+                        da.full(
+                            shape,
+                            np.nan,
+                            dtype=chunk.dtype,
+                            chunks=(chunk_size,) + chunk.shape[1:],
+                        ),
+                    )
+                },
+                coords=coords,
+                attrs={**attrs, "completed_chunks": 0},
+            )
+            template.to_zarr(output, mode="w", compute=False, consolidated=False)
+
+        xr.Dataset(
+            {"spectral_density": (_SPECTRUM_DIMS, chunk)},
+            coords={"time_index": coords["time_index"][time_slice]},
+        ).to_zarr(output, region={"time_index": time_slice}, consolidated=False)
+        if group is None:
+            group = zarr.open_group(output, mode="r+")
+        group.attrs["completed_chunks"] = i + 1
+
+    return xr.open_zarr(output, consolidated=False)
+
+
 def _get_cache_dir():
     """
     Returns the path to the cache directory.
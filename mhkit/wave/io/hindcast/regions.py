@@ -0,0 +1,137 @@
+"""
+Hindcast Region Classification
+==============================
+
+This module classifies latitude-longitude coordinates into the predefined
+regions of the WPTO wave hindcast and WIND Toolkit datasets. It is shared
+by `hindcast.region_selection` and `wind_toolkit.region_selection`.
+
+Each dataset's region bounds are prepared into arrays the first time they
+are used, after which an (N, 2) array of coordinates is classified against
+every region in a single vectorized comparison.
+
+Key Functions:
+--------------
+- `region_index`: Returns the prepared `RegionIndex` of a dataset.
+
+- `RegionIndex.contains`: Returns the region membership of each coordinate.
+
+- `RegionIndex.classify`: Returns the first region containing each coordinate.
+"""
+
+from functools import lru_cache
+import numpy as np
+
+REGION_BOUNDS = {
+    "wpto": {
+        "Hawaii": {"lat": [15.0, 27.000002], "lon": [-164.0, -151.0]},
+        "West_Coast": {"lat": [30.0906, 48.8641], "lon": [-130.072, -116.899]},
+        "Atlantic": {"lat": [24.382, 44.8247], "lon": [-81.552, -65.721]},
+    },
+    # Note that this check is fast, but not robust because region are not
+    # rectangular on a lat-lon grid
+    "wind_toolkit": {
+        "CA_NWP_overlap": {"lat": [41.213, 42.642], "lon": [-129.090, -121.672]},
+        "Offshore_CA": {"lat": [31.932, 42.642], "lon": [-129.090, -115.806]},
+        "Hawaii": {"lat": [15.565, 26.221], "lon": [-164.451, -151.278]},
+        "NW_Pacific": {"lat": [41.213, 49.579], "lon": [-130.831, -121.672]},
+        "Mid_Atlantic": {"lat": [37.273, 42.211], "lon": [-76.427, -64.800]},
+    },
+}
+
+
+class RegionIndex:
+    """
+    Classifies latitude-longitude coordinates into rectangular regions.
+
+    Parameters
+    ----------
+    regions : dict
+        Region bounds as {name: {"lat": [min, max], "lon": [min, max]}}.
+        Where regions overlap, earlier regions take precedence.
+    """
+
+    def __init__(self, regions):
+        if not isinstance(regions, dict):
+            raise TypeError(f"regions must be of type dict. Got: {type(regions)}")
+
+        self.regions = regions
+        self.names = np.array(list(regions))
+        bounds = np.array(
+            [[*bound["lat"], *bound["lon"]] for bound in regions.values()],
+            dtype=float,
+        )
+        self._lat_min, self._lat_max, self._lon_min, self._lon_max = bounds.T
+
+    def contains(self, lat_lon):
+        """
+        Returns whether each coordinate lies within each region, bounds
+        included.
+
+        Parameters
+        ----------
+        lat_lon : array-like
+            Latitude and longitude coordinates, as a pair or an (N, 2) array
+
+        Returns
+        -------
+        inside : numpy.ndarray
+            Boolean membership of shape (N, number of regions), or
+            (number of regions,) for a single pair
+        """
+        coords = np.asarray(lat_lon, dtype=float)
+        if coords.shape[-1:] != (2,) or coords.ndim > 2:
+            raise ValueError(
+                f"lat_lon must be a pair or an (N, 2) array. Got shape: {coords.shape}"
+            )
+
+        lat = coords[..., 0, np.newaxis]
+        lon = coords[..., 1, np.newaxis]
+        return (
+            (self._lat_min <= lat)
+            & (lat <= self._lat_max)
+            & (self._lon_min <= lon)
+            & (lon <= self._lon_max)
+        )
+
+    def classify(self, lat_lon):
+        """
+        Returns the first region containing each coordinate.
+
+        Parameters
+        ----------
+        lat_lon : array-like
+            Latitude and longitude coordinates, as a pair or an (N, 2) array
+
+        Returns
+        -------
+        region : numpy.ndarray
+            Region names, with an empty string for coordinates outside of
+            every region. Of shape (N,), or 0-d for a single pair.
+        """
+        inside = self.contains(lat_lon)
+        first = inside.argmax(axis=-1)
+        return np.where(inside.any(axis=-1), self.names[first], "")
+
+
+@lru_cache(maxsize=None)
+def region_index(dataset):
+    """
+    Returns the region index of a hindcast dataset, prepared on first use.
+
+    Parameters
+    ----------
+    dataset : string
+        Hindcast dataset, 'wpto' or 'wind_toolkit'
+
+    Returns
+    -------
+    index : RegionIndex
+        Region index of the dataset
+    """
+    if dataset not in REGION_BOUNDS:
+        raise ValueError(
+            f"dataset must be one of {list(REGION_BOUNDS)}. Got: {dataset}"
+        )
+
+    return RegionIndex(REGION_BOUNDS[dataset])
@@ -10,7 +10,7 @@ with various parameters like wind speed, direction, temperature, and pressure.
 Key Functions:
 --------------
 - `region_selection`: Determines which predefined wind region a given latitude 
-  and longitude fall within.
+  and longitude, or an array of them, fall within.
   
 - `get_region_data`: Retrieves latitude and longitude data points for a specified 
   wind region. Uses caching to speed up repeated requests.
@@ -56,12 +56,14 @@ Date:
 import os
 import hashlib
 import pickle
+import numpy as np
 import pandas as pd
 
 from rex import MultiYearWindX
 import matplotlib.pyplot as plt
 from mhkit.utils.cache import handle_caching
 from mhkit.utils.type_handling import convert_to_dataset
+from mhkit.wave.io.hindcast.regions import region_index
 
 
 def region_selection(lat_lon, preferred_region=""):
@@ -71,72 +73,65 @@ def region_selection(lat_lon, preferred_region=""):
 
     Parameters
     ----------
-    lat_lon : tuple
-        Latitude and longitude coordinates as floats or integers
+    lat_lon : tuple or numpy.ndarray
+        Latitude and longitude coordinates as floats or integers, or an
+        (N, 2) array of latitude longitude pairs
 
     preferred_region : string (optional)
-        Latitude and longitude coordinates as floats or integers
+        Region to select, 'Offshore_CA' or 'NW_Pacific', for coordinates
+        in the overlap of the two
 
     Returns
     -------
-    region : string
-        Name of predefined region for given coordinates
+    region : string or numpy.ndarray
+        Name of predefined region for given coordinates, or an (N,) array
+        of names for an (N, 2) array of coordinates
     """
-    if not isinstance(lat_lon, tuple):
+    if not isinstance(lat_lon, (tuple, np.ndarray)):
         raise TypeError(f"lat_lon must be of type tuple, got {type(lat_lon).__name__}")
 
-    if len(lat_lon) != 2:
-        raise ValueError(f"lat_lon must be of length 2, got length {len(lat_lon)}")
+    if isinstance(lat_lon, tuple):
+        if len(lat_lon) != 2:
+            raise ValueError(f"lat_lon must be of length 2, got length {len(lat_lon)}")
 
-    if not isinstance(lat_lon[0], (float, int)):
-        raise TypeError(
-            f"lat_lon values must be floats or ints, got {type(lat_lon[0]).__name__}"
-        )
+        if not isinstance(lat_lon[0], (float, int)):
+            raise TypeError(
+                "lat_lon values must be floats or ints, "
+                f"got {type(lat_lon[0]).__name__}"
+            )
 
-    if not isinstance(lat_lon[1], (float, int)):
-        raise TypeError(
-            f"lat_lon values must be floats or ints, got {type(lat_lon[1]).__name__}"
-        )
+        if not isinstance(lat_lon[1], (float, int)):
+            raise TypeError(
+                "lat_lon values must be floats or ints, "
+                f"got {type(lat_lon[1]).__name__}"
+            )
 
     if not isinstance(preferred_region, str):
         raise TypeError(
             f"preferred_region must be a string, got {type(preferred_region).__name__}"
         )
 
-    # Note that this check is fast, but not robust because region are not
-    # rectangular on a lat-lon grid
-    rDict = {
-        "CA_NWP_overlap": {"lat": [41.213, 42.642], "lon": [-129.090, -121.672]},
-        "Offshore_CA": {"lat": [31.932, 42.642], "lon": [-129.090, -115.806]},
-        "Hawaii": {"lat": [15.565, 26.221], "lon": [-164.451, -151.278]},
-        "NW_Pacific": {"lat": [41.213, 49.579], "lon": [-130.831, -121.672]},
-        "Mid_Atlantic": {"lat": [37.273, 42.211], "lon": [-76.427, -64.800]},
-    }
-
-    def region_search(x):
-        return all(
-            (
-                True if rDict[x][dk][0] <= d <= rDict[x][dk][1] else False
-                for dk, d in {"lat": lat_lon[0], "lon": lat_lon[1]}.items()
-            )
-        )
+    index = region_index("wind_toolkit")
+    region = index.classify(lat_lon)
 
-    region = [key for key in rDict if region_search(key)]
+    outside = region == ""
+    if outside.any():
+        if region.ndim:
+            lat_lon = np.asarray(lat_lon)[outside].tolist()
+        raise TypeError(
+            f"Coordinates {lat_lon} out of bounds. Must be within {index.regions}"
+        )
 
-    if region[0] == "CA_NWP_overlap":
-        if preferred_region == "Offshore_CA":
-            region[0] = "Offshore_CA"
-        elif preferred_region == "NW_Pacific":
-            region[0] = "NW_Pacific"
+    overlap = region == "CA_NWP_overlap"
+    if overlap.any():
+        if preferred_region in ("Offshore_CA", "NW_Pacific"):
+            region = np.where(overlap, preferred_region, region)
         else:
             raise TypeError(
                 f"Preferred_region ({preferred_region}) must be 'Offshore_CA' or 'NW_Pacific' when lat_lon {lat_lon} falls in the overlap region"
             )
 
-    if len(region) == 0:
-        raise TypeError(f"Coordinates {lat_lon} out of bounds. Must be within {rDict}")
-    else:
-        return region[0]
+    return str(region) if region.ndim == 0 else region
 
 
 def get_region_data(region):
@@ -435,11 +430,9 @@ def request_wtk_point_data(
         if isinstance(lat_lon[0], float):
             region = region_selection(lat_lon, preferred_region)
         else:
-            reglist = []
-            for loc in lat_lon:
-                reglist.append(region_selection(loc, preferred_region))
-            if reglist.count(reglist[0]) == len(lat_lon):
-                region = reglist[0]
+            reglist = region_selection(np.array(lat_lon, dtype=float), preferred_region)
+            if (reglist == reglist[0]).all():
+                region = str(reglist[0])
             else:
                 raise TypeError("Coordinates must be within the same region!")
 
@@ -64,79 +64,29 @@ def read_file(file_name, missing_values=["MM", 9999, 999, 99], to_pandas=True):
     if not isinstance(to_pandas, bool):
         raise TypeError(f"to_pandas must be of type bool. Got: {type(to_pandas)}")
 
-    # Open file and get header rows
-    f = open(file_name, "r")
-    header = f.readline().rstrip().split()  # read potential headers
-    units = f.readline().rstrip().split()  # read potential units
-    f.close()
-
-    # If first line is commented, remove comment sign #
-    if header[0].startswith("#"):
-        header[0] = header[0][1:]
-        header_commented = True
-    else:
-        header_commented = False
+    data, units = _read_ndbc_text(file_name, missing_values)
 
-    # If second line is commented, indicate that units exist
-    if units[0].startswith("#"):
-        units_exist = True
-    else:
-        units_exist = False
-
-    # Check if the time stamp contains minutes, and create list of column names
-    # to parse for date
-    if header[4] == "mm":
-        parse_vals = header[0:5]
-        date_format = "%Y %m %d %H %M"
-        units = units[5:]  # remove date columns from units
-    else:
-        parse_vals = header[0:4]
-        date_format = "%Y %m %d %H"
-        units = units[4:]  # remove date columns from units
-
-    # If first line is commented, manually feed in column names
-    if header_commented:
-        data = pd.read_csv(
-            file_name,
-            sep="\\s+",
-            header=None,
-            names=header,
-            comment="#",
-            parse_dates=[parse_vals],
-        )
-    # If first line is not commented, then the first row can be used as header
-    else:
-        data = pd.read_csv(
-            file_name, sep="\\s+", header=0, comment="#", parse_dates=[parse_vals]
-        )
-
-    # Convert index to datetime
-    date_column = "_".join(parse_vals)
-    data["Time"] = pd.to_datetime(data[date_column], format=date_format)
-    data.index = data["Time"].values
-    # Remove date columns
-    del data[date_column]
-    del data["Time"]
+    # Convert the date columns to a datetime index
+    date_columns = _ndbc_date_columns(data.columns)
+    data.index = _ndbc_datetime(
+        *(data[column].to_numpy() for column in date_columns),
+        two_digit_year=date_columns[0] == "YY",
+    )
+    data = data.drop(columns=date_columns)
 
     # If there was a row of units, convert to dictionary
-    if units_exist:
+    if units is not None:
+        units = units[len(date_columns) :]  # remove date columns from units
         metadata = {column: unit for column, unit in zip(data.columns, units)}
     else:
         metadata = None
 
-    # Convert columns to numeric data if possible, otherwise leave as string
-    for column in data:
-        data[column] = pd.to_numeric(data[column], errors="ignore")
-
     # Convert column names to float if possible (handles frequency headers)
     # if there is non-numeric name, just leave all as strings.
     try:
         data.columns = [float(column) for column in data.columns]
-    except:
-        data.columns = data.columns
-
-    # Replace indicated missing values with nan
-    data.replace(missing_values, np.nan, inplace=True)
+    except ValueError:
+        pass
 
     if not to_pandas:
         data = convert_to_dataset(data)
@@ -144,6 +94,129 @@ def read_file(file_name, missing_values=["MM", 9999, 999, 99], to_pandas=True):
     return data, metadata
 
 
+def _read_ndbc_text(source, missing_values=None):
+    """
+    Parses the columns of a NDBC text file into a DataFrame.
+
+    The header format (commented or not, with or without a units row) is
+    detected once from the first two lines, after which the data rows are
+    tokenized in a single pass by the C parser.
+
+    Parameters
+    ----------
+    source: string or bytes
+        Name of the NDBC file, or its decompressed contents
+
+    missing_values: list (optional)
+        Values that denote missing data. They are replaced with NaN while
+        parsing, except in the date columns.
+
+    Returns
+    -------
+    data: pandas DataFrame
+        Data with columns named according to the header row
+
+    units: list or None
+        Units row when the file contains one, otherwise None
+    """
+    if isinstance(source, bytes):
+        lines = [line.decode() for line in source.split(b"\n", 2)[:2]]
+        buffer = BytesIO(source)
+    else:
+        with open(source, "r") as f:
+            lines = [f.readline(), f.readline()]
+        buffer = source
+
+    header = lines[0].split()
+    if not header:
+        raise pandas.errors.EmptyDataError("No columns to parse from file")
+    units = lines[1].split() if len(lines) > 1 else []
+    units = units if units and units[0].startswith("#") else None
+
+    na_values = None
+    if missing_values:
+        date_columns = _ndbc_date_columns(header)
+        na_values = {
+            column: missing_values for column in header if column not in date_columns
+        }
+
+    data = pd.read_csv(
+        buffer,
+        sep="\\s+",
+        header=None,
+        names=header,
+        skiprows=1 if units is None else 2,
+        na_values=na_values,
+        engine="c",
+    )
+
+    return data, units
+
+
+def _ndbc_date_columns(columns):
+    """
+    Returns the date columns of a NDBC header, with or without minutes.
+
+    Parameters
+    ----------
+    columns: list
+        Column names of the NDBC file (e.g. ['#YY', 'MM', 'DD', 'hh', 'mm', ...])
+
+    Returns
+    -------
+    date_columns: list
+        Year, month, day, hour and, if present, minute column names
+    """
+    columns = list(columns)
+    if len(columns) > 4 and columns[4] == "mm":
+        return columns[:5]
+    return columns[:4]
+
+
+def _ndbc_datetime(year, month, day, hour, minute=0, two_digit_year=False):
+    """
+    Converts NDBC date columns to datetimes with vectorized integer
+    arithmetic.
+
+    Parameters
+    ----------
+    year, month, day, hour, minute: array-like
+        Integer date components. minute defaults to 0.
+
+    two_digit_year: bool (optional)
+        Interpret years as two digits, following the "%y" convention
+        (69-99 -> 1969-1999, 00-68 -> 2000-2068). Default = False.
+
+    Returns
+    -------
+    date: numpy.ndarray
+        Dates of type datetime64[ns]
+    """
+    year, month, day, hour, minute = (
+        np.asarray(component, dtype=np.int64)
+        for component in (year, month, day, hour, minute)
+    )
+    if two_digit_year:
+        year = year + np.where(year < 69, 2000, 1900)
+
+    for name, component, low, high in [
+        ("month", month, 1, 12),
+        ("day", day, 1, 31),
+        ("hour", hour, 0, 23),
+        ("minute", minute, 0, 59),
+    ]:
+        if ((component < low) | (component > high)).any():
+            raise ValueError(f"NDBC {name} values must be between {low} and {high}")
+
+    months = (year - 1970) * 12 + month - 1
+    minutes = (day - 1) * 1440 + hour * 60 + minute
+    date = months.astype("datetime64[M]").astype("datetime64[m]") + minutes.astype(
+        "timedelta64[m]"
+    )
+
+    return date.astype("datetime64[ns]")
+
+
 def available_data(
     parameter, buoy_number=None, proxy=None, clear_cache=False, to_pandas=True
 ):
@@ -403,14 +476,7 @@ def request_data(parameter, filenames, proxy=None, clear_cache=False, to_pandas=
                 response = requests.get(file_url, proxies=proxy)
             try:
                 data = zlib.decompress(response.content, 16 + zlib.MAX_WBITS)
-                df = pd.read_csv(BytesIO(data), sep="\\s+", low_memory=False)
-
-                # catch when units are included below the header
-                firstYear = df["MM"][0]
-                if isinstance(firstYear, str) and firstYear == "mo":
-                    df = pd.read_csv(
-                        BytesIO(data), sep="\\s+", low_memory=False, skiprows=[1]
-                    )
+                df, _ = _read_ndbc_text(data)
             except zlib.error:
                 msg = (
                     f"Issue decompressing the NDBC file {filename}"
@@ -555,7 +621,7 @@ def dates_to_datetime(
         minutes_loc = cols.index("mm")
         minutes = True
     except:
-        df["mm"] = np.zeros(len(df)).astype(int).astype(str)
+        df["mm"] = np.zeros(len(df), dtype=int)
         minutes = False
 
     row_0_is_units = False
@@ -605,8 +671,8 @@ def dates_to_datetime(
 def _date_string_to_datetime(df, columns, year_fmt):
     """
     Takes a NDBC df and creates a datetime from multiple columns headers
-    by combining each column into a single string. Then the datetime
-    method is applied  given the expected format.
+    by combining the integer values of the date columns with vectorized
+    arithmetic.
 
     Parameters
     ----------
@@ -633,17 +699,8 @@ def _date_string_to_datetime(df, columns, year_fmt):
     if not isinstance(year_fmt, str):
         raise TypeError(f"year_fmt must be a string. Got: {type(year_fmt)}")
 
-    # Convert to str and zero pad
-    for key in columns:
-        df[key] = df[key].astype(str).str.zfill(2)
-
-    df["date_string"] = df[columns[0]]
-    for column in columns[1:]:
-        df["date_string"] = df[["date_string", column]].apply(
-            lambda x: "".join(x), axis=1
-        )
-    df["date"] = pd.to_datetime(df["date_string"], format=f"{year_fmt}%m%d%H%M")
-    del df["date_string"]
+    components = [pd.to_numeric(df[column]).to_numpy() for column in columns]
+    df["date"] = _ndbc_datetime(*components, two_digit_year=year_fmt == "%y")
 
     return df
 
@@ -1050,7 +1107,7 @@ def request_directional_data(buoy, year):
     return xr.Dataset(data_dict)
 
 
-def _create_spectrum(data, frequencies, directions, name, units):
+def _create_spectrum(data, frequencies, directions, name, units, dates=None):
     """
     Create an xarray.DataArray for storing spectrum data with correct
     dimensions, coordinates, names, and units.
@@ -1059,7 +1116,9 @@ def _create_spectrum(data, frequencies, directions, name, units):
     ----------
     data: np.ndarray
         Spectrum values.
-        Size number of frequencies x number of directions.
+        Size number of frequencies x number of directions, or number of
+        dates x number of frequencies x number of directions when `dates`
+        is given.
     frequencies: np.ndarray
         One-dimensional array of frequencies in Hz.
     directions: np.ndarray
@@ -1068,12 +1127,14 @@ def _create_spectrum(data, frequencies, directions, name, units):
         Name of the (integral) quantity the spectrum is for.
     units: string
         Units of the (integral) quantity the spectrum is for.
+    dates: xr.DataArray (optional)
+        Date coordinate of the spectra. Default = None
 
     Returns
     -------
     spectrum: xr.Dataset
         DataArray containing the spectrum values indexed by frequency
-        and wave direction.
+        and wave direction, and date when `dates` is given.
     """
     if not isinstance(data, np.ndarray):
         raise TypeError(f"data must be of type np.ndarray. Got: {type(data)}")
@@ -1089,12 +1150,16 @@ def _create_spectrum(data, frequencies, directions, name, units):
         raise TypeError(f"name must be of type string. Got: {type(name)}")
     if not isinstance(units, str):
         raise TypeError(f"units must be of type string. Got: {type(units)}")
+    if not isinstance(dates, (xr.DataArray, type(None))):
+        raise TypeError(
+            f"If specified, dates must be of type xr.DataArray. Got: {type(dates)}"
+        )
 
-    msg = (
-        f"data has wrong shape {data.shape}, "
-        + f"expected {(len(frequencies), len(directions))}"
-    )
-    if not data.shape == (len(frequencies), len(directions)):
+    shape = (len(frequencies), len(directions))
+    if dates is not None:
+        shape = (len(dates),) + shape
+    msg = f"data has wrong shape {data.shape}, " + f"expected {shape}"
+    if not data.shape == shape:
         raise ValueError(msg)
 
     direction_attrs = {
@@ -1109,12 +1174,19 @@ def _create_spectrum(data, frequencies, directions, name, units):
         "standard_name": "f",
     }
 
+    coords = {
+        "frequency": ("frequency", frequencies, frequency_attrs),
+        "direction": ("direction", directions, direction_attrs),
+    }
+    dims = ["frequency", "direction"]
+    if dates is not None:
+        coords["date"] = ("date", dates.values, dates.attrs)
+        dims = ["date"] + dims
+
     spectrum = xr.DataArray(
         data,
-        coords={
-            "frequency": ("frequency", frequencies, frequency_attrs),
-            "direction": ("direction", directions, direction_attrs),
-        },
+        dims=dims,
+        coords=coords,
         attrs={
             "units": f"{units}/Hz/deg",
             "long_name": f"{name} spectrum",
@@ -1125,19 +1197,155 @@ def _create_spectrum(data, frequencies, directions, name, units):
     return spectrum
 
 
-def create_spread_function(data, directions):
+def _spread_coefficients(data, dtype=np.float64):
+    """
+    Returns the Fourier coefficients of the spread function, such that
+    the spread function is `coefficients @ _spread_basis(directions)`.
+
+    Parameters
+    ----------
+    data: xr.Dataset
+        Dataset containing the four NDBC parameter data indexed by
+        frequency, and optionally date.
+    dtype: numpy dtype (optional)
+        Data type of the coefficients. Default = np.float64
+
+    Returns
+    -------
+    coefficients: np.ndarray
+        Coefficients of shape (..., number of frequencies, 5)
+    """
+    values = {
+        name: data[name].transpose(..., "frequency").values.astype(float)
+        for name in ["swr1", "swr2", "swdir", "swdir2"]
+    }
+    a1 = np.deg2rad(values["swdir"])
+    a2 = 2 * np.deg2rad(values["swdir2"])
+    r1 = values["swr1"]
+    r2 = values["swr2"]
+    coefficients = np.stack(
+        [
+            np.full_like(r1, 0.5),
+            r1 * np.cos(a1),
+            r1 * np.sin(a1),
+            r2 * np.cos(a2),
+            r2 * np.sin(a2),
+        ],
+        axis=-1,
+    )
+    return (coefficients / np.pi).astype(dtype, copy=False)
+
+
+def _spread_basis(directions, dtype=np.float64):
+    """
+    Returns the Fourier basis of the spread function, of shape
+    (5, number of directions), evaluated at `directions` in degrees.
+    """
+    a = np.deg2rad(directions.astype(float))
+    basis = np.stack(
+        [np.ones_like(a), np.cos(a), np.sin(a), np.cos(2 * a), np.sin(2 * a)]
+    )
+    return basis.astype(dtype, copy=False)
+
+
+def _evaluate_directional(  # pylint: disable=too-many-arguments
+    data,
+    directions,
+    name,
+    units,
+    omnidirectional,
+    *,
+    chunk_size=None,
+    dtype=np.float64,
+    output=None,
+):
+    """
+    Evaluates the spread function, or the directional spectrum if
+    `omnidirectional`, one block of `chunk_size` dates at a time.
+
+    Each block is a single matrix product of its Fourier coefficients
+    with the direction basis, written into the preallocated output, or
+    appended to the Zarr store `output`.
+    """
+    if not isinstance(chunk_size, (int, type(None))):
+        raise TypeError(
+            f"If specified, chunk_size must be of type int. Got: {type(chunk_size)}"
+        )
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer. Got: {chunk_size}")
+    if not isinstance(output, (str, type(None))):
+        raise TypeError(f"If specified, output must be a string. Got: {type(output)}")
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"dtype must be np.float32 or np.float64. Got: {dtype}")
+
+    basis = _spread_basis(directions, dtype)
+    frequencies = data.frequency.values
+
+    def block_values(block, out=None):
+        coefficients = _spread_coefficients(block, dtype)
+        if omnidirectional:
+            spectrum = block["swden"].transpose(..., "frequency").values
+            coefficients *= spectrum.astype(dtype, copy=False)[..., np.newaxis]
+        return np.matmul(coefficients, basis, out=out)
+
+    if "date" not in data.dims:
+        values = block_values(data)
+        spectrum = _create_spectrum(values, frequencies, directions, name, units)
+        if output is not None:
+            spectrum.to_dataset(name="spectrum").to_zarr(
+                output, mode="w", consolidated=False
+            )
+            spectrum = xr.open_zarr(output, consolidated=False)["spectrum"]
+        return spectrum
+
+    n_dates = data.sizes["date"]
+    chunk_size = n_dates if chunk_size is None else chunk_size
+    values = None
+    if output is None:
+        values = np.empty((n_dates, len(frequencies), len(directions)), dtype)
+
+    for start in range(0, n_dates, chunk_size):
+        dates = slice(start, start + chunk_size)
+        block = data.isel(date=dates)
+        if output is None:
+            block_values(block, out=values[dates])
+            continue
+
+        spectrum = _create_spectrum(
+            block_values(block), frequencies, directions, name, units, block.date
+        ).to_dataset(name="spectrum")
+        # The date units are set by the Zarr time encoding
+        spectrum["date"].attrs.pop("units", None)
+        if start == 0:
+            spectrum.to_zarr(output, mode="w", consolidated=False)
+        else:
+            spectrum.to_zarr(output, append_dim="date", consolidated=False)
+
+    if output is not None:
+        return xr.open_zarr(output, consolidated=False)["spectrum"]
+
+    return _create_spectrum(values, frequencies, directions, name, units, data.date)
+
+
+def create_spread_function(data, directions, chunk_size=None, dtype=np.float64):
     """
     Create the spread function from the 4 relevant NDBC parameter data.
     Return as an xarray.DataArray indexed by frequency and wave
-    direction.
+    direction, and by date when the data has a date dimension.
 
     Parameters
     ----------
     data: xr.Dataset
         Dataset containing the four NDBC parameter data indexed by
-        frequency.
+        frequency, and optionally date.
     directions: np.ndarray
         One-dimensional array of wave directions in degrees.
+    chunk_size: int (optional)
+        Number of dates evaluated at a time. Default = None (all dates)
+    dtype: numpy dtype (optional)
+        Data type of the spread function, np.float32 or np.float64.
+        Default = np.float64
 
     Returns
     -------
@@ -1152,34 +1360,44 @@ def create_spread_function(data, directions):
             f"directions must be of type np.ndarray. Got: {type(directions)}"
         )
 
-    r1 = data["swr1"].data.reshape(-1, 1)
-    r2 = data["swr2"].data.reshape(-1, 1)
-    a1 = data["swdir"].data.reshape(-1, 1)
-    a2 = data["swdir2"].data.reshape(-1, 1)
-    a = directions.reshape(1, -1)
-    spread = (
-        1
-        / np.pi
-        * (0.5 + r1 * np.cos(np.deg2rad(a - a1)) + r2 * np.cos(2 * np.deg2rad(a - a2)))
-    )
-    spread = _create_spectrum(
-        spread, data.frequency.values, directions, name="Spread", units="1"
+    spread = _evaluate_directional(
+        data,
+        directions,
+        name="Spread",
+        units="1",
+        omnidirectional=False,
+        chunk_size=chunk_size,
+        dtype=dtype,
     )
     return spread
 
 
-def create_directional_spectrum(data, directions):
+def create_directional_spectrum(
+    data, directions, chunk_size=None, dtype=np.float64, output=None
+):
     """
     Create the spectrum from the 5 relevant NDBC parameter data. Return
-    as an xarray.DataArray indexed by frequency and wave direction.
+    as an xarray.DataArray indexed by frequency and wave direction, and
+    by date when the data has a date dimension.
 
     Parameters
     ----------
     data: xr.Dataset
         Dataset containing the five NDBC parameter data indexed by
-        frequency.
+        frequency, and optionally date.
     directions: np.ndarray
         One-dimensional array of wave directions in degrees.
+    chunk_size: int (optional)
+        Number of dates evaluated, and written to `output`, at a time.
+        Default = None (all dates)
+    dtype: numpy dtype (optional)
+        Data type of the spectrum, np.float32 or np.float64.
+        Default = np.float64
+    output: string (optional)
+        Path of a Zarr store to write the spectrum into, one chunk of
+        dates at a time, instead of holding it in memory. The spectrum is
+        then returned lazily from the store. Requires zarr.
+        Default = None
 
     Returns
     -------
@@ -1194,19 +1412,113 @@ def create_directional_spectrum(data, directions):
             f"directions must be of type np.ndarray. Got: {type(directions)}"
         )
 
-    spread = create_spread_function(data, directions).values
-    omnidirectional_spectrum = data["swden"].data.reshape(-1, 1)
-    spectrum = omnidirectional_spectrum * spread
-    spectrum = _create_spectrum(
-        spectrum,
-        data.frequency.values,
+    spectrum = _evaluate_directional(
+        data,
         directions,
         name="Elevation variance",
         units="m^2",
+        omnidirectional=True,
+        chunk_size=chunk_size,
+        dtype=dtype,
+        output=output,
     )
     return spectrum
 
 
+def directional_spectrum_statistics(data, directions):
+    """
+    Computes direction-integrated quantities of the directional spectrum
+    from the 5 relevant NDBC parameter data, without evaluating the
+    spectrum itself. Since the spectrum is linear in the Fourier
+    coefficients of the spread function, the sums over `directions` are
+    applied to the direction basis first.
+
+    Parameters
+    ----------
+    data: xr.Dataset
+        Dataset containing the five NDBC parameter data indexed by
+        frequency, and optionally date.
+    directions: np.ndarray
+        One-dimensional array of wave directions in degrees.
+
+    Returns
+    -------
+    statistics: xr.Dataset
+        Dataset with the variables
+
+        - mean_direction: Mean wave direction per frequency [deg]
+        - directional_spread: Circular directional spread per frequency
+          [deg]
+        - direction_spectrum: Spectrum integrated over frequency with the
+          trapezoidal rule, indexed by direction [m^2/deg]
+
+        Each is also indexed by date when the data has a date dimension.
+    """
+    if not isinstance(data, xr.Dataset):
+        raise TypeError(f"data must be of type xr.Dataset. Got: {type(data)}")
+    if not isinstance(directions, np.ndarray):
+        raise TypeError(
+            f"directions must be of type np.ndarray. Got: {type(directions)}"
+        )
+
+    coefficients = _spread_coefficients(data)
+    basis = _spread_basis(directions)
+
+    # Directional moments of the spread function per frequency
+    a = np.deg2rad(directions.astype(float))
+    integrands = np.stack([np.ones_like(a), np.cos(a), np.sin(a)], axis=-1)
+    moments = coefficients @ (basis @ integrands)
+    m0, mc, ms = np.moveaxis(moments, -1, 0)
+    mean_direction = np.rad2deg(np.arctan2(ms, mc)) % 360
+    resultant = np.clip(np.hypot(mc, ms) / m0, 0, 1)
+    directional_spread = np.rad2deg(np.sqrt(2 * (1 - resultant)))
+
+    # Trapezoidal weights of the frequency integral
+    frequencies = data.frequency.values.astype(float)
+    weights = np.zeros_like(frequencies)
+    weights[1:] += np.diff(frequencies) / 2
+    weights[:-1] += np.diff(frequencies) / 2
+    spectrum = data["swden"].transpose(..., "frequency").values.astype(float)
+    direction_spectrum = (
+        np.einsum("...f,...fk->...k", spectrum * weights, coefficients) @ basis
+    )
+
+    dims = ["date"] if "date" in data.dims else []
+    direction_attrs = {
+        "units": "deg",
+        "long_name": "wave direction",
+        "standard_name": "direction",
+    }
+    coords = {
+        "frequency": data.frequency,
+        "direction": ("direction", directions, direction_attrs),
+    }
+    if dims:
+        coords["date"] = data.date
+
+    statistics = xr.Dataset(
+        {
+            "mean_direction": (
+                dims + ["frequency"],
+                mean_direction,
+                {"units": "deg", "long_name": "mean wave direction"},
+            ),
+            "directional_spread": (
+                dims + ["frequency"],
+                directional_spread,
+                {"units": "deg", "long_name": "directional spread"},
+            ),
+            "direction_spectrum": (
+                dims + ["direction"],
+                direction_spectrum,
+                {"units": "m^2/deg", "long_name": "frequency-integrated spectrum"},
+            ),
+        },
+        coords=coords,
+    )
+    return statistics
+
+
 def get_buoy_metadata(station_number: str):
     """
     Fetches and parses the metadata of a National Data Buoy Center (NDBC) station
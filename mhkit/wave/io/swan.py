@@ -1,8 +1,10 @@
-from scipy.io import loadmat
+from collections.abc import Mapping
+from scipy.io import loadmat, whosmat
 from os.path import isfile
 import pandas as pd
 import xarray as xr
 import numpy as np
+import mmap
 import re
 from mhkit.utils import convert_to_dataset, convert_nested_dict_and_pandas
 
@@ -60,7 +62,7 @@ def read_table(swan_file, to_pandas=True):
     return swan_data, metaDict
 
 
-def read_block(swan_file, to_pandas=True):
+def read_block(swan_file, to_pandas=True, lazy=False):
     """
     Reads in SWAN block output with headers and creates a dictionary
     of DataFrames or Datasets for each SWAN output variable in the output file.
@@ -72,6 +74,10 @@ def read_block(swan_file, to_pandas=True):
     to_pandas: bool (optional)
         Flag to output a dictionary of pandas objects instead of a dictionary
         of xarray objects. Default = True.
+    lazy: bool (optional)
+        For .mat files, return a read-only dictionary that reads each
+        variable from the file when it is first accessed. Text block files
+        are always read at once. Default = False.
 
     Returns
     -------
@@ -86,8 +92,15 @@ def read_block(swan_file, to_pandas=True):
         raise ValueError(f"File not found: {swan_file}")
     if not isinstance(to_pandas, bool):
         raise TypeError(f"to_pandas must be of type bool. Got: {type(to_pandas)}")
+    if not isinstance(lazy, bool):
+        raise TypeError(f"lazy must be of type bool. Got: {type(lazy)}")
 
     extension = swan_file.split(".")[1].lower()
+    if extension == "mat" and lazy:
+        dataDict = _LazyBlockMat(swan_file, to_pandas)
+        metaData = {"filetype": "mat", "variables": list(dataDict)}
+        return dataDict, metaData
+
     if extension == "mat":
         dataDict = _read_block_mat(swan_file)
         metaData = {"filetype": "mat", "variables": [var for var in dataDict.keys()]}
@@ -122,65 +135,39 @@ def _read_block_txt(swan_file):
     if not isfile(swan_file):
         raise ValueError(f"File not found: {swan_file}")
 
-    f = open(swan_file)
-    runLines = []
-    metaDict = {}
-    column_position = None
     dataDict = {}
-    for position, line in enumerate(f):
-        if line.startswith("% Run"):
-            varPosition = position
-            runLines.extend([position])
-            column_position = position + 5
-            varDict = _parse_line_metadata(line)
+    metaData = {}
+    with open(swan_file, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        # Locate the variable blocks in a single scan
+        runs = [match.start() for match in re.finditer(rb"^% Run", buffer, re.M)]
+        for start, end in zip(runs, runs[1:] + [len(buffer)]):
+            block = buffer[start:end]
+            lines = block.split(b"\n", 6)
+            varDict = _parse_line_metadata(lines[0].decode())
             varDict["unitMultiplier"] = float(varDict["Unit"].split(" ")[0])
+            variable = varDict.pop("vars")
+            n_columns = len(lines[5].strip(b"% \r\n").split())
+
+            # Drop the comment lines, split the values at their trailing
+            # dots and mark each 4 character "****" field as NaN
+            values = re.sub(rb"(?m)^%.*$", b"", block)
+            values = values.replace(b".", b" ").replace(b"****", b" nan ")
+            values = np.fromstring(values.decode("ascii"), sep=" ")
+            if values.size % (n_columns + 1):
+                raise ValueError(
+                    f"Block of {variable} does not have {n_columns} columns "
+                    f"on every row in {swan_file}"
+                )
+            values = values.reshape(-1, n_columns + 1)
+
+            dataDict[variable] = pd.DataFrame(
+                values[:, 1:] * varDict["unitMultiplier"],
+                index=values[:, 0].astype(int),
+            )
+            metaData[variable] = varDict
 
-            metaDict[varPosition] = varDict
-            variable = varDict["vars"]
-            dataDict[variable] = {}
-
-        if position == column_position and column_position != None:
-            columns = line.strip("% \n").split()
-            metaDict[varPosition]["cols"] = columns
-            N_columns = len(columns)
-            columns_position = None
-
-        if not line.startswith("%"):
-            raw_data = " ".join(re.split(" |\\.", line.strip(" \n"))).split()
-            index_number = int(raw_data[0])
-            columns_data = raw_data[1:]
-            data = []
-            possibleNaNs = ["****"]
-            NNaNsTotal = sum([line.count(nanVal) for nanVal in possibleNaNs])
-
-            if NNaNsTotal > 0:
-                for vals in columns_data:
-                    NNaNs = 0
-                    for nanVal in possibleNaNs:
-                        NNaNs += vals.count(nanVal)
-                    if NNaNs > 0:
-                        for i in range(NNaNs):
-                            data.extend([np.nan])
-                    else:
-                        data.extend([float(vals)])
-            else:
-                data.extend([float(val) for val in columns_data])
-
-            dataDict[variable][index_number] = data
-
-    metaData = pd.DataFrame(metaDict).T
-    f.close()
-
-    for var in metaData.vars.values:
-        df = pd.DataFrame(dataDict[var]).T
-        varCols = metaData[metaData.vars == var].cols.values.tolist()[0]
-        colsDict = dict(zip(df.columns.values.tolist(), varCols))
-        df.rename(columns=colsDict)
-        unitMultiplier = metaData[metaData.vars == var].unitMultiplier.values[0]
-        dataDict[var] = df * unitMultiplier
-
-    metaData.pop("cols")
-    metaData = metaData.set_index("vars").T.to_dict()
     return dataDict, metaData
 
 
@@ -213,6 +200,102 @@ def _read_block_mat(swan_file):
     return dataDict
 
 
+class _LazyBlockMat(Mapping):
+    """
+    Read-only dictionary of the variables of a SWAN .mat block file, each
+    read from the file when it is first accessed.
+
+    Parameters
+    ----------
+    swan_file: str
+        filename to import
+    to_pandas: bool (optional)
+        Flag to return pandas DataFrames instead of xarray Datasets.
+        Default = True.
+    """
+
+    def __init__(self, swan_file, to_pandas=True):
+        self.swan_file = swan_file
+        self.to_pandas = to_pandas
+        self._names = [name for name, _, _ in whosmat(swan_file)]
+        self._loaded = {}
+
+    def __getitem__(self, key):
+        if key not in self._names:
+            raise KeyError(key)
+        if key not in self._loaded:
+            values = loadmat(
+                self.swan_file,
+                variable_names=[key],
+                struct_as_record=False,
+                squeeze_me=True,
+            )[key]
+            data = pd.DataFrame(values)
+            self._loaded[key] = data if self.to_pandas else convert_to_dataset(data)
+        return self._loaded[key]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+def read_block_dataset(swan_file):
+    """
+    Reads in SWAN block output as a single Dataset with a variable for
+    each SWAN output variable, indexed by the x and y grid indices.
+
+    Parameters
+    ----------
+    swan_file: str
+        swan block file to import (.mat, or text written with headers)
+
+    Returns
+    -------
+    data: xarray Dataset
+        Dataset of swan output variables with dimensions (x, y)
+    metaDict: Dictionary
+        Dictionary of metaData dependent on file type
+    """
+    dataDict, metaData = read_block(swan_file)
+    frames = list(dataDict.values())
+    if not all(_same_grid(frame, frames[0]) for frame in frames):
+        raise ValueError(f"The variables of {swan_file} are not on the same grid")
+
+    variables = {}
+    for name, frame in dataDict.items():
+        attrs = {}
+        if name in metaData:
+            attrs["units"] = " ".join(metaData[name]["Unit"].split(" ")[1:])
+        variables[name] = (("x", "y"), frame.values.T, attrs)
+    data = xr.Dataset(
+        variables,
+        coords={"x": frames[0].columns.values, "y": frames[0].index.values},
+    )
+
+    return data.sortby(["x", "y"]), metaData
+
+
+def _same_grid(data, other):
+    """
+    Returns whether two block DataFrames have the same x (columns) and
+    y (index) indices.
+    """
+    return data.index.equals(other.index) and data.columns.equals(other.columns)
+
+
+def _table_order(data):
+    """
+    Returns the x and y columns of the SWAN table format of a block
+    DataFrame, in the order of `data.unstack()`, along with the positions
+    that sort them by x and then y.
+    """
+    x = np.repeat(data.columns.values, len(data.index))
+    y = np.tile(data.index.values, len(data.columns))
+    return x, y, np.lexsort((y, x))
+
+
 def _parse_line_metadata(line):
     """
     Parses the variable metadata into a dictionary
@@ -308,9 +391,16 @@ def dictionary_of_block_to_table(dictionary_of_DataFrames, names=None, to_pandas
 
     var0 = variables[0]
     swanTables = block_to_table(dictionary_of_DataFrames[var0], name=var0)
+    data0 = dictionary_of_DataFrames[var0]
+    order = swanTables.index.values
     for var in variables[1:]:
-        tmp_dat = block_to_table(dictionary_of_DataFrames[var], name=var)
-        swanTables[var] = tmp_dat[var]
+        data = dictionary_of_DataFrames[var]
+        if _same_grid(data, data0):
+            # Same grid, so the table rows are in the same order
+            swanTables[var] = data.values.T.ravel()[order]
+        else:
+            tmp_dat = block_to_table(data, name=var)
+            swanTables[var] = tmp_dat[var]
 
     if not to_pandas:
         swanTables = convert_to_dataset(swanTables)
@@ -347,9 +437,11 @@ def block_to_table(data, name="values", to_pandas=True):
     if not isinstance(to_pandas, bool):
         raise TypeError(f"to_pandas must be of type bool. Got: {type(to_pandas)}")
 
-    table = data.unstack().reset_index(name=name)
-    table = table.rename(columns={"level_0": "x", "level_1": "y"})
-    table.sort_values(["x", "y"], ascending=[True, True], inplace=True)
+    x, y, order = _table_order(data)
+    table = pd.DataFrame(
+        {"x": x[order], "y": y[order], name: data.values.T.ravel()[order]},
+        index=order,
+    )
 
     if not to_pandas:
         table = convert_to_dataset(table)
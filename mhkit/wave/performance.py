@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import xarray as xr
 import types
+import copy
 from scipy.stats import binned_statistic_2d as _binned_statistic_2d
 from mhkit import wave
 import matplotlib.pylab as plt
@@ -130,6 +131,429 @@ def _performance_matrix(X, Y, Z, statistic, x_centers, y_centers):
     return M
 
 
+_PERFORMANCE_STATISTICS = [
+    "mean",
+    "std",
+    "median",
+    "count",
+    "sum",
+    "min",
+    "max",
+    "frequency",
+]
+
+
+class PerformanceMatrices:
+    """
+    Accumulates performance matrices of one or more response variables
+    (e.g. capture length L, wave energy flux J, power P) binned by Hm0 and
+    Te, so that matrices can be updated as new sea states arrive.
+
+    Sea states are digitized once per update and sorted by bin, after which
+    every statistic of every variable is computed with segment-wise
+    reductions. Count, sum, mean, std, min, max and frequency are updated
+    from running bin totals; the median requires the binned values to be
+    kept, and is only available if requested. For long records (e.g.
+    multi-decade hindcasts), request only the statistics that are needed,
+    accumulate chunks (e.g. years) with `update`, combine accumulators from
+    worker processes with `merge`, and evaluate many power matrices at once
+    with `mean_annual_energy_production`.
+
+    Parameters
+    ------------
+    Hm0_bins: numpy array
+        Bin centers for Hm0 [m]
+    Te_bins: numpy array
+        Bin centers for Te [s]
+    statistics: list of strings (optional)
+        Statistics to compute, options include: 'mean', 'std', 'median',
+        'count', 'sum', 'min', 'max', and 'frequency'. Note that 'std' uses a
+        degree of freedom of 1 in accordance with IEC/TS 62600-100.
+        Default = all.
+    """
+
+    def __init__(self, Hm0_bins, Te_bins, statistics=None):
+        if not isinstance(Hm0_bins, np.ndarray):
+            raise TypeError(
+                f"Hm0_bins must be of type np.ndarray. Got: {type(Hm0_bins)}"
+            )
+        if not isinstance(Te_bins, np.ndarray):
+            raise TypeError(f"Te_bins must be of type np.ndarray. Got: {type(Te_bins)}")
+        if statistics is None:
+            statistics = _PERFORMANCE_STATISTICS
+        if isinstance(statistics, str):
+            statistics = [statistics]
+        for stat in statistics:
+            if stat not in _PERFORMANCE_STATISTICS:
+                raise ValueError(
+                    f"statistics must be in {_PERFORMANCE_STATISTICS}. Got: {stat}"
+                )
+
+        self.Hm0_bins = Hm0_bins
+        self.Te_bins = Te_bins
+        self.statistics = list(statistics)
+        # Bin edges between centers, as in `capture_length_matrix`
+        self._Hm0_edges = (Hm0_bins[:-1] + Hm0_bins[1:]) / 2
+        self._Te_edges = (Te_bins[:-1] + Te_bins[1:]) / 2
+        self._n_bins = len(Hm0_bins) * len(Te_bins)
+
+        self.variables = None
+        self.n_samples = 0
+        self._count = np.zeros(self._n_bins, dtype=np.int64)
+        self._sum = None
+        self._m2 = None
+        self._min = None
+        self._max = None
+        self._binned = []
+
+    def _digitize(self, Hm0, Te):
+        # Flat bin number of each sea state, -1 for sea states outside the bins
+        i = np.searchsorted(self._Hm0_edges, Hm0, side="right")
+        j = np.searchsorted(self._Te_edges, Te, side="right")
+        # NaNs are sorted after the last edge
+        valid = ~(np.isnan(Hm0) | np.isnan(Te))
+        return np.where(valid, i * len(self.Te_bins) + j, -1)
+
+    def _check_variables(self, names):
+        # Allocate the running bin totals on first use
+        if self.variables is None:
+            self.variables = list(names)
+            n_vars = len(names)
+            self._sum = np.zeros((n_vars, self._n_bins))
+            self._m2 = np.zeros((n_vars, self._n_bins))
+            self._min = np.full((n_vars, self._n_bins), np.nan)
+            self._max = np.full((n_vars, self._n_bins), np.nan)
+        elif list(names) != self.variables:
+            raise ValueError(
+                f"data must contain the variables {self.variables}. Got: {names}"
+            )
+
+    def _combine(self, occupied, count, total, m2, minimum, maximum):
+        # Merge bin totals of new sea states with the previous ones (Chan et al.)
+        n_a = self._count[occupied]
+        n = n_a + count
+        mean_a = self._sum[:, occupied] / np.where(n_a > 0, n_a, 1)
+        delta = total / count - mean_a
+        self._m2[:, occupied] += m2 + delta**2 * (n_a * count / n)
+        self._sum[:, occupied] += total
+        self._count[occupied] = n
+
+        new = n_a == 0
+        self._min[:, occupied] = np.where(
+            new, minimum, np.fmin(self._min[:, occupied], minimum)
+        )
+        self._max[:, occupied] = np.where(
+            new, maximum, np.maximum(self._max[:, occupied], maximum)
+        )
+
+    def update(self, Hm0, Te, data=None):
+        """
+        Adds sea states to the performance matrices.
+
+        Parameters
+        ------------
+        Hm0: numpy array, pandas Series, or xarray DataArray
+            Significant wave height from spectra [m]
+        Te: numpy array, pandas Series, or xarray DataArray
+            Energy period from spectra [s]
+        data: dict or xarray Dataset (optional)
+            Response variables (e.g. {"L": L, "J": J}), each of the same
+            length as Hm0. If None, only the occurrence of sea states is
+            accumulated.
+
+        Returns
+        ---------
+        self: PerformanceMatrices
+        """
+        if data is None:
+            data = {}
+        if not isinstance(data, (dict, xr.Dataset)):
+            raise TypeError(
+                f"data must be of type dict or xr.Dataset. Got: {type(data)}"
+            )
+        Hm0 = convert_to_dataarray(Hm0).values.ravel()
+        Te = convert_to_dataarray(Te).values.ravel()
+        names = list(data.keys()) if isinstance(data, dict) else list(data.data_vars)
+        columns = [convert_to_dataarray(data[name]).values.ravel() for name in names]
+        if any(len(x) != len(Hm0) for x in [Te] + columns):
+            raise ValueError("Hm0, Te, and data must be of the same length")
+        self._check_variables(names)
+        values = np.empty((len(names), len(Hm0)))
+        for k, x in enumerate(columns):
+            values[k] = x
+        self.n_samples += len(Hm0)
+
+        bins = self._digitize(Hm0, Te)
+        order = np.argsort(bins, kind="stable")
+        bins = bins[order]
+        values = values[:, order]
+        # Drop sea states outside the bins
+        first = np.searchsorted(bins, 0)
+        bins = bins[first:]
+        values = values[:, first:]
+        if len(bins) == 0:
+            return self
+
+        # Segments of consecutive sea states in the same bin
+        starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+        occupied = bins[starts]
+        count = np.diff(np.r_[starts, len(bins)])
+
+        total = np.add.reduceat(values, starts, axis=1)
+        deviation = values - np.repeat(total / count, count, axis=1)
+        m2 = np.add.reduceat(deviation**2, starts, axis=1)
+
+        # NaNs are ignored by min but not by max, as in `binned_statistic_2d`
+        segment_min = np.fmin.reduceat(values, starts, axis=1)
+        segment_max = np.maximum.reduceat(values, starts, axis=1)
+        self._combine(occupied, count, total, m2, segment_min, segment_max)
+
+        if "median" in self.statistics:
+            self._binned.append((bins, values))
+
+        return self
+
+    def _median(self):
+        # Median of each bin, from all binned values sorted by bin and value
+        n_vars = len(self.variables)
+        median = np.full((n_vars, self._n_bins), np.nan)
+        if not self._binned:
+            return median
+        bins = np.concatenate([b for b, _ in self._binned])
+        values = np.concatenate([v for _, v in self._binned], axis=1)
+        count = np.bincount(bins, minlength=self._n_bins)
+        occupied = np.flatnonzero(count)
+        count = count[occupied]
+        starts = np.cumsum(count) - count
+        lower = starts + (count - 1) // 2
+        upper = starts + count // 2
+        for k in range(n_vars):
+            # NaNs are sorted last in each bin, as in `binned_statistic_2d`
+            ordered = values[k, np.lexsort((values[k], bins))]
+            median[k, occupied] = (ordered[lower] + ordered[upper]) / 2
+        return median
+
+    def to_dataset(self):
+        """
+        Returns the performance matrices.
+
+        Returns
+        ---------
+        matrices: xarray Dataset
+            Performance matrix of each response variable and statistic,
+            indexed by statistic, Hm0_bins (x_centers) and Te_bins (y_centers)
+        """
+        if self.variables is None:
+            raise ValueError("No sea states have been added")
+
+        count = self._count.astype(float)
+        occupied = count > 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            stats = {
+                "mean": np.where(occupied, self._sum / count, np.nan),
+                "std": np.where(
+                    count > 1,
+                    np.sqrt(self._m2 / (count - 1)),
+                    np.where(occupied, 0.0, np.nan),
+                ),
+                "count": np.broadcast_to(count, self._sum.shape),
+                "sum": self._sum,
+                "min": self._min,
+                "max": self._max,
+                "frequency": np.broadcast_to(
+                    count / max(self.n_samples, 1), self._sum.shape
+                ),
+            }
+        if "median" in self.statistics:
+            stats["median"] = self._median()
+
+        shape = (len(self.statistics), len(self.Hm0_bins), len(self.Te_bins))
+        matrices = xr.Dataset(
+            {
+                name: (
+                    ["statistic", "x_centers", "y_centers"],
+                    np.stack([stats[stat][k] for stat in self.statistics]).reshape(
+                        shape
+                    ),
+                )
+                for k, name in enumerate(self.variables)
+            },
+            coords={
+                "statistic": self.statistics,
+                "x_centers": self.Hm0_bins,
+                "y_centers": self.Te_bins,
+            },
+        )
+
+        return matrices
+
+    def merge(self, other):
+        """
+        Adds the sea states accumulated by another instance with the same
+        bins and variables, e.g. from another chunk of a record processed in
+        a separate worker process. If these matrices include the 'median'
+        statistic, so must `other`.
+
+        Parameters
+        ------------
+        other: PerformanceMatrices
+            Accumulated sea states to add
+
+        Returns
+        ---------
+        self: PerformanceMatrices
+        """
+        if not isinstance(other, PerformanceMatrices):
+            raise TypeError(
+                f"other must be of type PerformanceMatrices. Got: {type(other)}"
+            )
+        if not (
+            np.array_equal(self.Hm0_bins, other.Hm0_bins)
+            and np.array_equal(self.Te_bins, other.Te_bins)
+        ):
+            raise ValueError("Hm0_bins and Te_bins must be the same")
+        if other.variables is None:
+            return self
+
+        self._check_variables(other.variables)
+        if "median" in self.statistics and "median" not in other.statistics:
+            raise ValueError(
+                "other must include the 'median' statistic to merge its "
+                + "sea states into matrices that include it"
+            )
+        occupied = np.flatnonzero(other._count)
+        if len(occupied) > 0:
+            self._combine(
+                occupied,
+                other._count[occupied],
+                other._sum[:, occupied],
+                other._m2[:, occupied],
+                other._min[:, occupied],
+                other._max[:, occupied],
+            )
+        self.n_samples += other.n_samples
+        if "median" in self.statistics:
+            self._binned.extend(other._binned)
+
+        return self
+
+    def __add__(self, other):
+        return copy.deepcopy(self).merge(other)
+
+    def mean_annual_energy_production(
+        self, power_matrices=None, capture_length_matrices=None, flux="J"
+    ):
+        """
+        Calculates mean annual energy production (MAEP) of one or more power
+        matrices, or capture length matrices, from the accumulated occurrence
+        of sea states. Many candidate matrices are evaluated at once.
+
+        Equivalent to `mean_annual_energy_production_matrix` with the
+        'frequency' matrix of the accumulated sea states (and their 'mean'
+        wave energy flux matrix, for capture length matrices).
+
+        Parameters
+        ------------
+        power_matrices: numpy array, pandas DataFrame, or xarray DataArray
+            Power matrix [W] or stack of power matrices, with Hm0_bins and
+            Te_bins as the last two dimensions (or 'x_centers' and
+            'y_centers' dimensions of a DataArray)
+        capture_length_matrices: numpy array, pandas DataFrame, or xarray DataArray
+            Capture length matrix [m] or stack of capture length matrices,
+            used instead of power_matrices. Requires the wave energy flux to
+            have been accumulated.
+        flux: string (optional)
+            Name of the accumulated wave energy flux variable [W/m].
+            Default = "J".
+
+        Returns
+        ---------
+        maep: float, numpy array, or xarray DataArray
+            Mean annual energy production of each matrix
+        """
+        if (power_matrices is None) == (capture_length_matrices is None):
+            raise ValueError(
+                "Exactly one of power_matrices and capture_length_matrices "
+                + "must be provided"
+            )
+        if self.n_samples == 0:
+            raise ValueError("No sea states have been added")
+
+        T = 8766  # Average length of a year (h)
+        if power_matrices is not None:
+            matrices = power_matrices
+            weights = self._count / self.n_samples
+        else:
+            if self.variables is None or flux not in self.variables:
+                raise ValueError(f"Wave energy flux '{flux}' has not been accumulated")
+            matrices = capture_length_matrices
+            weights = self._sum[self.variables.index(flux)] / self.n_samples
+        weights = np.nan_to_num(weights).reshape(len(self.Hm0_bins), len(self.Te_bins))
+
+        dims = None
+        if isinstance(matrices, xr.DataArray):
+            matrices = matrices.transpose(..., "x_centers", "y_centers")
+            dims = matrices.dims[:-2]
+            coords = {dim: matrices[dim] for dim in dims if dim in matrices.coords}
+        values = np.asarray(matrices, dtype=float)
+        if values.shape[-2:] != weights.shape:
+            raise ValueError(
+                f"Matrices must have shape (..., {len(self.Hm0_bins)}, "
+                + f"{len(self.Te_bins)}). Got: {values.shape}"
+            )
+
+        # NaN bins do not contribute, as in `mean_annual_energy_production_matrix`
+        maep = T * np.tensordot(np.nan_to_num(values), weights, axes=2)
+
+        if dims is not None:
+            maep = xr.DataArray(maep, dims=dims, coords=coords)
+        elif maep.ndim == 0:
+            maep = maep.item()
+
+        return maep
+
+
+def performance_matrices(Hm0, Te, data, Hm0_bins, Te_bins, statistics=None):
+    """
+    Generates performance matrices for several statistics and response
+    variables (e.g. capture length and wave energy flux) in a single pass.
+
+    Equivalent to calling `capture_length_matrix` or
+    `wave_energy_flux_matrix` for every statistic and variable, but sea
+    states are only binned once. Use `PerformanceMatrices` to update the
+    matrices as new sea states arrive.
+
+    Parameters
+    ------------
+    Hm0: numpy array, pandas Series, or xarray DataArray
+        Significant wave height from spectra [m]
+    Te: numpy array, pandas Series, or xarray DataArray
+        Energy period from spectra [s]
+    data: dict or xarray Dataset
+        Response variables (e.g. {"L": L, "J": J}), each of the same length
+        as Hm0
+    Hm0_bins: numpy array
+        Bin centers for Hm0 [m]
+    Te_bins: numpy array
+        Bin centers for Te [s]
+    statistics: list of strings (optional)
+        Statistics for each bin, options include: 'mean', 'std', 'median',
+        'count', 'sum', 'min', 'max', and 'frequency'. Note that 'std' uses
+        a degree of freedom of 1 in accordance with IEC/TS 62600-100.
+        Default = all.
+
+    Returns
+    ---------
+    matrices: xarray Dataset
+        Performance matrix of each response variable and statistic, indexed
+        by statistic, Hm0_bins (x_centers) and Te_bins (y_centers)
+    """
+    matrices = PerformanceMatrices(Hm0_bins, Te_bins, statistics)
+    matrices.update(Hm0, Te, data)
+
+    return matrices.to_dataset()
+
+
 def capture_length_matrix(Hm0, Te, L, statistic, Hm0_bins, Te_bins, to_pandas=True):
     """
     Generates a capture length matrix for a given statistic
@@ -427,37 +851,14 @@ def power_performance_workflow(
     Te_bins = np.arange(0, Te.values.max() + 1, 1)
 
     # Create capture length matrices for each statistic based on IEC/TS 62600-100
-    # Median, sum, frequency additionally provided
-    LM = xr.Dataset()
-    LM["mean"] = wave.performance.capture_length_matrix(
-        Hm0, Te, L, "mean", Hm0_bins, Te_bins, to_pandas=False
-    )
-    LM["std"] = wave.performance.capture_length_matrix(
-        Hm0, Te, L, "std", Hm0_bins, Te_bins, to_pandas=False
-    )
-    LM["median"] = wave.performance.capture_length_matrix(
-        Hm0, Te, L, "median", Hm0_bins, Te_bins, to_pandas=False
-    )
-    LM["count"] = wave.performance.capture_length_matrix(
-        Hm0, Te, L, "count", Hm0_bins, Te_bins, to_pandas=False
-    )
-    LM["sum"] = wave.performance.capture_length_matrix(
-        Hm0, Te, L, "sum", Hm0_bins, Te_bins, to_pandas=False
-    )
-    LM["min"] = wave.performance.capture_length_matrix(
-        Hm0, Te, L, "min", Hm0_bins, Te_bins, to_pandas=False
-    )
-    LM["max"] = wave.performance.capture_length_matrix(
-        Hm0, Te, L, "max", Hm0_bins, Te_bins, to_pandas=False
-    )
-    LM["freq"] = wave.performance.capture_length_matrix(
-        Hm0, Te, L, "frequency", Hm0_bins, Te_bins, to_pandas=False
+    # Median, sum, frequency additionally provided, and wave energy flux matrices
+    matrices = wave.performance.performance_matrices(
+        Hm0, Te, {"L": L, "J": J}, Hm0_bins, Te_bins
     )
+    LM = matrices["L"].to_dataset("statistic").rename({"frequency": "freq"})
 
-    # Create wave energy flux matrix using mean
-    JM = wave.performance.wave_energy_flux_matrix(
-        Hm0, Te, J, "mean", Hm0_bins, Te_bins, to_pandas=False
-    )
+    # Wave energy flux matrix using mean
+    JM = matrices["J"].sel(statistic="mean", drop=True)
 
     # Calculate maep from matrix
     maep_matrix = wave.performance.mean_annual_energy_production_matrix(